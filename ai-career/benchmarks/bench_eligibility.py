@@ -0,0 +1,191 @@
+"""
+Microbenchmark: legacy triage clearance/citizenship checks vs the eligibility rule scanner.
+
+Usage:
+  python ai-career/benchmarks/bench_eligibility.py [n_jobs]
+
+Builds n synthetic postings (default 20k, fixtures.py generator) and mixes in the edge cases
+the rules care about: every clearance/citizenship phrase, phrases broken over newlines or
+double spaces, short sentences, the "clearence" misspelling, overlapping phrases. Also adds
+the real descriptions from data/archive when there are any. Checks that both versions give
+the same clearance status/evidence and citizenship flag for every posting, and prints timings.
+"""
+import os
+import random
+import re
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)  # ai-career/
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import archive_store  # noqa: E402
+import eligibility  # noqa: E402
+from fixtures import make_posting  # noqa: E402
+
+# ---- copy of triage_jobs before the rule scanner ----
+
+LEGACY_NEG_CITIZEN = [
+    r"\bcitizenship\s+not\s+required\b",
+    r"\bnot\s+required\s+to\s+be\s+(a\s+)?(u\.s\.\s+)?citizen\b",
+]
+LEGACY_REQ_CITIZEN = [
+    r"\b(u\.s\.\s+)?citizen(s)?\s+only\b",
+    r"\bmust\s+be\s+(a\s+)?(u\.s\.\s+)?citizen\b",
+    r"\bcitizenship\s+(is\s+)?required\b",
+    r"\brequires?\s+(u\.s\.\s+)?citizenship\b",
+]
+
+
+def legacy_find_contexts(text, term, window=90):
+    if not text:
+        return []
+    t = text.lower()
+    term = term.lower()
+    ctx = []
+    for m in re.finditer(re.escape(term), t):
+        start = max(0, m.start() - window)
+        end = min(len(t), m.end() + window)
+        ctx.append(t[start:end])
+    return ctx
+
+
+def legacy_term_is_hard_required(contexts, required_patterns, negation_patterns):
+    for c in contexts:
+        if any(re.search(p, c) for p in negation_patterns):
+            continue
+        if any(re.search(p, c) for p in required_patterns):
+            return True
+    return False
+
+
+def legacy_split_sentences(text):
+    if not text:
+        return []
+    t = re.sub(r"\s+", " ", text.strip())
+    parts = re.split(r"(?<=[.!?])\s+", t)
+    return [p.strip() for p in parts if len(p.strip()) >= 20]
+
+
+def legacy_pick_evidence_sentences(text, phrases, max_sentences=2):
+    sents = legacy_split_sentences(text)
+    hits = []
+    phrases_low = [p.lower() for p in (phrases or []) if p]
+    for s in sents:
+        sl = s.lower()
+        if any(p in sl for p in phrases_low):
+            hits.append(eligibility._highlight_phrases(s, phrases))
+        if len(hits) >= max_sentences:
+            break
+    if not hits:
+        snippet = (text or "").strip().replace("\n", " ")
+        snippet = snippet[:220] + ("..." if len(snippet) > 220 else "")
+        if snippet:
+            hits = [eligibility._highlight_phrases(snippet, phrases)]
+    return hits
+
+
+def legacy_classify_clearance(text):
+    if not text:
+        return {"status": "NONE", "evidence": []}
+    lower = text.lower()
+    neg, pos, weak = eligibility.CLEARANCE_NEG, eligibility.CLEARANCE_POS, eligibility.CLEARANCE_WEAK
+    if "clearence" in lower and "clearance" not in lower:
+        lower = lower.replace("clearence", "clearance")
+        text = re.sub(r"clearence", "clearance", text, flags=re.IGNORECASE)
+    if any(p in lower for p in neg):
+        return {"status": "CLEAR", "evidence": legacy_pick_evidence_sentences(text, neg)}
+    if any(p in lower for p in pos):
+        return {"status": "BLOCK", "evidence": legacy_pick_evidence_sentences(text, pos)}
+    if any(p in lower for p in weak):
+        return {"status": "REVIEW", "evidence": legacy_pick_evidence_sentences(text, weak)}
+    return {"status": "NONE", "evidence": []}
+
+
+def legacy(text):
+    clr = legacy_classify_clearance(text)
+    ctx = legacy_find_contexts(text.lower(), "citizen", window=90)
+    if not ctx:
+        citizen = "NONE"
+    elif legacy_term_is_hard_required(ctx, LEGACY_REQ_CITIZEN, LEGACY_NEG_CITIZEN):
+        citizen = "REQUIRED"
+    else:
+        citizen = "MENTIONED"
+    return clr, citizen
+
+
+def current(text):
+    a = eligibility.assess(text)
+    return a["clearance"], a["citizenship"]
+
+
+# ---- corpus ----
+
+EDGE_SENTENCES = [
+    "No clearance\nrequired for this role.",
+    "Clearance  is not required.",
+    "Top Secret clearance preferred.",
+    "TS/SCI.",
+    "Must have a\nsecurity clearance.",
+    "This role requires an active Security Clearance and U.S. citizenship is required.",
+    "Applicants must be a U.S. citizen.",
+    "U.S. citizens only. Clearance not required!",
+    "You are not required to be a citizen to apply.",
+    "Citizenship not required, but a clearance is.",
+    "Ability to obtain a security clearence is a plus.",
+    "Eligible for security clearance? Yes.",
+    "Dual citizenship welcome.",
+    "The team works on secret clearance tooling.",
+]
+
+
+def corpus(n: int, seed: int = 11):
+    rnd = random.Random(seed)
+    texts = []
+    for i in range(n):
+        title, loc, _, _, plain = make_posting(rnd, i)
+        if rnd.random() < 0.3:
+            lines = plain.split("\n")
+            for _ in range(rnd.randint(1, 3)):
+                lines.insert(rnd.randint(0, len(lines)), rnd.choice(EDGE_SENTENCES))
+            plain = "\n".join(lines)
+        texts.append(f"{title}\n{loc}\n{plain}")
+    try:
+        for date_str in archive_store.list_snapshot_dates():
+            for j in archive_store.load_snapshot(date_str).get("jobs") or []:
+                content = j.get("content_plain") or j.get("content_text") or ""
+                texts.append(f"{j.get('title') or ''}\n{j.get('location') or ''}\n{content}")
+    except FileNotFoundError:
+        pass
+    return texts
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    texts = corpus(n)
+    print(f"{len(texts)} postings")
+
+    t0 = time.perf_counter()
+    old = [legacy(t) for t in texts]
+    t_old = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    new = [current(t) for t in texts]
+    t_new = time.perf_counter() - t0
+
+    bad = [i for i, (a, b) in enumerate(zip(old, new)) if a != b]
+    statuses = {}
+    for clr, citizen in new:
+        statuses[clr["status"]] = statuses.get(clr["status"], 0) + 1
+        statuses["citizen_" + citizen] = statuses.get("citizen_" + citizen, 0) + 1
+    print(f"  {statuses}")
+    print(f"  legacy  {t_old:7.2f}s  {len(texts) / t_old:>9.0f} postings/s")
+    print(f"  scanner {t_new:7.2f}s  {len(texts) / t_new:>9.0f} postings/s  (x{t_old / t_new:.1f})")
+    if bad:
+        i = bad[0]
+        raise SystemExit(f"{len(bad)} mismatch(es); first:\n{texts[i][:400]!r}\nlegacy:  {old[i]}\nscanner: {new[i]}")
+    print("  identical results")
+
+
+if __name__ == "__main__":
+    main()
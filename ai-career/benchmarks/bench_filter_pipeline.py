@@ -0,0 +1,73 @@
+"""
+Microbenchmark: apply_filters stage order (fixed legacy order vs the targets.json pipeline vs
+adaptive ordering).
+
+Usage:
+  python ai-career/benchmarks/bench_filter_pipeline.py [n_jobs]
+
+Runs the synthetic corpus of bench_keyword_matcher.py (default 20k jobs) through the filters
+from config/targets.json three ways: DEFAULT_PIPELINE (exclude, internship, degree, major,
+domain, location), the configured pipeline, and the configured pipeline with
+pipeline_order="adaptive"; once as configured and once with a locations_any list. Checks that
+every order keeps the same jobs and prints timings, stage order and how many jobs reached a
+description (haystack) scan.
+"""
+import json
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)  # ai-career/
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+sys.path.insert(0, HERE)
+
+import fetch_jobs  # noqa: E402
+from bench_keyword_matcher import make_corpus  # noqa: E402
+from filter_pipeline import DEFAULT_PIPELINE, FilterPipeline  # noqa: E402
+
+LOCATIONS = ["remote", "new york"]
+
+
+def run(jobs, filters):
+    pipeline = FilterPipeline(filters)
+    t0 = time.perf_counter()
+    kept, _ = fetch_jobs.apply_filters(jobs, filters, pipeline=pipeline)
+    dt = time.perf_counter() - t0
+    stats = pipeline.stats()
+    # Every job that reached a haystack stage built the haystack once (sampled jobs all did)
+    hay = max([s["evaluated"] for s in stats["stages"] if s["field"] == "haystack"] + [0])
+    return [j["id"] for j in kept], dt, stats["order"], hay
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with open(fetch_jobs.CONFIG_PATH, "r", encoding="utf-8") as f:
+        filters = json.load(f).get("filters") or {}
+    jobs = make_corpus(n)
+
+    ok = True
+    for locs in (filters.get("locations_any") or [], LOCATIONS):
+        base = dict(filters, locations_any=locs)
+        variants = [
+            ("legacy order", dict(base, pipeline=DEFAULT_PIPELINE, pipeline_order="config")),
+            ("configured", dict(base, pipeline_order="config")),
+            ("adaptive", dict(base, pipeline_order="adaptive")),
+        ]
+        print(f"jobs: {n}  locations_any: {locs}")
+        ref = None
+        t_ref = None
+        for label, f in variants:
+            kept, dt, order, hay = run(jobs, f)
+            if ref is None:
+                ref, t_ref = kept, dt
+            same = kept == ref
+            ok = ok and same
+            print(f"  {label:13s} {dt:6.3f}s  (x{t_ref / dt:.1f})  kept {len(kept)}  haystack scans {hay:>6}  "
+                  f"identical: {same}  order: {' > '.join(order)}")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Microbenchmark: legacy html_to_text (html.unescape + two regex passes) vs the current one.
+
+Usage:
+  python ai-career/benchmarks/bench_html_to_text.py [repeat]
+
+Runs on the real Greenhouse descriptions found in data/archive (unique by job id); falls
+back to a synthetic corpus when the archive has none. Checks that both versions produce the
+same words (the legacy version left inner entities such as &nbsp; undecoded, so its output
+is unescaped before comparing) and prints per-pass timings.
+"""
+import html
+import os
+import random
+import re
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)  # ai-career/
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import archive_store  # noqa: E402
+import fetch_jobs  # noqa: E402
+
+
+def legacy_html_to_text(s: str) -> str:
+    # Copy of fetch_jobs.html_to_text before the block-aware converter
+    if not s:
+        return ""
+    s = html.unescape(s)
+    s = re.sub(r"<[^>]+>", " ", s)
+    s = re.sub(r"\s+", " ", s).strip()
+    return s
+
+
+def archive_corpus():
+    bodies = {}
+    try:
+        dates = archive_store.list_snapshot_dates()
+    except FileNotFoundError:
+        return []
+    for date_str in dates:
+        for j in archive_store.load_snapshot(date_str).get("jobs") or []:
+            if j.get("source") == "greenhouse" and j.get("content_text"):
+                bodies[j.get("id")] = j["content_text"]
+    return list(bodies.values())
+
+
+def synthetic_corpus(n: int = 50, seed: int = 7):
+    rnd = random.Random(seed)
+    words = "build ship models data infra python intern&nbsp;program team&rsquo;s summer".split()
+    bodies = []
+    for _ in range(n):
+        parts = ["<h2>About</h2>"]
+        for _ in range(rnd.randint(3, 8)):
+            parts.append("<p>" + " ".join(rnd.choice(words) for _ in range(40)) + "</p>")
+            parts.append("<ul>" + "".join(
+                f"<li><strong>{rnd.choice(words)}</strong> {rnd.choice(words)}</li>" for _ in range(5)
+            ) + "</ul>")
+        bodies.append(html.escape("".join(parts)))
+    return bodies
+
+
+def per_pass(fn, bodies, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for b in bodies:
+            fn(b)
+    return (time.perf_counter() - t0) / repeat
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    bodies = archive_corpus()
+    source = "data/archive"
+    if not bodies:
+        bodies = synthetic_corpus()
+        source = "synthetic"
+
+    same = all(
+        html.unescape(legacy_html_to_text(b)).split() == fetch_jobs.html_to_text(b).split()
+        for b in bodies
+    )
+    lines = sum(fetch_jobs.html_to_text(b).count("\n") + 1 for b in bodies)
+    size = sum(len(b) for b in bodies)
+
+    t_old = per_pass(legacy_html_to_text, bodies, repeat)
+    t_new = per_pass(fetch_jobs.html_to_text, bodies, repeat)
+
+    print(f"corpus: {source}  bodies: {len(bodies)}  avg size: {size // len(bodies)} chars  same words: {same}")
+    print(f"blocks (lines) in new output: {lines} (legacy: 1 line per body)")
+    print(f"legacy html_to_text: {t_old * 1000:.2f} ms/pass")
+    print(f"html_to_text:        {t_new * 1000:.2f} ms/pass")
+    print(f"speedup:             {t_old / t_new:.1f}x")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
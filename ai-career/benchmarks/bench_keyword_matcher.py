@@ -0,0 +1,125 @@
+"""
+Microbenchmark: legacy per-keyword contains_any vs KeywordMatcher in apply_filters.
+
+Usage:
+  python ai-career/benchmarks/bench_keyword_matcher.py [n_jobs]
+
+Builds a synthetic corpus (default 10k jobs), runs apply_filters with the filters from
+config/targets.json using both matchers, checks the results are identical and prints timings.
+"""
+import json
+import os
+import random
+import re
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)  # ai-career/
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import fetch_jobs  # noqa: E402
+
+WORDS = (
+    "we are building reliable distributed systems for machine learning data platform team "
+    "you will work with python sql cloud infrastructure research engineers internal tools "
+    "co-opetition partners bachelor degree computer science students summer program "
+    "benefits compensation location hybrid remote onsite ai llm "
+    "internship intern co-op undergraduate software engineering analytics product design"
+).split()
+
+TITLES = [
+    "Software Engineer Intern", "Senior Software Engineer", "Machine Learning Intern",
+    "Data Analyst", "Research Intern, AI", "Staff Engineer", "Product Designer",
+    "Internal Tools Engineer", "Co-op, Cloud Infrastructure", "Account Executive",
+]
+
+
+def legacy_token_regex(token: str):
+    tok = token.strip()
+    return re.compile(r"(?<![A-Za-z0-9])" + re.escape(tok) + r"(?![A-Za-z0-9])", flags=re.IGNORECASE)
+
+
+def legacy_contains_any(text: str, keywords) -> bool:
+    # Copy of fetch_jobs.contains_any before KeywordMatcher
+    if not keywords:
+        return True
+    t = text or ""
+    for k in keywords:
+        if not (isinstance(k, str) and k.strip()):
+            continue
+        kk = k.strip()
+        if " " in kk:
+            if kk.lower() in t.lower():
+                return True
+            continue
+        if legacy_token_regex(kk).search(t):
+            return True
+    return False
+
+
+class LegacyMatcher:
+    def __init__(self, keywords):
+        self.keywords = keywords
+
+    def __bool__(self):
+        return bool(self.keywords)
+
+    def search(self, text, lowered=False):
+        # legacy matching is case-insensitive, so pre-lowered input is fine
+        return legacy_contains_any(text, self.keywords)
+
+
+def make_corpus(n: int, seed: int = 7):
+    rnd = random.Random(seed)
+    jobs = []
+    for i in range(n):
+        body = " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(150, 500)))
+        jobs.append({
+            "id": f"job{i}",
+            "source": rnd.choice(["greenhouse", "lever", "ashby"]),
+            "company": f"company{i % 40}",
+            "title": rnd.choice(TITLES),
+            "location": rnd.choice(["Seattle, WA", "Remote", "New York", "Denver, CO"]),
+            "content_plain": body,
+        })
+    return jobs
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    with open(fetch_jobs.CONFIG_PATH, "r", encoding="utf-8") as f:
+        filters = json.load(f).get("filters") or {}
+
+    jobs = make_corpus(n)
+
+    (kept_new, dropped_new), t_new = timed(fetch_jobs.apply_filters, jobs, filters)
+
+    original = fetch_jobs.KeywordMatcher
+    fetch_jobs.KeywordMatcher = LegacyMatcher
+    try:
+        (kept_old, dropped_old), t_old = timed(fetch_jobs.apply_filters, jobs, filters)
+    finally:
+        fetch_jobs.KeywordMatcher = original
+
+    same = (
+        [j["id"] for j in kept_old] == [j["id"] for j in kept_new]
+        and dropped_old.counts == dropped_new.counts
+        and dropped_old.sample == dropped_new.sample
+    )
+    print(f"jobs: {n}  kept: {len(kept_new)}  dropped: {len(dropped_new)}  identical: {same}")
+    print(f"legacy contains_any: {t_old:.3f}s")
+    print(f"KeywordMatcher:      {t_new:.3f}s")
+    print(f"speedup:             {t_old / t_new:.1f}x")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
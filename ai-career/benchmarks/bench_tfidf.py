@@ -0,0 +1,60 @@
+"""
+Microbenchmark: TF-IDF profile similarity (score_jobs --similarity) per backend.
+
+Usage:
+  python ai-career/benchmarks/bench_tfidf.py [n_jobs]
+
+Builds n synthetic descriptions (default 100k, same generator as fixtures.py), scores them
+against config/profile.json with every available backend (scipy CSR, numpy arrays, pure
+Python), checks the backends agree and prints timings.
+"""
+import json
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)  # ai-career/
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import tfidf  # noqa: E402
+from fixtures import make_posting  # noqa: E402
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rnd = random.Random(7)
+    docs = []
+    for i in range(n):
+        title, _, _, _, plain = make_posting(rnd, i)
+        docs.append(f"{title}\n{plain}")
+    with open(os.path.join(ROOT, "config", "profile.json"), "r", encoding="utf-8") as f:
+        query = tfidf.profile_query(json.load(f))
+
+    np_mod, sparse_mod = tfidf.np, tfidf.sparse
+    backends = []
+    if np_mod is not None and sparse_mod is not None:
+        backends.append(("scipy", np_mod, sparse_mod))
+    if np_mod is not None:
+        backends.append(("numpy", np_mod, None))
+    backends.append(("python", None, None))
+
+    print(f"{n} descriptions, {len(query)} query terms")
+    ref = None
+    for name, np_, sp_ in backends:
+        tfidf.np, tfidf.sparse = np_, sp_
+        t0 = time.perf_counter()
+        scores = tfidf.similarity_scores(docs, query)
+        dt = time.perf_counter() - t0
+        if ref is None:
+            ref = scores
+        diff = max(abs(a - b) for a, b in zip(ref, scores))
+        print(f"  {name:<7} {dt:7.2f}s  {n / dt:>10.0f} docs/s  max |diff| vs {backends[0][0]}: {diff:.2e}")
+        if diff > 1e-9:
+            raise SystemExit(f"{name} disagrees with {backends[0][0]}")
+    tfidf.np, tfidf.sparse = np_mod, sparse_mod
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Synthetic Greenhouse / Lever / Ashby board payloads for the benchmark harness.
+
+Postings are split 50/25/25 across the three sources, BOARD_SIZE postings per board,
+with descriptions shaped like real ones (headings, bullet lists, pay lines, the odd
+clearance/citizenship sentence) so filters, scoring and triage do realistic work.
+Generation is deterministic for a given (n, seed).
+
+Layout written by write_fixtures(dir, n):
+  greenhouse/<token>.json   body of /v1/boards/<token>/jobs
+  lever/<slug>.json         full postings list (the stub applies skip/limit)
+  ashby/<name>.json         body of /posting-api/job-board/<name>
+  targets.json              `targets` list for config/targets.json
+"""
+import html
+import json
+import os
+import random
+
+BOARD_SIZE = 250
+SOURCE_SHARES = (("greenhouse", 0.5), ("lever", 0.25), ("ashby", 0.25))
+
+TEAMS = ["Machine Learning", "Data Platform", "Infrastructure", "Security", "Payments", "Growth", "Research"]
+ROLES = ["Software Engineer", "Machine Learning Engineer", "Data Engineer", "Data Scientist",
+         "Research Engineer", "Product Designer", "Account Executive", "Cloud Engineer"]
+SENIORITY = ["", "", "", "Senior ", "Staff ", "Principal "]
+INTERN_SUFFIX = [" Intern", " Intern (Summer 2027)", " Internship", " Co-op"]
+LOCATIONS = ["Seattle, WA", "Bellevue, WA", "Denver, CO", "San Francisco, CA", "New York, NY",
+             "Austin, TX", "Remote - US", "Boston, MA", "London, UK", "Hybrid - Seattle"]
+SKILLS = ["Python", "SQL", "PyTorch", "TensorFlow", "Docker", "Kubernetes", "Terraform", "Spark",
+          "Kafka", "AWS", "GCP", "Azure", "Java", "C++", "React", "Airflow", "Databricks", "Linux"]
+TOPICS = ["NLP", "computer vision", "RAG pipelines", "transformer models", "distributed systems",
+          "data pipelines", "observability", "developer tooling", "payments infrastructure"]
+FILLER = (
+    "We are building reliable products used by millions of people every day. Our teams move fast, "
+    "own problems end to end and care deeply about quality. You will collaborate with engineers, "
+    "designers and researchers across the company and ship work that matters to our customers."
+).split(". ")
+DEGREES = [
+    "Currently pursuing a Bachelor's degree in Computer Science, Computer Engineering or a related field.",
+    "Pursuing a BS or MS in Computer Science, Software Engineering or similar.",
+    "Undergraduate students in CS, math or statistics graduating in 2027 or 2028.",
+    "Currently enrolled in a PhD program in machine learning or a related field.",
+]
+RARE = [
+    "This position requires an active security clearance.",
+    "Clearance not required for this role.",
+    "Must be a U.S. citizen due to export control requirements.",
+    "U.S. citizenship is not required.",
+]
+
+
+def _sentence(rnd) -> str:
+    s = rnd.choice(FILLER).strip().rstrip(".")
+    return f"{s}. You will work on {rnd.choice(TOPICS)} with {rnd.choice(SKILLS)} and {rnd.choice(SKILLS)}."
+
+
+def make_posting(rnd, i: int):
+    """One synthetic posting: (title, location, team, html_body, plain_body)."""
+    intern = rnd.random() < 0.6
+    role = rnd.choice(ROLES)
+    title = (role + rnd.choice(INTERN_SUFFIX)) if intern else (rnd.choice(SENIORITY) + role)
+    team = rnd.choice(TEAMS)
+    loc = rnd.choice(LOCATIONS)
+
+    sections = [("About the team", [" ".join(_sentence(rnd) for _ in range(rnd.randint(2, 4)))], False)]
+    sections.append(("What you'll do", [_sentence(rnd) for _ in range(rnd.randint(3, 6))], True))
+    reqs = [rnd.choice(DEGREES)] + [f"Experience with {rnd.choice(SKILLS)} and {rnd.choice(SKILLS)}." for _ in range(rnd.randint(2, 4))]
+    if rnd.random() < 0.08:
+        reqs.append(rnd.choice(RARE))
+    sections.append(("Requirements", reqs, True))
+    sections.append(("Preferred qualifications", [f"Familiarity with {rnd.choice(TOPICS)}." for _ in range(rnd.randint(1, 3))], True))
+    pay = rnd.randint(35, 70)
+    sections.append(("Benefits", [f"The hourly rate for this role is ${pay}-${pay + 10} USD.", "Housing stipend and relocation support."], True))
+
+    html_parts = []
+    plain_parts = []
+    for heading, items, bullets in sections:
+        html_parts.append(f"<h3><strong>{html.escape(heading)}</strong></h3>")
+        plain_parts.append(heading)
+        if bullets:
+            html_parts.append("<ul>" + "".join(f"<li>{html.escape(x)}</li>" for x in items) + "</ul>")
+        else:
+            html_parts.append("".join(f"<p>{html.escape(x)}&nbsp;</p>" for x in items))
+        plain_parts.extend(items)
+    return title, loc, team, "".join(html_parts), "\n".join(plain_parts)
+
+
+def greenhouse_board(rnd, token: str, start: int, count: int) -> dict:
+    jobs = []
+    for i in range(start, start + count):
+        title, loc, team, body, _ = make_posting(rnd, i)
+        jobs.append({
+            "id": 4000000 + i,
+            "title": title,
+            "absolute_url": f"https://boards.example.com/{token}/jobs/{4000000 + i}",
+            "updated_at": f"2026-{1 + i % 12:02d}-{1 + i % 28:02d}T12:00:00-04:00",
+            "location": {"name": loc},
+            "departments": [{"name": team}],
+            # Greenhouse escapes the HTML body once more
+            "content": html.escape(body),
+        })
+    return {"jobs": jobs, "meta": {"total": count}}
+
+
+def lever_board(rnd, slug: str, start: int, count: int) -> list:
+    out = []
+    for i in range(start, start + count):
+        title, loc, team, body, plain = make_posting(rnd, i)
+        out.append({
+            "id": f"lv-{i:08d}",
+            "text": title,
+            "hostedUrl": f"https://jobs.example.com/{slug}/lv-{i:08d}",
+            "createdAt": 1767225600000 + i * 60000,
+            "categories": {"location": loc, "team": team, "commitment": "Intern" if "Intern" in title else "Full-time"},
+            "description": body,
+            "descriptionPlain": plain,
+        })
+    return out
+
+
+def ashby_board(rnd, name: str, start: int, count: int) -> dict:
+    jobs = []
+    for i in range(start, start + count):
+        title, loc, team, body, plain = make_posting(rnd, i)
+        intern = any(x in title for x in ("Intern", "Co-op"))
+        jobs.append({
+            "title": title,
+            "location": loc,
+            "department": "Engineering",
+            "team": team,
+            "employmentType": "Intern" if intern else "FullTime",
+            "publishedAt": f"2026-{1 + i % 12:02d}-{1 + i % 28:02d}T00:00:00.000+00:00",
+            "jobUrl": f"https://jobs.example.com/{name}/{i}",
+            "applyUrl": f"https://jobs.example.com/{name}/{i}/application",
+            "descriptionHtml": body,
+            "descriptionPlain": plain,
+        })
+    return {"jobs": jobs}
+
+
+def write_fixtures(out_dir: str, n: int, seed: int = 7) -> list:
+    """Write board payloads for n postings; returns the matching `targets` list."""
+    rnd = random.Random(seed)
+    targets = []
+    start = 0
+    for source, share in SOURCE_SHARES:
+        remaining = int(n * share) if source != SOURCE_SHARES[-1][0] else n - start
+        os.makedirs(os.path.join(out_dir, source), exist_ok=True)
+        b = 0
+        while remaining > 0:
+            count = min(BOARD_SIZE, remaining)
+            token = f"{source[:2]}board{b:04d}"
+            company = f"{source.title()} Co {b:04d}"
+            if source == "greenhouse":
+                payload = greenhouse_board(rnd, token, start, count)
+                targets.append({"source": source, "company": company, "board_token": token})
+            elif source == "lever":
+                payload = lever_board(rnd, token, start, count)
+                targets.append({"source": source, "company": company, "lever_slug": token})
+            else:
+                payload = ashby_board(rnd, token, start, count)
+                targets.append({"source": source, "company": company, "job_board_name": token})
+            with open(os.path.join(out_dir, source, token + ".json"), "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            start += count
+            remaining -= count
+            b += 1
+    with open(os.path.join(out_dir, "targets.json"), "w", encoding="utf-8") as f:
+        json.dump(targets, f, ensure_ascii=False, indent=2)
+    return targets
@@ -0,0 +1,295 @@
+"""
+Benchmark harness for the ai-career pipeline on synthetic board fixtures.
+
+Usage:
+  python ai-career/benchmarks/run_benchmarks.py [--scales 1000,10000,100000] [--only fetch_cold,score_job]
+                                                [--out PATH] [--baseline PATH] [--save-baseline]
+                                                [--tolerance 0.25] [--fail-on-regression] [--keep]
+
+For every scale, fixtures.py generates Greenhouse/Lever/Ashby boards and stub_server.py serves
+them on localhost. Each benchmark runs in a fresh interpreter so peak RSS is its own:
+
+  fetch_cold     fetch_jobs.main against the stub with empty caches/state
+  fetch_warm     fetch_jobs.main again (HTTP 304s + incremental parse reuse)
+  apply_filters  fetch_jobs.apply_filters over every posting
+  score_job      score_jobs.score_job over every posting
+  triage_one     triage_jobs.triage_one over every posting
+
+Results (seconds, items/s, peak RSS) go to --out; they are compared against --baseline
+(benchmarks/baseline.json) and anything slower or bigger than baseline * (1 + tolerance)
+is reported as a regression. --save-baseline overwrites the baseline with this run.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)  # ai-career/
+SCRIPTS = os.path.join(ROOT, "scripts")
+
+BENCHES = ("fetch_cold", "fetch_warm", "apply_filters", "score_job", "triage_one")
+DEFAULT_SCALES = (1000, 10000)
+DEFAULT_OUT = os.path.join(HERE, "results.json")
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+RESULT_PREFIX = "BENCH_RESULT "
+
+try:
+    import resource  # not available on Windows
+except ImportError:
+    resource = None
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return round(rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024, 1)
+
+
+# ---- child side: one benchmark per interpreter ----
+
+def _load_corpus(fixtures_dir: str):
+    """Every posting, parsed the way fetch_jobs does (no network, no caches)."""
+    import fetch_jobs
+
+    with open(os.path.join(fixtures_dir, "targets.json"), "r", encoding="utf-8") as f:
+        targets = json.load(f)
+    jobs = []
+    for t in targets:
+        source = t["source"]
+        token = t[fetch_jobs.BOARD_KEYS[source]]
+        with open(os.path.join(fixtures_dir, source, token + ".json"), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        parse = {"greenhouse": fetch_jobs.parse_greenhouse, "lever": fetch_jobs.parse_lever, "ashby": fetch_jobs.parse_ashby}[source]
+        jobs.extend(parse(data, token, t["company"]))
+    return jobs
+
+
+def _run_fetch(work_dir: str, fixtures_dir: str):
+    import fetch_jobs
+
+    data_dir = os.path.join(work_dir, "data")
+    os.makedirs(data_dir, exist_ok=True)
+    with open(fetch_jobs.CONFIG_PATH, "r", encoding="utf-8") as f:
+        cfg = json.load(f)
+    with open(os.path.join(fixtures_dir, "targets.json"), "r", encoding="utf-8") as f:
+        cfg["targets"] = json.load(f)
+    fetch_cfg = cfg.setdefault("fetch", {})
+    # The stub is local: no politeness delay, fail fast
+    fetch_cfg["default_rate_limit"] = {"rate": 100000.0, "burst": 1000}
+    fetch_cfg["retry"] = {"retries": 0}
+    config_path = os.path.join(work_dir, "targets.json")
+    with open(config_path, "w", encoding="utf-8") as f:
+        json.dump(cfg, f, ensure_ascii=False)
+
+    # Redirect every output path into the work dir
+    fetch_jobs.CONFIG_PATH = config_path
+    old_out = fetch_jobs.OUT_DIR
+    for name in dir(fetch_jobs):
+        v = getattr(fetch_jobs, name)
+        if name != "OUT_DIR" and isinstance(v, str) and v.startswith(old_out):
+            setattr(fetch_jobs, name, data_dir + v[len(old_out):])
+    fetch_jobs.OUT_DIR = data_dir
+
+    t0 = time.perf_counter()
+    fetch_jobs.main()
+    seconds = time.perf_counter() - t0
+
+    with open(fetch_jobs.OUT_JSON, "r", encoding="utf-8") as f:
+        header = json.load(f)
+    if header.get("errors"):
+        raise RuntimeError(f"fetch errors: {header['errors'][:3]}")
+    return seconds, header.get("fetched_count") or 0
+
+
+def child_main(bench: str, work_dir: str, fixtures_dir: str) -> None:
+    sys.path.insert(0, SCRIPTS)
+
+    if bench in ("fetch_cold", "fetch_warm"):
+        seconds, items = _run_fetch(work_dir, fixtures_dir)
+    else:
+        jobs = _load_corpus(fixtures_dir)
+        items = len(jobs)
+        if bench == "apply_filters":
+            import fetch_jobs
+
+            with open(fetch_jobs.CONFIG_PATH, "r", encoding="utf-8") as f:
+                filters = json.load(f).get("filters") or {}
+            t0 = time.perf_counter()
+            fetch_jobs.apply_filters(jobs, filters)
+            seconds = time.perf_counter() - t0
+        else:
+            with open(os.path.join(ROOT, "config", "profile.json"), "r", encoding="utf-8") as f:
+                profile = json.load(f)
+            if bench == "score_job":
+                from score_jobs import CompiledProfile, score_job as fn
+                profile = CompiledProfile(profile)
+            else:
+                from triage_jobs import triage_one as fn
+            t0 = time.perf_counter()
+            for j in jobs:
+                fn(j, profile)
+            seconds = time.perf_counter() - t0
+
+    print(RESULT_PREFIX + json.dumps({
+        "seconds": round(seconds, 4),
+        "items": items,
+        "items_per_s": round(items / seconds, 1) if seconds > 0 else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }))
+
+
+# ---- parent side ----
+
+def start_stub(fixtures_dir: str):
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(HERE, "stub_server.py"), fixtures_dir, "0"],
+        stdout=subprocess.PIPE, text=True,
+    )
+    line = proc.stdout.readline().split()
+    if len(line) != 2 or line[0] != "ready":
+        proc.kill()
+        raise RuntimeError("stub server did not start")
+    return proc, int(line[1])
+
+
+def run_child(bench: str, work_dir: str, fixtures_dir: str, port: int) -> dict:
+    env = dict(os.environ)
+    for k in ("GREENHOUSE", "LEVER", "ASHBY"):
+        env[f"AI_CAREER_{k}_API"] = f"http://127.0.0.1:{port}"
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", bench, work_dir, fixtures_dir],
+        env=env, capture_output=True, text=True,
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    raise RuntimeError(f"{bench} failed:\n{proc.stdout[-2000:]}\n{proc.stderr[-2000:]}")
+
+
+def run_scale(n: int, benches, keep: bool = False) -> dict:
+    from fixtures import write_fixtures
+
+    work_dir = tempfile.mkdtemp(prefix=f"ai-career-bench-{n}-")
+    fixtures_dir = os.path.join(work_dir, "fixtures")
+    results = {}
+    stub = None
+    try:
+        targets = write_fixtures(fixtures_dir, n)
+        print(f"[{n}] {len(targets)} boards in {fixtures_dir}", flush=True)
+        stub, port = start_stub(fixtures_dir)
+        for bench in benches:
+            res = run_child(bench, work_dir, fixtures_dir, port)
+            results[bench] = res
+            print(f"[{n}] {bench:<14} {res['seconds']:>9.3f}s  {res['items_per_s'] or 0:>10.1f} items/s  "
+                  f"peak RSS {res['peak_rss_mb']} MB", flush=True)
+    finally:
+        if stub is not None:
+            stub.kill()
+            stub.wait()
+        if keep:
+            print(f"[{n}] kept {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float):
+    """Rows of (scale, bench, metric, value, baseline, ratio, regressed)."""
+    rows = []
+    base = (baseline or {}).get("results") or {}
+    for scale, benches in results.items():
+        for bench, res in benches.items():
+            ref = (base.get(scale) or {}).get(bench)
+            if not ref:
+                continue
+            for metric in ("seconds", "peak_rss_mb"):
+                v, b = res.get(metric), ref.get(metric)
+                if not v or not b:
+                    continue
+                ratio = v / b
+                rows.append({
+                    "scale": scale, "bench": bench, "metric": metric, "value": v, "baseline": b,
+                    "ratio": round(ratio, 3), "regressed": ratio > 1 + tolerance,
+                })
+    return rows
+
+
+def load_json(path: str):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child_main(*sys.argv[2:5])
+        return
+
+    ap = argparse.ArgumentParser(description="ai-career pipeline benchmarks")
+    ap.add_argument("--scales", default=",".join(str(x) for x in DEFAULT_SCALES), help="comma-separated posting counts")
+    ap.add_argument("--only", default="", help="comma-separated subset of: " + ", ".join(BENCHES))
+    ap.add_argument("--out", default=DEFAULT_OUT)
+    ap.add_argument("--baseline", default=DEFAULT_BASELINE)
+    ap.add_argument("--save-baseline", action="store_true")
+    ap.add_argument("--tolerance", type=float, default=0.25)
+    ap.add_argument("--fail-on-regression", action="store_true")
+    ap.add_argument("--keep", action="store_true", help="keep the generated work dirs")
+    args = ap.parse_args()
+
+    scales = [int(x) for x in args.scales.split(",") if x.strip()]
+    benches = [b for b in BENCHES if not args.only or b in args.only.split(",")]
+    if "fetch_warm" in benches and "fetch_cold" not in benches:
+        benches.insert(benches.index("fetch_warm"), "fetch_cold")
+
+    results = {}
+    for n in scales:
+        results[str(n)] = run_scale(n, benches, keep=args.keep)
+
+    payload = {
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+
+    baseline = load_json(args.baseline)
+    rows = compare(results, baseline, args.tolerance)
+    payload["comparison"] = {"baseline": args.baseline if baseline else None, "tolerance": args.tolerance, "rows": rows}
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    print(f"results: {args.out}")
+
+    regressed = [r for r in rows if r["regressed"]]
+    if baseline is None:
+        print(f"baseline: none at {args.baseline}")
+    else:
+        for r in rows:
+            mark = "REGRESSION" if r["regressed"] else "ok"
+            print(f"  {r['scale']:>7} {r['bench']:<14} {r['metric']:<12} {r['value']:>10} vs {r['baseline']:>10}  x{r['ratio']:<6} {mark}")
+        print(f"baseline: {len(rows)} comparison(s), {len(regressed)} regression(s) beyond +{args.tolerance:.0%}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({k: payload[k] for k in ("generated_at_utc", "python", "platform", "cpu_count", "results")},
+                      f, ensure_ascii=False, indent=2)
+        print(f"baseline: saved {args.baseline}")
+
+    if regressed and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Local HTTP stub for the three board APIs, serving fixtures written by fixtures.py.
+
+Usage:
+  python ai-career/benchmarks/stub_server.py <fixtures_dir> <port>
+
+Point fetch_jobs at it with AI_CAREER_{GREENHOUSE,LEVER,ASHBY}_API=http://127.0.0.1:<port>.
+Speaks HTTP/1.1 keep-alive, sends ETags (answers If-None-Match with 304), gzips when
+asked to and applies Lever's skip/limit. Prints "ready <port>" once it is listening
+(port 0 picks a free one).
+"""
+import gzip
+import hashlib
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class FixtureStore:
+    """Response bodies by (source, token, skip, limit), built once and kept in memory."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.bodies = {}
+        self.lever = {}
+        self.lock = threading.Lock()
+
+    def _read(self, source: str, token: str):
+        path = os.path.join(self.root, source, os.path.basename(token) + ".json")
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def body(self, source: str, token: str, skip=None, limit=None):
+        key = (source, token, skip, limit)
+        with self.lock:
+            cached = self.bodies.get(key)
+        if cached is not None:
+            return cached
+
+        if source == "lever" and (skip is not None or limit is not None):
+            with self.lock:
+                postings = self.lever.get(token)
+            if postings is None:
+                raw = self._read(source, token)
+                if raw is None:
+                    return None
+                postings = json.loads(raw)
+                with self.lock:
+                    self.lever[token] = postings
+            start = skip or 0
+            end = start + limit if limit is not None else None
+            data = json.dumps(postings[start:end], ensure_ascii=False).encode("utf-8")
+        else:
+            data = self._read(source, token)
+            if data is None:
+                return None
+
+        entry = (data, gzip.compress(data, compresslevel=5), '"%s"' % hashlib.md5(data).hexdigest())
+        with self.lock:
+            self.bodies[key] = entry
+        return entry
+
+
+def make_handler(store: FixtureStore):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, code: int, body: bytes = b"", headers=None):
+            self.send_response(code)
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            segs = [s for s in parts.path.split("/") if s]
+            q = parse_qs(parts.query)
+            skip = limit = None
+            if segs[:2] == ["v1", "boards"] and len(segs) >= 3:
+                source, token = "greenhouse", segs[2]
+            elif segs[:2] == ["v0", "postings"] and len(segs) >= 3:
+                source, token = "lever", segs[2]
+                if "skip" in q:
+                    skip = int(q["skip"][0])
+                if "limit" in q:
+                    limit = int(q["limit"][0])
+            elif segs[:2] == ["posting-api", "job-board"] and len(segs) >= 3:
+                source, token = "ashby", segs[2]
+            else:
+                return self._send(404)
+
+            entry = store.body(source, token, skip, limit)
+            if entry is None:
+                return self._send(404)
+            data, gz, etag = entry
+            if self.headers.get("If-None-Match") == etag:
+                return self._send(304, headers={"ETag": etag})
+            headers = {"ETag": etag, "Content-Type": "application/json"}
+            if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+                headers["Content-Encoding"] = "gzip"
+                return self._send(200, gz, headers)
+            return self._send(200, data, headers)
+
+    return Handler
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: stub_server.py <fixtures_dir> <port>")
+        sys.exit(2)
+    server = ThreadingHTTPServer(("127.0.0.1", int(sys.argv[2])), make_handler(FixtureStore(sys.argv[1])))
+    server.daemon_threads = True
+    print(f"ready {server.server_address[1]}", flush=True)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import gzip
+import hashlib
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))  # ai-career/
+ARCHIVE_DIR = os.path.join(ROOT, "data", "archive")
+BLOB_DIR = os.path.join(ARCHIVE_DIR, "blobs")
+
+# Job fields moved into the blob store; the snapshot keeps "<field>_blob" = sha256
+BLOB_FIELDS = ("content_text", "content_plain")
+
+
+def blob_path(blob_id: str, blob_dir: str = BLOB_DIR) -> str:
+    return os.path.join(blob_dir, blob_id[:2], blob_id + ".gz")
+
+
+def put_blob(text: str, blob_dir: str = BLOB_DIR) -> str:
+    """
+    Store text (gzip) under its sha256 and return the blob id.
+    Identical descriptions across days/jobs are stored once.
+    """
+    data = text.encode("utf-8")
+    blob_id = hashlib.sha256(data).hexdigest()
+    path = blob_path(blob_id, blob_dir)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        # mtime=0 keeps the compressed bytes deterministic (stable git diffs)
+        with open(tmp, "wb") as f:
+            with gzip.GzipFile(fileobj=f, mode="wb", mtime=0) as gz:
+                gz.write(data)
+        os.replace(tmp, path)
+    return blob_id
+
+
+def get_blob(blob_id: str, blob_dir: str = BLOB_DIR) -> str:
+    with gzip.open(blob_path(blob_id, blob_dir), "rb") as f:
+        return f.read().decode("utf-8")
+
+
+def compact_job(job: dict, blob_dir: str = BLOB_DIR) -> dict:
+    """Copy of job with description fields replaced by blob ids (empty fields stay inline)."""
+    out = {}
+    for k, v in job.items():
+        if k in BLOB_FIELDS and isinstance(v, str) and v:
+            out[k + "_blob"] = put_blob(v, blob_dir)
+        else:
+            out[k] = v
+    return out
+
+
+def rehydrate_job(job: dict, blob_dir: str = BLOB_DIR) -> dict:
+    """Inverse of compact_job; jobs from legacy (inline) snapshots are returned unchanged."""
+    out = {}
+    for k, v in job.items():
+        if k.endswith("_blob") and k[:-5] in BLOB_FIELDS:
+            out[k[:-5]] = get_blob(v, blob_dir) if v else ""
+        else:
+            out[k] = v
+    return out
+
+
+def snapshot_path(date_str: str, archive_dir: str = ARCHIVE_DIR) -> str:
+    return os.path.join(archive_dir, f"jobs.{date_str}.json")
+
+
+def list_snapshot_dates(archive_dir: str = ARCHIVE_DIR):
+    dates = []
+    for name in os.listdir(archive_dir):
+        if name.startswith("jobs.") and name.endswith(".json"):
+            dates.append(name[len("jobs."):-len(".json")])
+    return sorted(dates)
+
+
+def load_snapshot(date_str: str, rehydrate: bool = True, archive_dir: str = ARCHIVE_DIR, blob_dir: str = BLOB_DIR) -> dict:
+    """
+    Load one day's archive snapshot. With rehydrate=False the jobs keep their blob ids,
+    which is enough (and much cheaper) for scans over metadata only.
+    """
+    with open(snapshot_path(date_str, archive_dir), "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    if rehydrate:
+        payload["jobs"] = [rehydrate_job(j, blob_dir) for j in payload.get("jobs") or []]
+    return payload
+
+
+def compact_snapshot_file(path: str, blob_dir: str = BLOB_DIR) -> bool:
+    """Rewrite a legacy snapshot in place with descriptions moved to the blob store."""
+    with open(path, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    jobs = payload.get("jobs") or []
+    if not any(k in j for j in jobs for k in BLOB_FIELDS):
+        return False
+    payload["jobs"] = [compact_job(j, blob_dir) for j in jobs]
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+    return True
+
+
+def main():
+    """
+    Usage:
+      python ai-career/scripts/archive_store.py compact        # migrate legacy archive snapshots
+      python ai-career/scripts/archive_store.py show <date>    # print a rehydrated snapshot
+    """
+    if len(sys.argv) < 2 or sys.argv[1] not in ("compact", "show"):
+        print("Usage: archive_store.py compact | show <YYYY-MM-DD>")
+        sys.exit(2)
+
+    if sys.argv[1] == "compact":
+        changed = 0
+        for date_str in list_snapshot_dates():
+            if compact_snapshot_file(snapshot_path(date_str)):
+                changed += 1
+        print(f"archive: compacted {changed} snapshot(s) into {BLOB_DIR}")
+        return
+
+    if len(sys.argv) < 3:
+        print("Usage: archive_store.py show <YYYY-MM-DD>")
+        sys.exit(2)
+    json.dump(load_snapshot(sys.argv[2]), sys.stdout, ensure_ascii=False, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+
+
+class BoardCheckpoints:
+    """
+    Per-board fetch checkpoints for one run day: data/checkpoints/<date>/<board>.json.
+
+    A board's parsed jobs are saved as soon as it has been fetched (paginated boards
+    after every page), so a run that crashes midway resumes from the saved boards
+    instead of refetching everything. The directory is removed once the run has
+    written its outputs.
+
+    `variant` identifies how the jobs were parsed (see ResponseCache); checkpoints
+    written under a different variant are ignored.
+    """
+
+    def __init__(self, root_dir: str, date_str: str, variant: str = ""):
+        self.root_dir = root_dir
+        self.dir = os.path.join(root_dir, date_str)
+        self.variant = variant
+        self.resumed = 0
+        self.lock = threading.Lock()
+        self.prune_other_days(date_str)
+        os.makedirs(self.dir, exist_ok=True)
+
+    @staticmethod
+    def board_name(source: str, token: str) -> str:
+        safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", token or "")[:60]
+        digest = hashlib.sha256(f"{source}||{token}".encode("utf-8")).hexdigest()[:8]
+        return f"{source}-{safe}-{digest}"
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.dir, name + ".json")
+
+    def load(self, name: str):
+        """Checkpoint dict ({"done", "jobs", ...}) for a board, or None."""
+        try:
+            with open(self._path(name), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            return None
+        if not isinstance(data, dict) or data.get("variant", "") != self.variant:
+            return None
+        if not isinstance(data.get("jobs"), list):
+            return None
+        return data
+
+    def save(self, name: str, jobs, done: bool = True, **extra) -> None:
+        data = {"variant": self.variant, "done": done, "jobs": jobs}
+        data.update(extra)
+        path = self._path(name)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def record_resumed(self) -> None:
+        with self.lock:
+            self.resumed += 1
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {"resumed": self.resumed}
+
+    def prune_other_days(self, date_str: str) -> None:
+        """Checkpoints from an earlier day are stale (boards have changed since)."""
+        try:
+            names = os.listdir(self.root_dir)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name != date_str:
+                shutil.rmtree(os.path.join(self.root_dir, name), ignore_errors=True)
+
+    def clear(self) -> None:
+        shutil.rmtree(self.dir, ignore_errors=True)
+        try:
+            os.rmdir(self.root_dir)
+        except OSError:
+            pass
@@ -0,0 +1,276 @@
+import argparse
+import csv
+import gzip
+import hashlib
+import io
+import os
+from collections import Counter
+from datetime import date
+
+from archive_store import list_snapshot_dates, load_snapshot
+
+ROOT = os.path.dirname(os.path.dirname(__file__))  # ai-career/
+CORPUS_DIR = os.path.join(ROOT, "data", "corpus")
+
+# One partition per table per day (<table>/<YYYY-MM-DD>.parquet or .csv.gz); a rerun on the
+# same day replaces that day's partition, like the daily archive. Every column is a string.
+TABLES = {
+    "jobs": ("run_date", "id", "company", "source", "title", "location",
+             "created_at", "updated_at", "dup_group", "content_hash"),
+    "drops": ("run_date", "reason", "company", "source", "count"),
+}
+PARTITION_EXTS = (".parquet", ".csv.gz")
+
+# Partitions are gzip CSV unless "parquet" is asked for (output.corpus_format); the format is
+# never picked by what happens to be installed, so every checkout can read what CI commits
+FORMATS = ("csv.gz", "parquet")
+DEFAULT_FORMAT = "csv.gz"
+
+
+def _parquet():
+    """pyarrow, imported on first use: it is optional and heavy (fetch runs never load it for csv.gz)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet corpus partitions need the optional pyarrow package") from None
+    return pa, pq
+
+
+def check_format(fmt: str) -> str:
+    """fmt, or ValueError / ImportError when it cannot be written here."""
+    if fmt not in FORMATS:
+        raise ValueError(f"corpus format {fmt!r} (expected one of {FORMATS})")
+    if fmt == "parquet":
+        _parquet()
+    return fmt
+
+
+def content_hash(job: dict):
+    """
+    First 16 hex chars of the sha256 of the description (content_plain, else content_text).
+    Compacted archive records already carry that sha256 as their blob id.
+    """
+    blob = job.get("content_plain_blob") or job.get("content_text_blob")
+    if blob:
+        return blob[:16]
+    text = job.get("content_plain") or job.get("content_text") or ""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16] if text else None
+
+
+def job_row(job: dict, date_str: str) -> dict:
+    row = {c: job.get(c) for c in TABLES["jobs"]}
+    row["run_date"] = date_str
+    row["content_hash"] = content_hash(job)
+    return row
+
+
+def drop_row(d: dict, date_str: str) -> dict:
+    """d: one DropStats.rows() entry (reason, company, source, count)."""
+    row = {c: d.get(c) for c in TABLES["drops"]}
+    row["run_date"] = date_str
+    return row
+
+
+def write_partition(table: str, date_str: str, rows, corpus_dir: str = CORPUS_DIR, fmt: str = DEFAULT_FORMAT) -> str:
+    """Write (replace) one day's partition of a table in format fmt; returns its path."""
+    check_format(fmt)
+    cols = TABLES[table]
+    table_dir = os.path.join(corpus_dir, table)
+    os.makedirs(table_dir, exist_ok=True)
+    values = [[None if r.get(c) is None else str(r.get(c)) for c in cols] for r in rows]
+
+    ext = "." + fmt
+    path = os.path.join(table_dir, date_str + ext)
+    tmp = path + ".tmp"
+    if fmt == "parquet":
+        pa, pq = _parquet()
+        arrays = [pa.array([v[i] for v in values], type=pa.string()) for i in range(len(cols))]
+        pq.write_table(pa.Table.from_arrays(arrays, names=list(cols)), tmp, compression="zstd")
+    else:
+        # mtime=0 keeps the compressed bytes deterministic (stable git diffs)
+        with open(tmp, "wb") as f:
+            with gzip.GzipFile(fileobj=f, mode="wb", mtime=0) as gz:
+                with io.TextIOWrapper(gz, encoding="utf-8", newline="") as w:
+                    out = csv.writer(w)
+                    out.writerow(cols)
+                    out.writerows([["" if x is None else x for x in v] for v in values])
+    os.replace(tmp, path)
+
+    # A rerun in the other format must not leave two partitions for the day
+    for other in PARTITION_EXTS:
+        if other != ext and os.path.exists(os.path.join(table_dir, date_str + other)):
+            os.remove(os.path.join(table_dir, date_str + other))
+    return path
+
+
+def append_run(date_str: str, jobs, drop_counts, corpus_dir: str = CORPUS_DIR, fmt: str = DEFAULT_FORMAT):
+    """
+    Record one fetch run: kept jobs, and filter drops counted per (reason, company, source)
+    (DropStats.rows()). Returns the partition paths.
+    """
+    return [
+        write_partition("jobs", date_str, [job_row(j, date_str) for j in jobs], corpus_dir, fmt),
+        write_partition("drops", date_str, [drop_row(d, date_str) for d in drop_counts], corpus_dir, fmt),
+    ]
+
+
+def partitions(table: str, start: str = None, end: str = None, corpus_dir: str = CORPUS_DIR):
+    """[(date, path)] of a table within [start, end] (YYYY-MM-DD, inclusive), oldest first."""
+    table_dir = os.path.join(corpus_dir, table)
+    try:
+        names = os.listdir(table_dir)
+    except FileNotFoundError:
+        return []
+    out = []
+    for name in names:
+        for ext in PARTITION_EXTS:
+            if name.endswith(ext):
+                d = name[:-len(ext)]
+                if (start is None or d >= start) and (end is None or d <= end):
+                    out.append((d, os.path.join(table_dir, name)))
+    return sorted(out)
+
+
+def read_rows(table: str, columns=None, start: str = None, end: str = None, corpus_dir: str = CORPUS_DIR):
+    """
+    Rows (dicts of the requested columns) of a table within [start, end]. Only the
+    partitions in range are opened, and with Parquet only the requested columns are read.
+    """
+    cols = list(columns or TABLES[table])
+    for _, path in partitions(table, start, end, corpus_dir):
+        if path.endswith(".parquet"):
+            try:
+                _, pq = _parquet()
+            except ImportError as e:
+                raise ImportError(f"{path}: {e}") from None
+            t = pq.read_table(path, columns=cols)
+            for values in zip(*(t.column(c).to_pylist() for c in cols)):
+                yield dict(zip(cols, values))
+            continue
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None) or []
+            idx = [header.index(c) for c in cols]
+            for rec in reader:
+                yield {c: (rec[i] or None) for c, i in zip(cols, idx)}
+
+
+# ---- queries ----
+
+def first_seen(end: str = None, corpus_dir: str = CORPUS_DIR) -> dict:
+    """id -> (first run date, company), over every partition up to end."""
+    out = {}
+    for r in read_rows("jobs", ("run_date", "id", "company"), end=end, corpus_dir=corpus_dir):
+        if r["id"] and r["id"] not in out:
+            out[r["id"]] = (r["run_date"], r["company"] or "unknown")
+    return out
+
+
+def new_per_company_per_day(start: str = None, end: str = None, corpus_dir: str = CORPUS_DIR) -> dict:
+    """{date: {company: postings first seen that day}} (history before start still counts as seen)."""
+    counts = Counter(v for v in first_seen(end, corpus_dir).values() if start is None or v[0] >= start)
+    out = {}
+    for (d, company), n in sorted(counts.items()):
+        out.setdefault(d, {})[company] = n
+    return out
+
+
+def time_to_close(start: str = None, end: str = None, corpus_dir: str = CORPUS_DIR):
+    """
+    Postings seen within [start, end] that are gone by its last run day: dicts of id,
+    company, first_seen, last_seen and days (last - first; 0 = seen on one day only).
+    """
+    seen = {}
+    last_run = None
+    for r in read_rows("jobs", ("run_date", "id", "company"), start, end, corpus_dir):
+        last_run = r["run_date"] if last_run is None or r["run_date"] > last_run else last_run
+        if not r["id"]:
+            continue
+        x = seen.get(r["id"])
+        if x is None:
+            seen[r["id"]] = [r["run_date"], r["run_date"], r["company"] or "unknown"]
+        else:
+            x[0] = min(x[0], r["run_date"])
+            x[1] = max(x[1], r["run_date"])
+    out = []
+    for jid, (first, last, company) in seen.items():
+        if last < last_run:
+            days = (date.fromisoformat(last) - date.fromisoformat(first)).days
+            out.append({"id": jid, "company": company, "first_seen": first, "last_seen": last, "days": days})
+    return sorted(out, key=lambda x: (x["last_seen"], x["company"], x["id"]))
+
+
+def drop_reasons(start: str = None, end: str = None, by: str = "month", corpus_dir: str = CORPUS_DIR) -> dict:
+    """{period: {reason: drops}}; period is YYYY-MM (by="month") or YYYY-MM-DD (by="day")."""
+    width = 7 if by == "month" else 10
+    counts = Counter()
+    for r in read_rows("drops", ("run_date", "reason", "count"), start, end, corpus_dir):
+        counts[(r["run_date"][:width], r["reason"] or "unknown")] += int(r["count"] or 0)
+    out = {}
+    for (period, reason), n in sorted(counts.items()):
+        out.setdefault(period, {})[reason] = n
+    return out
+
+
+def backfill(corpus_dir: str = CORPUS_DIR, fmt: str = DEFAULT_FORMAT) -> int:
+    """Jobs partitions from the daily archive snapshots (drops: only runs made after this exists)."""
+    check_format(fmt)
+    n = 0
+    for date_str in list_snapshot_dates():
+        jobs = load_snapshot(date_str, rehydrate=False).get("jobs") or []
+        write_partition("jobs", date_str, [job_row(j, date_str) for j in jobs], corpus_dir, fmt)
+        n += 1
+    return n
+
+
+def _median(xs):
+    xs = sorted(xs)
+    m = len(xs) // 2
+    return xs[m] if len(xs) % 2 else (xs[m - 1] + xs[m]) / 2
+
+
+def main():
+    """
+    Usage:
+      python ai-career/scripts/corpus_store.py backfill [--format csv.gz|parquet]  # from data/archive
+      python ai-career/scripts/corpus_store.py new [--since D] [--until D] [--company C]
+      python ai-career/scripts/corpus_store.py ttc [--since D] [--until D]
+      python ai-career/scripts/corpus_store.py drops [--since D] [--until D] [--by day|month]
+    """
+    ap = argparse.ArgumentParser(description="Columnar job history (data/corpus) and queries over it")
+    ap.add_argument("command", choices=("backfill", "new", "ttc", "drops"))
+    ap.add_argument("--since", help="first run date (YYYY-MM-DD)")
+    ap.add_argument("--until", help="last run date (YYYY-MM-DD)")
+    ap.add_argument("--company", help="new: only this company")
+    ap.add_argument("--by", choices=("day", "month"), default="month", help="drops: period")
+    ap.add_argument("--format", choices=FORMATS, default=DEFAULT_FORMAT, help="backfill: partition format")
+    args = ap.parse_args()
+
+    if args.command == "backfill":
+        n = backfill(fmt=args.format)
+        print(f"corpus: {n} day(s) from the archive into {CORPUS_DIR} ({args.format})")
+        return
+
+    if args.command == "new":
+        for d, per_company in new_per_company_per_day(args.since, args.until).items():
+            for company, n in sorted(per_company.items(), key=lambda x: (-x[1], x[0])):
+                if args.company is None or company == args.company:
+                    print(f"{d}\t{company}\t{n}")
+        return
+
+    if args.command == "ttc":
+        per_company = {}
+        for x in time_to_close(args.since, args.until):
+            per_company.setdefault(x["company"], []).append(x["days"])
+        for company, days in sorted(per_company.items(), key=lambda x: (-len(x[1]), x[0])):
+            print(f"{company}\tclosed {len(days)}\tmedian {_median(days)} day(s)\tmax {max(days)}")
+        return
+
+    for period, reasons in drop_reasons(args.since, args.until, by=args.by).items():
+        for reason, n in sorted(reasons.items(), key=lambda x: (-x[1], x[0])):
+            print(f"{period}\t{reason}\t{n}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+import json
+import os
+import re
+import zlib
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(__file__))  # ai-career/
+INDEX_PATH = os.path.join(ROOT, "data", "dedup_index.json")
+
+# MinHash signature: one-permutation hashing into NUM_BINS bins (one hash per shingle,
+# instead of one per shingle per permutation); LSH over BANDS bands of ROWS bins.
+NUM_BINS = 64
+BANDS = 16
+ROWS = NUM_BINS // BANDS
+SHINGLE_WORDS = 4
+EMPTY_BIN = 0xFFFFFFFF
+
+DEFAULT_THRESHOLD = 0.8   # estimated Jaccard similarity of description shingles
+DEFAULT_RETENTION_DAYS = 30
+
+_MASK64 = (1 << 64) - 1
+_MIX = 0x9E3779B97F4A7C15
+_BIN_SHIFT = 64 - NUM_BINS.bit_length() + 1
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+TITLE_NOISE_RE = re.compile(r"\([^)]*\)|\b20\d\d\b|\b(?:summer|fall|autumn|winter|spring)\b")
+
+
+def norm_company(s: str) -> str:
+    return " ".join(TOKEN_RE.findall((s or "").lower()))
+
+
+def norm_title(s: str) -> str:
+    """Title without season/year/parenthesized qualifiers ('Intern (Summer 2027)' == 'Intern')."""
+    return " ".join(TOKEN_RE.findall(TITLE_NOISE_RE.sub(" ", (s or "").lower())))
+
+
+def signature(text: str):
+    """
+    MinHash signature (NUM_BINS ints) of the word shingles of text, or None when the
+    text is too short to shingle. Uses crc32 so signatures are stable across processes.
+    """
+    tokens = [zlib.crc32(t.encode("utf-8")) for t in TOKEN_RE.findall((text or "").lower())]
+    if len(tokens) < SHINGLE_WORDS:
+        return None
+    sig = [EMPTY_BIN] * NUM_BINS
+    for i in range(len(tokens) - SHINGLE_WORDS + 1):
+        h = tokens[i]
+        for t in tokens[i + 1:i + SHINGLE_WORDS]:
+            h = (h * 1000003) ^ t
+        h = (h * _MIX) & _MASK64
+        b = h >> _BIN_SHIFT
+        v = h & 0xFFFFFFFE  # never equal to EMPTY_BIN
+        if v < sig[b]:
+            sig[b] = v
+    return sig
+
+
+def similarity(a, b) -> float:
+    """Estimated Jaccard similarity: share of equal bins among bins filled in either."""
+    same = filled = 0
+    for x, y in zip(a, b):
+        if x == EMPTY_BIN and y == EMPTY_BIN:
+            continue
+        filled += 1
+        if x == y:
+            same += 1
+    return same / filled if filled else 0.0
+
+
+def band_keys(company: str, sig):
+    """LSH bucket keys; only postings of the same company can collide."""
+    return [(company, i, tuple(sig[i * ROWS:(i + 1) * ROWS])) for i in range(BANDS)]
+
+
+def _pack(sig) -> str:
+    return "".join(f"{v:08x}" for v in sig)
+
+
+def _unpack(s: str):
+    return [int(s[i:i + 8], 16) for i in range(0, len(s), 8)]
+
+
+class DedupIndex:
+    """
+    Persistent LSH index of recently seen postings (data/dedup_index.json), so a posting
+    re-listed under a new id (or on another board) joins the group of the earlier one.
+
+    Entry per job id: packed signature, normalized company/title, dup_group,
+    job fingerprint (signature is reused while it is unchanged) and first/last seen dates.
+    """
+
+    def __init__(self, path: str = INDEX_PATH):
+        self.path = path
+        self.entries = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            return {}
+        if not isinstance(data, dict) or data.get("bins") != NUM_BINS:
+            return {}
+        return {k: v for k, v in (data.get("jobs") or {}).items() if isinstance(v, dict) and v.get("sig")}
+
+    def save(self, today_str: str, retention_days: int = DEFAULT_RETENTION_DAYS) -> None:
+        cutoff = (date.fromisoformat(today_str) - timedelta(days=retention_days)).isoformat()
+        jobs = {k: v for k, v in self.entries.items() if (v.get("last_seen") or "") >= cutoff}
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"bins": NUM_BINS, "jobs": jobs}, f, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp, self.path)
+
+    def assign(self, jobs, today_str: str, threshold: float = DEFAULT_THRESHOLD) -> dict:
+        """
+        Tag every job with `dup_group` (the id of the group's earliest posting; its own id
+        when it has no near-duplicate). Duplicates share company, normalized title and have
+        description similarity >= threshold. Returns {"groups", "duplicates"} counts.
+        """
+        current = {}
+        for j in jobs:
+            jid = j.get("id")
+            if not jid:
+                continue
+            prev = self.entries.get(jid) or {}
+            if prev.get("fp") and prev.get("fp") == j.get("fingerprint"):
+                sig = _unpack(prev["sig"])
+            else:
+                sig = signature(j.get("content_plain") or j.get("content_text") or "")
+            entry = {
+                "company": norm_company(j.get("company")),
+                "title": norm_title(j.get("title")),
+                "fp": j.get("fingerprint"),
+                "group": prev.get("group"),
+                "first_seen": prev.get("first_seen") or today_str,
+                "last_seen": today_str,
+            }
+            current[jid] = (entry, sig)
+
+        # Candidates via LSH buckets over previous entries + this run
+        sigs = {k: _unpack(v["sig"]) for k, v in self.entries.items() if k not in current}
+        meta = {k: v for k, v in self.entries.items() if k not in current}
+        for jid, (entry, sig) in current.items():
+            if sig is not None:
+                sigs[jid] = sig
+                meta[jid] = entry
+        buckets = {}
+        for jid, sig in sigs.items():
+            for key in band_keys(meta[jid]["company"], sig):
+                buckets.setdefault(key, []).append(jid)
+
+        parent = {}
+
+        def find(x):
+            while parent.get(x, x) != x:
+                parent[x] = parent.get(parent[x], parent[x])
+                x = parent[x]
+            return x
+
+        for jid, (entry, sig) in current.items():
+            if sig is None:
+                continue
+            checked = set()
+            for key in band_keys(entry["company"], sig):
+                for other in buckets.get(key, ()):
+                    if other == jid or other in checked:
+                        continue
+                    checked.add(other)
+                    if meta[other]["title"] != entry["title"]:
+                        continue
+                    if similarity(sig, sigs[other]) >= threshold:
+                        ra, rb = find(jid), find(other)
+                        parent.setdefault(rb, rb)
+                        if ra != rb:
+                            parent[ra] = rb
+
+        # Group id: a singleton is its own group; otherwise the stored group of the earliest
+        # member (keeps ids stable across runs), else the earliest member's id
+        def info(x):
+            return meta.get(x) or current[x][0]
+
+        members = {}
+        for jid in set(parent) | set(current):
+            members.setdefault(find(jid), []).append(jid)
+        group_of = {}
+        for ids in members.values():
+            ids.sort(key=lambda x: (info(x).get("first_seen") or "", x))
+            gid = ids[0]
+            if len(ids) > 1:
+                gid = next((info(x)["group"] for x in ids if info(x).get("group")), ids[0])
+            for x in ids:
+                group_of[x] = gid
+
+        for j in jobs:
+            jid = j.get("id")
+            if jid in current:
+                j["dup_group"] = group_of.get(jid, jid)
+
+        for jid, (entry, sig) in current.items():
+            if sig is None:
+                self.entries.pop(jid, None)
+                continue
+            entry["group"] = group_of.get(jid, jid)
+            entry["sig"] = _pack(sig)
+            self.entries[jid] = entry
+        for jid, gid in group_of.items():
+            if jid not in current and jid in self.entries:
+                self.entries[jid]["group"] = gid
+
+        groups = {j.get("dup_group") for j in jobs if j.get("dup_group")}
+        return {"groups": len(groups), "duplicates": len(current) - len(groups)}
+
+
+def group_jobs(jobs):
+    """
+    [(representative, [duplicates...])] in input order: the first job of each dup_group
+    stands for the group. Jobs without dup_group are their own group.
+    """
+    out = []
+    pos = {}
+    for j in jobs:
+        gid = j.get("dup_group") or j.get("id")
+        if gid and gid in pos:
+            out[pos[gid]][1].append(j)
+            continue
+        if gid:
+            pos[gid] = len(out)
+        out.append((j, []))
+    return out
+
+
+def duplicate_refs(dups):
+    """Short references to the other postings of a group (for scored/triage outputs)."""
+    return [
+        {"id": d.get("id"), "source": d.get("source"), "location": d.get("location"), "url": d.get("url")}
+        for d in dups
+    ]
@@ -0,0 +1,93 @@
+import gzip
+import json
+import os
+from collections import Counter
+
+DROPPED_SAMPLE_SIZE = 50
+
+# Reasons that depend on the other jobs in the run, not on the posting (never cached)
+RUN_REASONS = ("company_cap",)
+
+
+class DropStats:
+    """
+    What apply_filters dropped, aggregated while it streams: exact counts per
+    (reason, company, source), the first DROPPED_SAMPLE_SIZE drops (the `dropped_sample`
+    shape: id, reason, title, company) and, with keep_verdicts, id -> content drop reason
+    for the parse cache. Full per-posting detail only goes to the optional gzip NDJSON
+    side file (detail_path), one JSON object per line.
+
+    drops = DropStats(detail_path="data/dropped.ndjson.gz")
+    kept, drops = apply_filters(jobs, filters, drops=drops)
+    drops.close()
+    """
+
+    def __init__(self, detail_path: str = None, keep_verdicts: bool = False, sample_size: int = DROPPED_SAMPLE_SIZE):
+        self.total = 0
+        self.counts = Counter()  # (reason, company, source) -> drops
+        self.sample = []
+        self.sample_size = sample_size
+        self.verdicts = {} if keep_verdicts else None
+        self.detail_path = detail_path
+        self._detail = None
+        if detail_path:
+            os.makedirs(os.path.dirname(os.path.abspath(detail_path)), exist_ok=True)
+            self._detail = gzip.open(detail_path + ".tmp", "wt", encoding="utf-8", compresslevel=6)
+
+    def add(self, job: dict, reason: str, title: str) -> None:
+        self.total += 1
+        company = job.get("company")
+        source = job.get("source")
+        self.counts[(reason, company or "unknown", source or "unknown")] += 1
+        if len(self.sample) < self.sample_size:
+            self.sample.append({"id": job.get("id"), "reason": reason, "title": title, "company": company})
+        if self.verdicts is not None and job.get("id") and reason not in RUN_REASONS:
+            self.verdicts[job["id"]] = reason
+        if self._detail is not None:
+            rec = {
+                "id": job.get("id"), "reason": reason, "title": title, "company": company, "source": source,
+                "location": job.get("location"), "url": job.get("url"),
+            }
+            self._detail.write(json.dumps(rec, ensure_ascii=False) + "\n")
+
+    def __len__(self) -> int:
+        return self.total
+
+    def _totals(self, i: int) -> dict:
+        c = Counter()
+        for key, n in self.counts.items():
+            c[key[i]] += n
+        return dict(sorted(c.items(), key=lambda x: (-x[1], x[0])))
+
+    def by_reason(self) -> dict:
+        return self._totals(0)
+
+    def by_company(self) -> dict:
+        return self._totals(1)
+
+    def by_source(self) -> dict:
+        return self._totals(2)
+
+    def summary(self) -> dict:
+        """The `dropped` block of jobs.json."""
+        return {
+            "total": self.total,
+            "by_reason": self.by_reason(),
+            "by_company": self.by_company(),
+            "by_source": self.by_source(),
+            "detail_file": os.path.basename(self.detail_path) if self.detail_path else None,
+        }
+
+    def rows(self):
+        """One dict per (reason, company, source) with its count, sorted."""
+        return [
+            {"reason": r, "company": c, "source": s, "count": n}
+            for (r, c, s), n in sorted(self.counts.items())
+        ]
+
+    def close(self) -> None:
+        """Finish the side file (it replaces the previous run's only once complete)."""
+        if self._detail is not None:
+            self._detail.close()
+            self._detail = None
+            os.replace(self.detail_path + ".tmp", self.detail_path)
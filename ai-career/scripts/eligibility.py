@@ -0,0 +1,394 @@
+import re
+
+# Bump when a rule or what assess() returns changes (invalidates the triage cache)
+RULESET_VERSION = 1
+
+# ---- rules (phrases are lowercase; a space matches any run of whitespace) ----
+
+CLEARANCE_NEG = [
+    "no clearance required",
+    "no security clearance required",
+    "security clearance not required",
+    "clearance is not required",
+    "clearance not required",
+    "do not require a security clearance",
+    "does not require a security clearance",
+]
+
+CLEARANCE_POS = [
+    "ts/sci",
+    "ts-sci",
+    "top secret",
+    "secret clearance",
+    "active security clearance",
+    "current security clearance",
+    "must have a security clearance",
+    "must have security clearance",
+    "ability to obtain a security clearance",
+    "able to obtain a security clearance",
+    "eligible for a security clearance",
+    "eligible for security clearance",
+]
+
+CLEARANCE_WEAK = [
+    "security clearance",
+    "clearance",
+    "ts/sci",
+    "top secret",
+]
+
+SPONSORSHIP_NEG = [
+    "no visa sponsorship",
+    "no sponsorship",
+    "unable to sponsor",
+    "not able to sponsor",
+    "cannot sponsor",
+    "can not sponsor",
+    "will not sponsor",
+    "does not sponsor",
+    "do not sponsor",
+    "not provide sponsorship",
+    "not provide visa sponsorship",
+    "not offer sponsorship",
+    "not offer visa sponsorship",
+    "sponsorship is not available",
+    "sponsorship not available",
+    "without sponsorship",
+    "without the need for sponsorship",
+    "without requiring sponsorship",
+]
+
+SPONSORSHIP_POS = [
+    "visa sponsorship available",
+    "visa sponsorship is available",
+    "sponsorship is available",
+    "will sponsor",
+    "offer visa sponsorship",
+    "provide visa sponsorship",
+]
+
+# Anchor for the citizenship context windows
+CITIZEN_TERM = "citizen"
+CONTEXT_WINDOW = 90
+
+CITIZEN_NEG_RE = re.compile("|".join([
+    r"\bcitizenship\s+not\s+required\b",
+    r"\bnot\s+required\s+to\s+be\s+(a\s+)?(u\.s\.\s+)?citizen\b",
+]))
+CITIZEN_REQ_RE = re.compile("|".join([
+    r"\b(u\.s\.\s+)?citizen(s)?\s+only\b",
+    r"\bmust\s+be\s+(a\s+)?(u\.s\.\s+)?citizen\b",
+    r"\bcitizenship\s+(is\s+)?required\b",
+    r"\brequires?\s+(u\.s\.\s+)?citizenship\b",
+]))
+
+RULES = {
+    "clearance_neg": CLEARANCE_NEG,
+    "clearance_pos": CLEARANCE_POS,
+    "clearance_weak": CLEARANCE_WEAK,
+    "sponsorship_neg": SPONSORSHIP_NEG,
+    "sponsorship_pos": SPONSORSHIP_POS,
+    "citizen": [CITIZEN_TERM],
+}
+
+SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+")
+WS_RE = re.compile(r"\s+")
+MIN_SENTENCE = 20
+SNIPPET_CHARS = 220
+
+
+def _phrase_pattern(phrase: str) -> str:
+    return r"\s+".join(re.escape(w) for w in phrase.split(" "))
+
+
+def _words_back(s: str, i: int, n: int) -> int:
+    """Start of the word holding offset i, moved back by n more whitespace-separated words."""
+    while i > 0 and not s[i - 1].isspace():
+        i -= 1
+    for _ in range(n):
+        j = i
+        while j > 0 and s[j - 1].isspace():
+            j -= 1
+        if j == i:
+            break
+        while j > 0 and not s[j - 1].isspace():
+            j -= 1
+        i = j
+    return i
+
+
+def _words_forward(s: str, i: int, n: int) -> int:
+    """End of the word ending at or after offset i, moved on by n more words."""
+    end = len(s)
+    while i < end and not s[i].isspace():
+        i += 1
+    for _ in range(n):
+        j = i
+        while j < end and s[j].isspace():
+            j += 1
+        if j == i:
+            break
+        while j < end and not s[j].isspace():
+            j += 1
+        i = j
+    return i
+
+
+class RuleScanner:
+    """
+    Every phrase of every rule compiled into one alternation; scan() walks the text once
+    and reports each occurrence as (rule, (start, end), exact), in text order.
+
+    Every phrase contains one of a few anchor words (its longest word). The anchors are
+    found with str.find, and the alternation only runs in the few words around them, so
+    text without any rule-related word costs a handful of substring scans.
+
+    Occurrences may overlap ("top secret clearance" holds "top secret" and "secret
+    clearance"): after a match the scan resumes one character later, and phrases that are
+    prefixes of the matched one are re-checked at the same position. `exact` is False
+    when the occurrence only matches with its spaces stretched over other whitespace
+    (newlines, double spaces).
+    """
+
+    def __init__(self, rules: dict):
+        self.rules_of = {}
+        for rule, phrases in rules.items():
+            for p in phrases:
+                names = self.rules_of.setdefault(" ".join(p.lower().split()), [])
+                if rule not in names:
+                    names.append(rule)
+        # Longest first, so at any position the scan reports the longest phrase
+        keys = sorted(self.rules_of, key=lambda x: (-len(x), x))
+        self.single = {k: re.compile(_phrase_pattern(k)) for k in keys}
+        self.related = {k: [o for o in keys if o != k and k.startswith(o)] for k in keys}
+        self.any_re = re.compile("|".join(_phrase_pattern(k) for k in keys)) if keys else None
+
+        # Anchors (minimal set) and how many words a phrase reaches before/after its anchor
+        self.words_before = self.words_after = 0
+        longest = set()
+        for k in keys:
+            words = k.split(" ")
+            i = words.index(max(words, key=len))
+            longest.add(words[i])
+            self.words_before = max(self.words_before, i)
+            self.words_after = max(self.words_after, len(words) - 1 - i)
+        self.anchors = sorted(a for a in longest if not any(o != a and o in a for o in longest))
+
+    def _windows(self, lower: str):
+        """Merged [lo, hi) ranges that can hold a phrase occurrence."""
+        spans = []
+        for a in self.anchors:
+            i = lower.find(a)
+            while i >= 0:
+                spans.append((i, i + len(a)))
+                i = lower.find(a, i + 1)
+        spans.sort()
+        out = []
+        for start, end in spans:
+            lo = _words_back(lower, start, self.words_before)
+            hi = _words_forward(lower, end, self.words_after)
+            if out and lo <= out[-1][1]:
+                out[-1][1] = max(out[-1][1], hi)
+            else:
+                out.append([lo, hi])
+        return out
+
+    def scan(self, lower: str):
+        """lower: the lowercased text. Returns [(rule, (start, end), exact)]."""
+        hits = []
+        if self.any_re is None:
+            return hits
+        for lo, hi in self._windows(lower):
+            pos = lo
+            while True:
+                m = self.any_re.search(lower, pos, hi)
+                if m is None:
+                    break
+                start = m.start()
+                matched = [(" ".join(m.group(0).split()), m)]
+                for other in self.related[matched[0][0]]:
+                    mo = self.single[other].match(lower, start)
+                    if mo is not None:
+                        matched.append((other, mo))
+                for phrase, mm in matched:
+                    span = (start, mm.end())
+                    for rule in self.rules_of[phrase]:
+                        hits.append((rule, span, mm.group(0) == phrase))
+                pos = start + 1
+        return hits
+
+
+SCANNER = RuleScanner(RULES)
+
+
+# ---- evidence ----
+
+def _split_sentences(text: str):
+    if not text:
+        return []
+    t = WS_RE.sub(" ", text.strip())
+    parts = SENTENCE_BREAK_RE.split(t)
+    return [p.strip() for p in parts if len(p.strip()) >= MIN_SENTENCE]
+
+
+def _highlight_phrases(text: str, phrases):
+    out = text
+    uniq = []
+    seen = set()
+    for p in (phrases or []):
+        if not p:
+            continue
+        pl = p.lower()
+        if pl not in seen:
+            seen.add(pl)
+            uniq.append(p)
+    for ph in sorted(uniq, key=len, reverse=True):
+        out = re.sub(re.escape(ph), f"<<{ph}>>", out, flags=re.IGNORECASE)
+    return out
+
+
+def _snippet_evidence(text: str, phrases):
+    snippet = (text or "").strip().replace("\n", " ")
+    snippet = snippet[:SNIPPET_CHARS] + ("..." if len(snippet) > SNIPPET_CHARS else "")
+    return [_highlight_phrases(snippet, phrases)] if snippet else []
+
+
+def pick_evidence_sentences(text: str, phrases, max_sentences: int = 2):
+    """Scan-free fallback: the first sentences of text holding any of phrases."""
+    hits = []
+    phrases_low = [p.lower() for p in (phrases or []) if p]
+    for s in _split_sentences(text):
+        sl = s.lower()
+        if any(p in sl for p in phrases_low):
+            hits.append(_highlight_phrases(s, phrases))
+        if len(hits) >= max_sentences:
+            break
+    return hits or _snippet_evidence(text, phrases)
+
+
+def _sentence_around(s: str, x: int):
+    """(start, end) of the sentence of s holding offset x, as _split_sentences would cut it."""
+    j = x
+    start = 0
+    while j > 0:
+        k = max(s.rfind(".", 0, j), s.rfind("!", 0, j), s.rfind("?", 0, j))
+        if k < 0:
+            break
+        ws = WS_RE.match(s, k + 1)
+        if ws is not None:
+            start = ws.end()
+            break
+        j = k
+    m = SENTENCE_BREAK_RE.search(s, x)
+    return start, m.start() if m is not None else len(s)
+
+
+def evidence_from_spans(text: str, starts, phrases, max_sentences: int = 2):
+    """
+    Same result as pick_evidence_sentences(text, phrases), given the start offsets of the
+    phrases' occurrences in text: only the sentences around those offsets are cut out
+    and normalized, instead of splitting the whole text.
+    """
+    stripped = text.strip()
+    lead = len(text) - len(text.lstrip())
+
+    hits = []
+    seen = set()
+    for x in sorted(starts):
+        bounds = _sentence_around(stripped, x - lead)
+        if bounds in seen:
+            continue
+        seen.add(bounds)
+        sentence = WS_RE.sub(" ", stripped[bounds[0]:bounds[1]]).strip()
+        if len(sentence) < MIN_SENTENCE:
+            continue
+        hits.append(_highlight_phrases(sentence, phrases))
+        if len(hits) >= max_sentences:
+            break
+    return hits or _snippet_evidence(text, phrases)
+
+
+# ---- classification ----
+
+def _has_exact(hits, rule: str) -> bool:
+    return any(r == rule and exact for r, _, exact in hits)
+
+
+def _evidence(text: str, lower: str, hits, rule: str, phrases):
+    if len(lower) != len(text):
+        # Lowercasing changed offsets (rare non-ASCII case): fall back to splitting
+        return pick_evidence_sentences(text, phrases)
+    return evidence_from_spans(text, [span[0] for r, span, _ in hits if r == rule], phrases)
+
+
+def _clearance(text: str, lower: str, hits) -> dict:
+    if _has_exact(hits, "clearance_neg"):
+        return {"status": "CLEAR", "evidence": _evidence(text, lower, hits, "clearance_neg", CLEARANCE_NEG)}
+    if _has_exact(hits, "clearance_pos"):
+        return {"status": "BLOCK", "evidence": _evidence(text, lower, hits, "clearance_pos", CLEARANCE_POS)}
+    if _has_exact(hits, "clearance_weak"):
+        return {"status": "REVIEW", "evidence": _evidence(text, lower, hits, "clearance_weak", CLEARANCE_WEAK)}
+    return {"status": "NONE", "evidence": []}
+
+
+def _sponsorship(text: str, lower: str, hits) -> dict:
+    if _has_exact(hits, "sponsorship_neg"):
+        return {"status": "UNAVAILABLE", "evidence": _evidence(text, lower, hits, "sponsorship_neg", SPONSORSHIP_NEG)}
+    if _has_exact(hits, "sponsorship_pos"):
+        return {"status": "AVAILABLE", "evidence": _evidence(text, lower, hits, "sponsorship_pos", SPONSORSHIP_POS)}
+    return {"status": "NONE", "evidence": []}
+
+
+def _citizenship(lower: str, hits) -> str:
+    """REQUIRED / MENTIONED / NONE from the context window around each "citizen"."""
+    mentioned = False
+    for rule, (start, end), _ in hits:
+        if rule != "citizen":
+            continue
+        mentioned = True
+        c = lower[max(0, start - CONTEXT_WINDOW):end + CONTEXT_WINDOW]
+        if CITIZEN_NEG_RE.search(c):
+            continue
+        if CITIZEN_REQ_RE.search(c):
+            return "REQUIRED"
+    return "MENTIONED" if mentioned else "NONE"
+
+
+def _fix_clearance_spelling(text: str, lower: str):
+    # Handle misspelling clearence (same length, so offsets are unchanged)
+    if "clearence" in lower and "clearance" not in lower:
+        return re.sub(r"clearence", "clearance", text, flags=re.IGNORECASE), lower.replace("clearence", "clearance")
+    return text, lower
+
+
+def assess(text: str, sponsorship: bool = False) -> dict:
+    """
+    Eligibility signals of a posting from one scan of its text:
+      clearance:   {"status": CLEAR / BLOCK / REVIEW / NONE, "evidence": [...]}
+      citizenship: REQUIRED / MENTIONED / NONE
+      sponsorship: {"status": UNAVAILABLE / AVAILABLE / NONE, "evidence": [...]}
+                   (only with sponsorship=True; its rules are in the same scan, but the
+                   status and evidence sentences are only built on request)
+    Clearance is conservative: CLEAR wins over BLOCK to avoid false blocks.
+    """
+    none = {"status": "NONE", "evidence": []}
+    if not text:
+        out = {"clearance": dict(none), "citizenship": "NONE"}
+        if sponsorship:
+            out["sponsorship"] = dict(none)
+        return out
+    lower = text.lower()
+    fixed_text, fixed_lower = _fix_clearance_spelling(text, lower)
+    hits = SCANNER.scan(fixed_lower)
+    out = {
+        "clearance": _clearance(fixed_text, fixed_lower, hits),
+        "citizenship": _citizenship(lower, hits),
+    }
+    if sponsorship:
+        out["sponsorship"] = _sponsorship(text, lower, hits)
+    return out
+
+
+def classify_clearance(text: str) -> dict:
+    """CLEAR / BLOCK / REVIEW / NONE + evidence (plain-text highlighted)."""
+    return assess(text)["clearance"]
@@ -5,10 +5,27 @@ import sys
 import time
 import hashlib
 import html
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from urllib.request import urlopen, Request
+from urllib.parse import urlsplit
 from urllib.error import URLError, HTTPError
 
+from archive_store import compact_job
+from corpus_store import DEFAULT_FORMAT as DEFAULT_CORPUS_FORMAT, append_run as append_corpus_run, check_format
+from checkpoints import BoardCheckpoints
+from dedup import DEFAULT_RETENTION_DAYS, DEFAULT_THRESHOLD, DedupIndex
+from drop_stats import DropStats
+from filter_pipeline import FilterPipeline
+from http_cache import ResponseCache
+from http_client import HttpClient
+from json_stream import SnapshotWriter, serialize_item
+from keyword_matcher import KeywordMatcher
+from profiling import Profiler
+from state_store import open_state_store, record_seen, split_today_backlog
+from url_index import UrlIndex
+from topk import DEFAULT_TOP_K, top_k
+
 ROOT = os.path.dirname(os.path.dirname(__file__))  # ai-career/
 CONFIG_PATH = os.path.join(ROOT, "config", "targets.json")
 OUT_DIR = os.path.join(ROOT, "data")
@@ -17,6 +34,7 @@ OUT_JSON = os.path.join(OUT_DIR, "jobs.json")
 OUT_MD = os.path.join(OUT_DIR, "jobs.md")
 
 STATE_PATH = os.path.join(OUT_DIR, "state.json")
+STATE_SQLITE_PATH = os.path.join(OUT_DIR, "state.sqlite")
 
 OUT_TODAY_JSON = os.path.join(OUT_DIR, "jobs_today.json")
 OUT_TODAY_MD = os.path.join(OUT_DIR, "jobs_today.md")
@@ -25,142 +43,230 @@ OUT_BACKLOG_JSON = os.path.join(OUT_DIR, "jobs_backlog.json")
 OUT_BACKLOG_MD = os.path.join(OUT_DIR, "jobs_backlog.md")
 
 ARCHIVE_DIR = os.path.join(OUT_DIR, "archive")
+CORPUS_DIR = os.path.join(OUT_DIR, "corpus")
+ARCHIVE_BLOB_DIR = os.path.join(ARCHIVE_DIR, "blobs")
 
-UA = "ai-career-job-fetcher/0.1 (GitHub Actions)"
+HTTP_CACHE_DIR = os.path.join(OUT_DIR, "http_cache")
+PARSE_CACHE_PATH = os.path.join(OUT_DIR, "parse_cache.json")
+DROPPED_DETAIL_PATH = os.path.join(OUT_DIR, "dropped.ndjson.gz")
+CHECKPOINT_DIR = os.path.join(OUT_DIR, "checkpoints")
+DEDUP_INDEX_PATH = os.path.join(OUT_DIR, "dedup_index.json")
+URL_INDEX_PATH = os.path.join(OUT_DIR, "url_index.json")
 
+# Bump when parse_* / html_to_text output changes, to invalidate cached records
+PARSER_VERSION = 2
 
-def http_get_json(url: str):
-    req = Request(url, headers={"User-Agent": UA})
-    with urlopen(req, timeout=30) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+# Set on records built without their description (dropped last run, verdict reused)
+CONTENT_SKIPPED = "content_skipped"
 
+UA = "ai-career-job-fetcher/0.1 (GitHub Actions)"
 
-def stable_id(*parts: str) -> str:
-    h = hashlib.sha256("||".join(parts).encode("utf-8")).hexdigest()
-    return h[:16]
+# API base URLs (overridable so the fetcher can be pointed at a local stub server)
+GREENHOUSE_API = os.environ.get("AI_CAREER_GREENHOUSE_API", "https://api.greenhouse.io")
+LEVER_API = os.environ.get("AI_CAREER_LEVER_API", "https://api.lever.co")
+ASHBY_API = os.environ.get("AI_CAREER_ASHBY_API", "https://api.ashbyhq.com")
 
+# Concurrency defaults; override via "fetch" in targets.json
+DEFAULT_WORKERS = 8
+DEFAULT_RATE_LIMIT = {"rate": 2.0, "burst": 2}
+DEFAULT_HOST_RATE_LIMITS = {
+    "api.greenhouse.io": {"rate": 2.0, "burst": 2},
+    "api.lever.co": {"rate": 2.0, "burst": 2},
+    "api.ashbyhq.com": {"rate": 2.0, "burst": 2},
+}
+# Retries for 429/5xx and connection errors (exponential backoff + jitter, seconds)
+DEFAULT_RETRY = {"retries": 3, "backoff": 1.0, "max_delay": 30.0}
+# Lever postings are fetched in pages of this size (skip/limit); 0 = one request per board
+DEFAULT_LEVER_PAGE_SIZE = 100
 
-def html_to_text(s: str) -> str:
-    if not s:
-        return ""
-    s = html.unescape(s)
-    s = re.sub(r"<[^>]+>", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+# Stand-in when no profiler is passed (stages cost a no-op context manager)
+NULL_PROFILER = Profiler(enabled=False)
 
+# Config key holding the board token, per source
+BOARD_KEYS = {"greenhouse": "board_token", "lever": "lever_slug", "ashby": "job_board_name"}
 
-def _norm(s: str) -> str:
-    return (s or "").lower()
 
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second, at most `burst` stored.
+    acquire() blocks until a token is available.
+    """
 
-def _token_regex(token: str) -> re.Pattern:
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = max(float(rate), 1e-6)
+        self.capacity = max(float(burst), 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class HostRateLimiter:
     """
-    Build a safe "whole token" matcher that works for both normal tokens and hyphenated tokens.
-    Avoids false positives like:
-      - intern matching internal
-      - co-op matching co-opetition
+    One TokenBucket per host; hosts without an explicit limit share the default settings.
     """
-    tok = token.strip()
-    # Match token as a standalone "word-like" unit using lookarounds against alnum.
-    # This works for hyphenated tokens too.
-    pattern = r"(?<![A-Za-z0-9])" + re.escape(tok) + r"(?![A-Za-z0-9])"
-    return re.compile(pattern, flags=re.IGNORECASE)
 
+    def __init__(self, limits=None, default=None):
+        self.limits = dict(limits or {})
+        self.default = default or DEFAULT_RATE_LIMIT
+        self.buckets = {}
+        self.lock = threading.Lock()
 
-def contains_any(text: str, keywords) -> bool:
-    if not keywords:
-        return True
-    t = text or ""
+    def wait(self, url: str) -> None:
+        host = (urlsplit(url).hostname or "").lower()
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                cfg = self.limits.get(host) or self.default
+                bucket = TokenBucket(cfg.get("rate", DEFAULT_RATE_LIMIT["rate"]), cfg.get("burst", DEFAULT_RATE_LIMIT["burst"]))
+                self.buckets[host] = bucket
+        bucket.acquire()
 
-    for k in keywords:
-        if not (isinstance(k, str) and k.strip()):
-            continue
-        kk = k.strip()
 
-        # Phrase (has spaces) -> substring is fine
-        if " " in kk:
-            if kk.lower() in t.lower():
-                return True
-            continue
+def make_client(limiter=None, retry=None) -> HttpClient:
+    retry = dict(DEFAULT_RETRY, **(retry or {}))
+    return HttpClient(
+        UA, timeout=30, limiter=limiter,
+        retries=retry["retries"], backoff=retry["backoff"], max_delay=retry["max_delay"],
+    )
 
-        # Single token (including hyphenated like "co-op") -> whole-token match
-        if _token_regex(kk).search(t):
-            return True
 
-    return False
+_default_client = None
 
 
-def apply_filters(jobs, filters):
-    internship_any = filters.get("internship_any") or []
-    domain_any = filters.get("domain_any") or []
-    exclude_any = filters.get("exclude_any") or []
-    locations_any = filters.get("locations_any") or []
-    max_per_company = filters.get("max_jobs_per_company")
-    major_required_any = filters.get("major_required_any") or []
-    degree_required_any = filters.get("degree_required_any") or []
+def default_client() -> HttpClient:
+    global _default_client
+    if _default_client is None:
+        _default_client = make_client(HostRateLimiter(DEFAULT_HOST_RATE_LIMITS))
+    return _default_client
 
-    kept = []
-    dropped = []
-    per_company = {}
 
-    # Ashby "employmentType" strong positive signal list
-    ashby_types = filters.get("ashby_internship_types") or []
-    ashby_types = {(_norm(x)) for x in ashby_types if isinstance(x, str) and x.strip()}
+def http_get_json(url: str, client=None):
+    _, _, body = (client or default_client()).get(url)
+    return json.loads(body.decode("utf-8"))
 
-    for j in jobs:
-        title = j.get("title") or ""
-        loc = j.get("location") or ""
-        content = j.get("content_plain") or j.get("content_text") or ""
-        haystack = f"{title}\n{loc}\n{content}"
 
-        # Exclude first
-        if exclude_any and contains_any(haystack, exclude_any):
-            dropped.append({"id": j.get("id"), "reason": "excluded_keyword", "title": title, "company": j.get("company")})
-            continue
+def stable_id(*parts: str) -> str:
+    h = hashlib.sha256("||".join(parts).encode("utf-8")).hexdigest()
+    return h[:16]
 
-        # 1) Must be internship-ish
-        is_internship = False
 
-        # Strong positive signal from Ashby structured field
-        if j.get("source") == "ashby" and j.get("employment_type") and ashby_types:
-            et = _norm(str(j.get("employment_type")).strip())
-            if et in ashby_types:
-                is_internship = True
+# Tags that start a new line in the plain-text rendering; every other tag becomes a space
+BLOCK_TAGS = frozenset((
+    "p", "div", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6", "br", "hr", "tr", "table",
+    "dl", "dt", "dd", "section", "article", "header", "footer", "blockquote", "pre",
+))
 
-        # Keyword-based fallback (A: only check TITLE)
-        if not is_internship and internship_any:
-            if contains_any(title, internship_any):
-                is_internship = True
 
-        if not is_internship:
-            dropped.append({"id": j.get("id"), "reason": "not_internship", "title": title, "company": j.get("company")})
-            continue
+def _tag_separator(tag: str) -> str:
+    """What a tag (the text between < and >) becomes in the plain text."""
+    name = tag.split(None, 1)
+    return "\n" if name and name[0].strip("/").lower() in BLOCK_TAGS else " "
 
-        # Optional: require degree/major keywords (if provided)
-        if degree_required_any and not contains_any(haystack, degree_required_any):
-            dropped.append({"id": j.get("id"), "reason": "degree_mismatch", "title": title, "company": j.get("company")})
-            continue
 
-        if major_required_any and not contains_any(haystack, major_required_any):
-            dropped.append({"id": j.get("id"), "reason": "major_mismatch", "title": title, "company": j.get("company")})
-            continue
+def html_to_text(s: str) -> str:
+    """
+    Greenhouse `content` is HTML escaped once more (&lt;p&gt;...). Returns one line per
+    block (paragraph, list item, heading, <br>), whitespace collapsed, empty lines dropped.
+
+    The outer escaping only uses the five XML entities, so it is undone with str.replace.
+    The markup is then tokenized in one pass: split at "<", each piece is a tag up to ">"
+    followed by text; a block tag becomes a newline, any other tag a space. A body repeats
+    the same few tags, so each distinct tag is classified once. Entities inside the text
+    (&nbsp; ...) are decoded after the tags are gone, so a decoded "<" can never open a tag.
+    """
+    if not s:
+        return ""
+    if "&lt;" in s:
+        s = s.replace("&lt;", "<").replace("&gt;", ">").replace("&quot;", '"').replace("&#39;", "'").replace("&amp;", "&")
+    if "<" in s:
+        pieces = s.split("<")
+        out = [pieces[0]]
+        append = out.append
+        seps = {}
+        for piece in pieces[1:]:
+            end = piece.find(">")
+            if end < 0:
+                # A "<" that never closes is text
+                append("<")
+                append(piece)
+                continue
+            tag = piece[:end]
+            sep = seps.get(tag)
+            if sep is None:
+                sep = seps[tag] = _tag_separator(tag)
+            append(sep)
+            append(piece[end + 1:])
+        s = "".join(out)
+    if "&" in s:
+        s = html.unescape(s)
+    # str.split() collapses all (unicode) whitespace in C; much cheaper than re.sub(r"\s+")
+    lines = []
+    for line in s.split("\n"):
+        words = line.split()
+        if words:
+            lines.append(" ".join(words))
+    return "\n".join(lines)
 
-        # 2) Must match domain direction
-        if domain_any and not contains_any(haystack, domain_any):
-            dropped.append({"id": j.get("id"), "reason": "domain_mismatch", "title": title, "company": j.get("company")})
-            continue
 
-        # Optional location filter
-        if locations_any and not contains_any(loc, locations_any):
-            dropped.append({"id": j.get("id"), "reason": "location_mismatch", "title": title, "company": j.get("company")})
+def contains_any(text: str, keywords) -> bool:
+    """
+    Phrases (with spaces) match as substrings; single tokens (incl. hyphenated like "co-op")
+    match as whole tokens, so "intern" does not match "internal".
+    For repeated checks against the same list, build a KeywordMatcher once instead.
+    """
+    return KeywordMatcher(keywords).search(text)
+
+
+def apply_filters(jobs, filters, known=None, drops=None, pipeline=None):
+    """
+    Returns (kept, drops). `known` maps job id -> cached content verdict
+    ("kept" or a drop reason); those jobs skip the keyword checks. Dropped jobs are
+    counted into `drops` (a DropStats; a fresh one if not given) as they are rejected.
+    Content checks run as the stages of `pipeline` (a FilterPipeline built from `filters`
+    if not given; its per-stage counters are updated); the per-company cap runs last.
+    """
+    # Stages compile their keyword lists once per run (one regex scan per list per job)
+    if pipeline is None:
+        pipeline = FilterPipeline(filters, matcher=KeywordMatcher)
+    max_per_company = filters.get("max_jobs_per_company")
+
+    kept = []
+    dropped = drops if drops is not None else DropStats()
+    per_company = {}
+
+    for j in jobs:
+        title = j.get("title") or ""
+        loc = j.get("location") or ""
+
+        # Incremental mode: unchanged postings keep last run's verdict
+        verdict = known.get(j.get("id")) if known else None
+        if verdict is None:
+            verdict = pipeline.verdict(j, title, loc)
+
+        if verdict != "kept":
+            dropped.add(j, verdict, title)
             continue
 
         # Cap per company
         if max_per_company:
             c = j.get("company") or "unknown"
             per_company.setdefault(c, 0)
-            if per_company[c] >= int(max_per_company):
-                dropped.append({"id": j.get("id"), "reason": "company_cap", "title": title, "company": j.get("company")})
+            capped = per_company[c] >= int(max_per_company)
+            pipeline.count_cap(capped)
+            if capped:
+                dropped.add(j, "company_cap", title)
                 continue
             per_company[c] += 1
 
@@ -169,111 +275,431 @@ def apply_filters(jobs, filters):
     return kept, dropped
 
 
-def load_state(path: str) -> dict:
+def filters_cache_key(filters: dict) -> str:
+    """Key for cached parse output / filter verdicts: changes with the filters or the parser."""
+    blob = json.dumps({"filters": filters, "parser": PARSER_VERSION}, sort_keys=True)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def load_parse_cache(path: str, key: str) -> dict:
+    """Per-job {fp, verdict} from the previous run; empty if filters or parser changed."""
     try:
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
-            if isinstance(data, dict) and "jobs" in data and isinstance(data["jobs"], dict):
-                return data
+        if isinstance(data, dict) and data.get("key") == key and isinstance(data.get("jobs"), dict):
+            return data["jobs"]
     except FileNotFoundError:
         pass
     except Exception:
         pass
-    return {"version": 1, "jobs": {}}
+    return {}
 
 
-def save_state(path: str, state: dict) -> None:
+def save_parse_cache(path: str, key: str, jobs, verdicts: dict) -> None:
+    # Content verdicts only (DropStats.verdicts leaves out company_cap, which depends on the
+    # other jobs and is re-applied every run)
+    entries = {}
+    for j in jobs:
+        jid = j.get("id")
+        if not jid or not j.get("fingerprint"):
+            continue
+        entries[jid] = {"fp": j["fingerprint"], "verdict": verdicts.get(jid) or "kept"}
     tmp = path + ".tmp"
     with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(state, f, ensure_ascii=False, indent=2)
+        json.dump({"key": key, "jobs": entries}, f, ensure_ascii=False)
     os.replace(tmp, path)
 
 
+def load_previous_records(path: str) -> dict:
+    """Normalized records from the previous jobs.json, by id."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception:
+        return {}
+    return {j["id"]: j for j in (data.get("jobs") or []) if isinstance(j, dict) and j.get("id")}
+
+
 def utc_date_str(dt: datetime) -> str:
     return dt.astimezone(timezone.utc).strftime("%Y-%m-%d")
 
 
-def fetch_greenhouse(board_token: str, company: str):
-    url = f"https://api.greenhouse.io/v1/boards/{board_token}/jobs?content=true"
-    data = http_get_json(url)
+class FetchContext:
+    """
+    Per-run fetch state shared by all workers: HTTP client, response cache,
+    (in incremental mode) the parse-reuse index, the per-board checkpoints
+    and the stage profiler.
+    """
+
+    def __init__(self, client=None, cache=None, reuse=None, checkpoints=None,
+                 lever_page_size: int = DEFAULT_LEVER_PAGE_SIZE, profiler=None):
+        self.client = client or default_client()
+        self.cache = cache
+        self.reuse = reuse
+        self.checkpoints = checkpoints
+        self.lever_page_size = lever_page_size
+        self.profiler = profiler or NULL_PROFILER
+
+
+class PartialFetch(Exception):
+    """A paginated board failed midway; `jobs` holds the pages fetched before `cause`."""
+
+    def __init__(self, jobs, cause):
+        super().__init__(repr(cause))
+        self.jobs = jobs
+        self.cause = cause
+
+
+def _complete(jobs, reuse) -> bool:
+    """
+    True when cached jobs can be used as-is: every record built without its description
+    still has a matching cached drop verdict (otherwise it would be filtered, and maybe
+    kept, with an empty description).
+    """
+    for j in jobs:
+        if j.get(CONTENT_SKIPPED):
+            if reuse is None or reuse.lookup(j.get("id"), j.get("fingerprint")) != (None, True):
+                return False
+    return True
+
+
+def fetch_board(url: str, parse, source: str, ctx: FetchContext):
+    """
+    Download a board and parse it into jobs, revalidating against the response cache.
+    On 304 the previously parsed jobs are reused as-is, unless some of them were stored
+    without their description and their cached verdict is gone; then the cached body is
+    parsed again (or the board refetched when there is none).
+    """
+    cache = ctx.cache
+    prof = ctx.profiler
+    entry = cache.get(url) if cache is not None else None
+    with prof.stage("network") as st:
+        status, headers, body = ctx.client.get(url, headers=ResponseCache.validators(entry), tag=source)
+        if status == 304 and entry is None:
+            # Unsolicited 304 (no cached entry): refetch unconditionally
+            status, headers, body = ctx.client.get(url, tag=source)
+        st["bytes"] = len(body)
+    if status == 304 and entry is not None:
+        if _complete(entry["jobs"], ctx.reuse):
+            cache.record(hit=True)
+            return entry["jobs"]
+        cached_body = cache.body(url)
+        if cached_body is not None:
+            cache.record(hit=True)
+            body = cached_body
+            headers = {"ETag": entry.get("etag"), "Last-Modified": entry.get("last_modified")}
+        else:
+            with prof.stage("network") as st:
+                status, headers, body = ctx.client.get(url, tag=source)
+                st["bytes"] = len(body)
+
+    with prof.stage("json_decode") as st:
+        st["bytes"] = len(body)
+        data = json.loads(body.decode("utf-8"))
+    with prof.stage("parse"):
+        jobs = parse(data)
+    if cache is not None:
+        if status != 304:
+            cache.record(hit=False)
+        # Keep the body while any record lacks its description (see _complete)
+        keep_body = body if any(j.get(CONTENT_SKIPPED) for j in jobs) else None
+        with prof.stage("cache_store"):
+            cache.store(url, headers.get("ETag"), headers.get("Last-Modified"), jobs, body=keep_body)
+    return jobs
+
+
+def posting_fingerprint(raw: dict) -> str:
+    """Hash of the raw posting as returned by the board API (covers updated_at and content)."""
+    blob = json.dumps(raw, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+class ParseReuse:
+    """
+    Incremental mode: reuse normalized records for postings whose raw fingerprint
+    is unchanged since the previous run.
+
+    - unchanged + kept last time    -> previous record from jobs.json
+    - unchanged + dropped last time -> record built without HTML-to-text (content_plain empty);
+                                       filtering is skipped via the cached verdict
+    - new / changed                 -> full parse
+    """
+
+    def __init__(self, cache_entries: dict, prev_records: dict):
+        self.entries = cache_entries
+        self.prev = prev_records
+        self.parsed_ids = set()
+        self.lock = threading.Lock()
+
+    def lookup(self, job_id: str, fp: str):
+        """Return (prior_record, skip_content)."""
+        entry = self.entries.get(job_id)
+        if not isinstance(entry, dict) or entry.get("fp") != fp:
+            return None, False
+        if entry.get("verdict") == "kept":
+            return self.prev.get(job_id), False
+        return None, True
+
+    def mark_parsed(self, job_id: str) -> None:
+        with self.lock:
+            self.parsed_ids.add(job_id)
+
+    def verdicts_for(self, jobs) -> dict:
+        """Cached filter verdicts for jobs whose fingerprint still matches."""
+        out = {}
+        for j in jobs:
+            entry = self.entries.get(j.get("id"))
+            if isinstance(entry, dict) and entry.get("fp") and entry.get("fp") == j.get("fingerprint"):
+                out[j["id"]] = entry.get("verdict")
+        return out
+
+    def stats(self, jobs) -> dict:
+        ids = [j.get("id") for j in jobs]
+        parsed = sum(1 for x in ids if x in self.parsed_ids)
+        return {
+            "parsed": parsed,
+            "reused": len(ids) - parsed,
+            "new": sum(1 for x in ids if x not in self.entries),
+        }
+
+
+def _reuse_or_parse(ctx, job_id: str, raw: dict, build):
+    """
+    build(skip_content) -> record. Returns the prior record when it can be reused.
+    """
+    fp = posting_fingerprint(raw)
+    reuse = ctx.reuse if ctx is not None else None
+    skip_content = False
+    if reuse is not None:
+        prior, skip_content = reuse.lookup(job_id, fp)
+        if prior is not None:
+            return prior
+        if not skip_content:
+            reuse.mark_parsed(job_id)
+    rec = build(skip_content)
+    rec["fingerprint"] = fp
+    if skip_content:
+        rec[CONTENT_SKIPPED] = True
+    return rec
+
+
+def fetch_greenhouse(board_token: str, company: str, ctx: FetchContext = None):
+    ctx = ctx or FetchContext()
+    url = f"{GREENHOUSE_API}/v1/boards/{board_token}/jobs?content=true"
+    return fetch_board(url, lambda data: parse_greenhouse(data, board_token, company, ctx), "greenhouse", ctx)
+
+
+def parse_greenhouse(data, board_token: str, company: str, ctx: FetchContext = None):
+    prof = ctx.profiler if ctx is not None else NULL_PROFILER
     jobs = []
     for j in data.get("jobs", []):
         job_id = stable_id("greenhouse", board_token, str(j.get("id", "")), j.get("absolute_url", ""))
-        jobs.append({
-            "id": job_id,
-            "source": "greenhouse",
-            "company": company,
-            "title": j.get("title"),
-            "location": (j.get("location") or {}).get("name"),
-            "url": j.get("absolute_url"),
-            "updated_at": j.get("updated_at"),
-            "created_at": j.get("created_at"),
-            "departments": [d.get("name") for d in (j.get("departments") or []) if isinstance(d, dict)],
-            "content_text": (j.get("content") or "").strip(),
-            "content_plain": html_to_text((j.get("content") or "").strip())
-        })
+
+        def build(skip_content, j=j, job_id=job_id):
+            content = (j.get("content") or "").strip()
+            plain = ""
+            if not skip_content:
+                with prof.stage("html_to_text", trace=False) as st:
+                    st["bytes"] = len(content)
+                    plain = html_to_text(content)
+            return {
+                "id": job_id,
+                "source": "greenhouse",
+                "company": company,
+                "title": j.get("title"),
+                "location": (j.get("location") or {}).get("name"),
+                "url": j.get("absolute_url"),
+                "updated_at": j.get("updated_at"),
+                "created_at": j.get("created_at"),
+                "departments": [d.get("name") for d in (j.get("departments") or []) if isinstance(d, dict)],
+                "content_text": content,
+                "content_plain": plain
+            }
+
+        jobs.append(_reuse_or_parse(ctx, job_id, j, build))
+    return jobs
+
+
+def fetch_lever(lever_slug: str, company: str, ctx: FetchContext = None, checkpoint: str = None):
+    """
+    Lever postings in pages of ctx.lever_page_size (skip/limit). With a checkpoint name,
+    progress is saved after every page and a crashed run resumes at the next page.
+    """
+    ctx = ctx or FetchContext()
+    parse = lambda data: parse_lever(data, lever_slug, company, ctx)
+    limit = int(ctx.lever_page_size or 0)
+    if limit <= 0:
+        return fetch_board(f"{LEVER_API}/v0/postings/{lever_slug}?mode=json", parse, "lever", ctx)
+
+    cps = ctx.checkpoints if checkpoint else None
+    jobs = []
+    skip = 0
+    saved = cps.load(checkpoint) if cps is not None else None
+    if saved is not None and not saved.get("done"):
+        jobs = saved["jobs"]
+        skip = int(saved.get("skip") or 0)
+
+    seen = {j.get("id") for j in jobs}
+    while True:
+        url = f"{LEVER_API}/v0/postings/{lever_slug}?mode=json&skip={skip}&limit={limit}"
+        try:
+            page = fetch_board(url, parse, "lever", ctx)
+        except (HTTPError, URLError, TimeoutError) as e:
+            if jobs:
+                raise PartialFetch(jobs, e)
+            raise
+        # Postings added while paging shift later pages; drop the repeats
+        fresh = [j for j in page if j.get("id") not in seen]
+        seen.update(j.get("id") for j in fresh)
+        jobs.extend(fresh)
+        skip += len(page)
+        # A short page is the last one; no new ids means the server ignored skip
+        if len(page) < limit or not fresh:
+            break
+        if cps is not None:
+            cps.save(checkpoint, jobs, done=False, skip=skip)
     return jobs
 
 
-def fetch_lever(lever_slug: str, company: str):
-    url = f"https://api.lever.co/v0/postings/{lever_slug}?mode=json"
-    data = http_get_json(url)
+def parse_lever(data, lever_slug: str, company: str, ctx: FetchContext = None):
     jobs = []
     if isinstance(data, list):
         for j in data:
             job_id = stable_id("lever", lever_slug, str(j.get("id", "")), j.get("hostedUrl", ""))
-            categories = j.get("categories") or {}
-            jobs.append({
-                "id": job_id,
-                "source": "lever",
-                "company": company,
-                "title": j.get("text"),
-                "location": j.get("categories", {}).get("location"),
-                "url": j.get("hostedUrl"),
-                "updated_at": j.get("createdAt"),
-                "created_at": j.get("createdAt"),
-                "departments": [categories.get("team")] if categories.get("team") else [],
-                "content_text": (j.get("descriptionPlain") or "").strip(),
-                "content_plain": (j.get("descriptionPlain") or "").strip()
-            })
+
+            def build(skip_content, j=j, job_id=job_id):
+                categories = j.get("categories") or {}
+                return {
+                    "id": job_id,
+                    "source": "lever",
+                    "company": company,
+                    "title": j.get("text"),
+                    "location": j.get("categories", {}).get("location"),
+                    "url": j.get("hostedUrl"),
+                    "updated_at": j.get("createdAt"),
+                    "created_at": j.get("createdAt"),
+                    "departments": [categories.get("team")] if categories.get("team") else [],
+                    "content_text": (j.get("descriptionPlain") or "").strip(),
+                    "content_plain": "" if skip_content else (j.get("descriptionPlain") or "").strip()
+                }
+
+            jobs.append(_reuse_or_parse(ctx, job_id, j, build))
     return jobs
 
 
-def fetch_ashby(job_board_name: str, company: str):
-    url = f"https://api.ashbyhq.com/posting-api/job-board/{job_board_name}?includeCompensation=false"
-    data = http_get_json(url)
+def fetch_ashby(job_board_name: str, company: str, ctx: FetchContext = None):
+    ctx = ctx or FetchContext()
+    url = f"{ASHBY_API}/posting-api/job-board/{job_board_name}?includeCompensation=false"
+    return fetch_board(url, lambda data: parse_ashby(data, job_board_name, company, ctx), "ashby", ctx)
+
 
+def parse_ashby(data, job_board_name: str, company: str, ctx: FetchContext = None):
     jobs = []
     for j in data.get("jobs", []) or []:
         job_url = j.get("jobUrl") or ""
         apply_url = j.get("applyUrl") or ""
         title = j.get("title")
-        location = j.get("location")
-        published_at = j.get("publishedAt")
-        employment_type = j.get("employmentType")
-        dept = j.get("department")
-        team = j.get("team")
 
         job_id = stable_id("ashby", job_board_name, title or "", job_url, apply_url)
 
-        jobs.append({
-            "id": job_id,
-            "source": "ashby",
-            "company": company,
-            "title": title,
-            "location": location,
-            "url": apply_url or job_url,
-            "updated_at": published_at,
-            "created_at": published_at,
-            "departments": [x for x in [dept, team] if x],
-            "employment_type": employment_type,
-            "content_text": (j.get("descriptionHtml") or "").strip(),
-            "content_plain": (j.get("descriptionPlain") or "").strip()
-        })
+        def build(skip_content, j=j, job_id=job_id, title=title, job_url=job_url, apply_url=apply_url):
+            published_at = j.get("publishedAt")
+            dept = j.get("department")
+            team = j.get("team")
+            return {
+                "id": job_id,
+                "source": "ashby",
+                "company": company,
+                "title": title,
+                "location": j.get("location"),
+                "url": apply_url or job_url,
+                "updated_at": published_at,
+                "created_at": published_at,
+                "departments": [x for x in [dept, team] if x],
+                "employment_type": j.get("employmentType"),
+                "content_text": (j.get("descriptionHtml") or "").strip(),
+                "content_plain": "" if skip_content else (j.get("descriptionPlain") or "").strip()
+            }
+
+        jobs.append(_reuse_or_parse(ctx, job_id, j, build))
     return jobs
 
 
-def write_md(path_md: str, title: str, jobs_list, now_utc: datetime, today_str: str, errors=None):
+def fetch_target(t: dict, ctx: FetchContext = None):
+    """
+    Fetch one target. Returns (jobs, error); error is None on success.
+    Network/config errors are reported, anything else propagates.
+    """
+    ctx = ctx or FetchContext()
+    source = t.get("source")
+    company = t.get("company") or "unknown"
+    if source not in BOARD_KEYS:
+        return [], f"Unknown source: {source} ({company})"
+    with ctx.profiler.target(f"{company} ({source})"):
+        return _fetch_board_target(t, source, company, ctx)
+
+
+def _fetch_board_target(t: dict, source: str, company: str, ctx: FetchContext):
+    try:
+        token = t[BOARD_KEYS[source]]
+
+        # Board already fetched earlier in this (crashed) run
+        cps = ctx.checkpoints
+        name = BoardCheckpoints.board_name(source, token) if cps is not None else None
+        if cps is not None:
+            saved = cps.load(name)
+            if saved is not None and saved.get("done"):
+                cps.record_resumed()
+                return saved["jobs"], None
+
+        if source == "greenhouse":
+            jobs = fetch_greenhouse(token, company, ctx)
+        elif source == "lever":
+            jobs = fetch_lever(token, company, ctx, checkpoint=name)
+        else:
+            jobs = fetch_ashby(token, company, ctx)
+
+        if cps is not None:
+            cps.save(name, jobs)
+        return jobs, None
+    except PartialFetch as e:
+        return e.jobs, f"{company} ({source}) partial: {len(e.jobs)} job(s), then failed: {repr(e.cause)}"
+    except (HTTPError, URLError, KeyError, TimeoutError) as e:
+        return [], f"{company} ({source}) failed: {repr(e)}"
+
+
+def fetch_all(targets, workers: int = DEFAULT_WORKERS, ctx: FetchContext = None):
+    """
+    Fetch all targets concurrently. Jobs and errors are returned in target order,
+    so output is identical regardless of completion order.
+    """
+    targets = list(targets or [])
+    ctx = ctx or FetchContext()
+    workers = max(1, min(int(workers or 1), len(targets) or 1))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(fetch_target, t, ctx) for t in targets]
+        results = [f.result() for f in futures]
+
+    all_jobs = []
+    errors = []
+    for jobs, err in results:
+        all_jobs.extend(jobs)
+        if err:
+            errors.append(err)
+    return all_jobs, errors
+
+
+def posted_sort_key(j) -> str:
+    """Newest first: updated_at, else created_at (ISO strings)."""
+    v = j.get("updated_at") or j.get("created_at") or ""
+    return str(v)
+
+
+def write_md(path_md: str, title: str, jobs_list, now_utc: datetime, today_str: str, errors=None, limit: int = DEFAULT_TOP_K):
+    """Lists the `limit` newest jobs (heap selection; jobs_list need not be sorted)."""
     lines = []
     lines.append(f"# {title}\n")
     lines.append(f"Generated at (UTC): {now_utc.isoformat()}\n")
@@ -287,7 +713,7 @@ def write_md(path_md: str, title: str, jobs_list, now_utc: datetime, today_str:
         lines.append("\n")
 
     lines.append("## Jobs\n")
-    for j in jobs_list[:200]:
+    for j in top_k(jobs_list, limit, posted_sort_key):
         title_j = j.get("title") or "Untitled"
         company = j.get("company") or "unknown"
         loc = j.get("location") or "Unknown location"
@@ -299,42 +725,108 @@ def write_md(path_md: str, title: str, jobs_list, now_utc: datetime, today_str:
         f.writelines(lines)
 
 
-def main():
-    os.makedirs(OUT_DIR, exist_ok=True)
-    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+def write_snapshots(header: dict, all_jobs, today_jobs, backlog_jobs, archive_json: str, compact: bool = False):
+    """
+    Write jobs.json, jobs_today.json, jobs_backlog.json and the daily archive in one pass:
+    each job is serialized once and the bytes are written to every snapshot containing it.
+    The archive stores descriptions as blob ids (see archive_store).
+    """
+    small = {"generated_at_utc": header["generated_at_utc"], "today_utc": header["today_utc"]}
+    today_ids = {id(j) for j in today_jobs}
+    backlog_ids = {id(j) for j in backlog_jobs}
 
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        cfg = json.load(f)
+    # Current snapshot
+    current_writer = SnapshotWriter(OUT_JSON, header, compact=compact)
+    # Daily archive: same day reruns overwrite SAME file; last run wins
+    archive_writer = SnapshotWriter(archive_json, header, compact=compact)
+    today_writer = SnapshotWriter(OUT_TODAY_JSON, dict(small, count=len(today_jobs)), compact=compact)
+    backlog_writer = SnapshotWriter(OUT_BACKLOG_JSON, dict(small, count=len(backlog_jobs)), compact=compact)
 
-    # Load persistent state
-    state = load_state(STATE_PATH)
-    jobs_state = state.setdefault("jobs", {})
+    writers = [current_writer, archive_writer, today_writer, backlog_writer]
+    try:
+        for j in all_jobs:
+            item = serialize_item(j, compact=compact)
+            current_writer.write_item(item)
+            archive_writer.write_item(serialize_item(compact_job(j, ARCHIVE_BLOB_DIR), compact=compact))
+            if id(j) in today_ids:
+                today_writer.write_item(item)
+            elif id(j) in backlog_ids:
+                backlog_writer.write_item(item)
+    except BaseException:
+        for w in writers:
+            w.abort()
+        raise
+    for w in writers:
+        w.close()
+
+
+def file_sizes(*paths) -> int:
+    total = 0
+    for p in paths:
+        try:
+            total += os.path.getsize(p)
+        except OSError:
+            pass
+    return total
 
-    all_jobs = []
-    errors = []
 
-    for t in cfg.get("targets", []):
-        source = t.get("source")
-        company = t.get("company") or "unknown"
-        try:
-            if source == "greenhouse":
-                board_token = t["board_token"]
-                all_jobs.extend(fetch_greenhouse(board_token, company))
-            elif source == "lever":
-                lever_slug = t["lever_slug"]
-                all_jobs.extend(fetch_lever(lever_slug, company))
-            elif source == "ashby":
-                job_board_name = t["job_board_name"]
-                all_jobs.extend(fetch_ashby(job_board_name, company))
-            else:
-                errors.append(f"Unknown source: {source} ({company})")
-        except (HTTPError, URLError, KeyError, TimeoutError) as e:
-            errors.append(f"{company} ({source}) failed: {repr(e)}")
-
-        time.sleep(0.3)
+def main():
+    # Wall/CPU/bytes per stage and per board -> `timings` in jobs.json
+    prof = Profiler()
+
+    with prof.stage("setup"):
+        os.makedirs(OUT_DIR, exist_ok=True)
+        os.makedirs(ARCHIVE_DIR, exist_ok=True)
+
+        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+            cfg = json.load(f)
+
+        # Persistent state (state.json, or state.sqlite once migrated)
+        store = open_state_store(STATE_PATH, STATE_SQLITE_PATH)
+
+        # Concurrent fetch with per-host rate limiting
+        fetch_cfg = cfg.get("fetch") or {}
+        host_limits = dict(DEFAULT_HOST_RATE_LIMITS)
+        host_limits.update(fetch_cfg.get("rate_limits") or {})
+        limiter = HostRateLimiter(host_limits, default=fetch_cfg.get("default_rate_limit"))
+        workers = fetch_cfg.get("workers") or DEFAULT_WORKERS
+
+        filters = cfg.get("filters") or {}
+        parse_key = filters_cache_key(filters)
+        # Built up front so a bad filters.pipeline fails before any board is fetched
+        pipeline = FilterPipeline(filters, matcher=KeywordMatcher)
+        # Checked up front so a bad output.corpus_format ("parquet" needs pyarrow) fails before
+        # any board is fetched
+        corpus_format = check_format((cfg.get("output") or {}).get("corpus_format", DEFAULT_CORPUS_FORMAT))
+
+        # Conditional-request cache (ETag / Last-Modified); on by default
+        cache = ResponseCache(HTTP_CACHE_DIR, variant=parse_key) if fetch_cfg.get("http_cache", True) else None
+
+        # Incremental mode: reuse records/verdicts for postings unchanged since last run
+        reuse = None
+        if fetch_cfg.get("incremental", True):
+            reuse = ParseReuse(load_parse_cache(PARSE_CACHE_PATH, parse_key), load_previous_records(OUT_JSON))
+
+        # Resume boards already fetched by an earlier, interrupted run today
+        checkpoints = None
+        if fetch_cfg.get("checkpoints", True):
+            checkpoints = BoardCheckpoints(CHECKPOINT_DIR, utc_date_str(datetime.now(timezone.utc)), variant=parse_key)
+
+    # Keep-alive client: pooled connections per host, gzip/br transfer, retries with backoff
+    client = make_client(limiter, fetch_cfg.get("retry"))
+    ctx = FetchContext(
+        client=client, cache=cache, reuse=reuse, checkpoints=checkpoints,
+        lever_page_size=fetch_cfg.get("lever_page_size", DEFAULT_LEVER_PAGE_SIZE),
+        profiler=prof,
+    )
+    try:
+        with prof.stage("fetch"):
+            all_jobs, errors = fetch_all(cfg.get("targets", []), workers=workers, ctx=ctx)
+    finally:
+        client.close()
 
     fetched_count = len(all_jobs)
-    filters = cfg.get("filters") or {}
+    fetched_jobs = all_jobs
 
     per_company_fetched = {}
     per_source_fetched = {}
@@ -342,59 +834,75 @@ def main():
         per_company_fetched[j.get("company") or "unknown"] = per_company_fetched.get(j.get("company") or "unknown", 0) + 1
         per_source_fetched[j.get("source") or "unknown"] = per_source_fetched.get(j.get("source") or "unknown", 0) + 1
 
-    all_jobs, dropped = apply_filters(all_jobs, filters)
+    with prof.stage("apply_filters"):
+        known = reuse.verdicts_for(fetched_jobs) if reuse is not None else None
+        # Drops are only counted (plus a small sample); per-posting detail goes to the
+        # optional dropped.ndjson.gz side file
+        output_cfg = cfg.get("output") or {}
+        dropped = DropStats(
+            detail_path=DROPPED_DETAIL_PATH if output_cfg.get("dropped_detail") else None,
+            keep_verdicts=reuse is not None,
+        )
+        all_jobs, dropped = apply_filters(fetched_jobs, filters, known=known, drops=dropped, pipeline=pipeline)
+        dropped.close()
     filtered_count = len(all_jobs)
 
-    def sort_key(j):
-        v = j.get("updated_at") or j.get("created_at") or ""
-        return str(v)
+    if reuse is not None:
+        with prof.stage("parse_cache_save") as st:
+            save_parse_cache(PARSE_CACHE_PATH, parse_key, fetched_jobs, dropped.verdicts)
+            st["bytes"] = file_sizes(PARSE_CACHE_PATH)
 
-    all_jobs.sort(key=sort_key, reverse=True)
+    # Snapshots newest first unless output.sorted_json is off (the markdown feeds pick their
+    # top K on their own either way)
+    if output_cfg.get("sorted_json", True):
+        all_jobs.sort(key=posted_sort_key, reverse=True)
 
     now_utc = datetime.now(timezone.utc)
     today_str = utc_date_str(now_utc)
 
-    # Update state: first_seen_date_utc should not change across same-day reruns
-    for j in all_jobs:
-        jid = j.get("id")
-        if not jid:
-            continue
-
-        rec = jobs_state.get(jid)
-        if not isinstance(rec, dict):
-            rec = {}
-            jobs_state[jid] = rec
-
-        if not rec.get("first_seen_date_utc"):
-            rec["first_seen_date_utc"] = today_str
-
-        rec["last_seen_at_utc"] = now_utc.isoformat()
-        rec["company"] = j.get("company")
-        rec["title"] = j.get("title")
-        rec["url"] = j.get("url")
-        rec.setdefault("status", "new")  # new/applied/ignored/closed
-
-    save_state(STATE_PATH, state)
-
-    # Split outputs:
-    # - TODAY: first_seen_date_utc == today
-    # - BACKLOG: older first_seen_date_utc, and not applied/ignored/closed
-    today_jobs = []
-    backlog_jobs = []
-
-    for j in all_jobs:
-        jid = j.get("id")
-        rec = jobs_state.get(jid, {})
-        first_date = rec.get("first_seen_date_utc") or today_str
-
-        if first_date == today_str:
-            today_jobs.append(j)
-        else:
-            status = (rec.get("status") or "new").lower()
-            if status not in ("applied", "ignored", "closed"):
-                backlog_jobs.append(j)
-
-    payload = {
+    # Near-duplicates (re-posts under a new id, same role on several boards) share a dup_group
+    dedup_cfg = cfg.get("dedup") or {}
+    dedup_stats = None
+    if dedup_cfg.get("enabled", True):
+        with prof.stage("dedup"):
+            index = DedupIndex(DEDUP_INDEX_PATH)
+            dedup_stats = index.assign(all_jobs, today_str, threshold=dedup_cfg.get("threshold", DEFAULT_THRESHOLD))
+            index.save(today_str, dedup_cfg.get("retention_days", DEFAULT_RETENTION_DAYS))
+
+    with prof.stage("state_update"):
+        # Update state: first_seen_date_utc should not change across same-day reruns
+        record_seen(store, all_jobs, today_str, now_utc.isoformat())
+        store.commit()
+
+        # Normalized URL -> id for mark_job.py (built from the whole state the first time)
+        url_index = UrlIndex(URL_INDEX_PATH)
+        if not url_index.exists():
+            url_index.rebuild(store)
+        url_index.add_jobs(all_jobs)
+        url_index.save()
+
+        # Split outputs into TODAY (first seen today) and BACKLOG (older, still open)
+        today_jobs, backlog_jobs = split_today_backlog(store, all_jobs, today_str)
+        store.close()
+
+    # Markdown outputs (written before the JSON snapshots so their cost shows up in `timings`)
+    # Daily archive: same day reruns overwrite SAME file; last run wins
+    archive_md = os.path.join(ARCHIVE_DIR, f"jobs.{today_str}.md")
+    md_top_k = output_cfg.get("md_top_k", DEFAULT_TOP_K)
+    with prof.stage("write_md") as st:
+        write_md(OUT_MD, "Job feed (current)", all_jobs, now_utc, today_str, errors=errors if errors else None, limit=md_top_k)
+        write_md(OUT_TODAY_MD, "Job feed (today)", today_jobs, now_utc, today_str, limit=md_top_k)
+        write_md(OUT_BACKLOG_MD, "Job feed (backlog)", backlog_jobs, now_utc, today_str, limit=md_top_k)
+        write_md(archive_md, f"Job feed (archive {today_str})", all_jobs, now_utc, today_str,
+                 errors=errors if errors else None, limit=md_top_k)
+        st["bytes"] = file_sizes(OUT_MD, OUT_TODAY_MD, OUT_BACKLOG_MD, archive_md)
+
+    # Columnar history for analytics (corpus_store.py): kept jobs + filter drops, one partition per day
+    if output_cfg.get("corpus", True):
+        with prof.stage("corpus") as st:
+            st["bytes"] = file_sizes(*append_corpus_run(today_str, all_jobs, dropped.rows(), CORPUS_DIR, corpus_format))
+
+    header = {
         "generated_at_utc": now_utc.isoformat(),
         "today_utc": today_str,
         "fetched_count": fetched_count,
@@ -405,41 +913,34 @@ def main():
         "per_company_fetched": per_company_fetched,
         "per_source_fetched": per_source_fetched,
         "errors": errors,
-        "dropped_sample": dropped[:50],
-        "jobs": all_jobs
+        "http_cache": cache.stats() if cache is not None else None,
+        "transfer": client.transfer_stats(),
+        "incremental": reuse.stats(fetched_jobs) if reuse is not None else None,
+        "checkpoints": checkpoints.stats() if checkpoints is not None else None,
+        "dedup": dedup_stats,
+        # Everything up to this point; writing the JSON snapshots is only in the trace / log line
+        "timings": prof.report(),
+        "dropped": dropped.summary(),
+        "dropped_sample": dropped.sample,
+        "filter_pipeline": pipeline.stats(),
     }
 
-    # Current snapshot (overwritten every run)
-    with open(OUT_JSON, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
-
-    # Today snapshot (overwritten every run; same-day latest)
-    with open(OUT_TODAY_JSON, "w", encoding="utf-8") as f:
-        json.dump(
-            {"generated_at_utc": now_utc.isoformat(), "today_utc": today_str, "count": len(today_jobs), "jobs": today_jobs},
-            f, ensure_ascii=False, indent=2
-        )
-
-    # Backlog snapshot
-    with open(OUT_BACKLOG_JSON, "w", encoding="utf-8") as f:
-        json.dump(
-            {"generated_at_utc": now_utc.isoformat(), "today_utc": today_str, "count": len(backlog_jobs), "jobs": backlog_jobs},
-            f, ensure_ascii=False, indent=2
-        )
-
-    # Markdown outputs
-    write_md(OUT_MD, "Job feed (current)", all_jobs, now_utc, today_str, errors=errors if errors else None)
-    write_md(OUT_TODAY_MD, "Job feed (today)", today_jobs, now_utc, today_str)
-    write_md(OUT_BACKLOG_MD, "Job feed (backlog)", backlog_jobs, now_utc, today_str)
-
-    # Daily archive: same day reruns overwrite SAME file; last run wins
     archive_json = os.path.join(ARCHIVE_DIR, f"jobs.{today_str}.json")
-    archive_md = os.path.join(ARCHIVE_DIR, f"jobs.{today_str}.md")
+    compact = bool(output_cfg.get("compact_json"))
+    with prof.stage("write_json") as st:
+        write_snapshots(header, all_jobs, today_jobs, backlog_jobs, archive_json, compact=compact)
+        st["bytes"] = file_sizes(OUT_JSON, OUT_TODAY_JSON, OUT_BACKLOG_JSON, archive_json)
+
+    # Run completed: the next run starts from scratch
+    if checkpoints is not None:
+        checkpoints.clear()
 
-    with open(archive_json, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    # Optional Chrome trace-event file (chrome://tracing or ui.perfetto.dev)
+    trace_file = fetch_cfg.get("trace_file")
+    if trace_file:
+        prof.write_trace(trace_file if os.path.isabs(trace_file) else os.path.join(ROOT, trace_file))
 
-    write_md(archive_md, f"Job feed (archive {today_str})", all_jobs, now_utc, today_str, errors=errors if errors else None)
+    print(f"fetch_jobs: {len(all_jobs)} job(s); {prof.summary()}")
 
 
 if __name__ == "__main__":
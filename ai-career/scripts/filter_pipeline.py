@@ -0,0 +1,223 @@
+import time
+
+from keyword_matcher import KeywordMatcher
+
+# Stage types:
+#   exclude_any  drop when any keyword matches the field
+#   require_any  drop unless a keyword matches the field (stage off when its list is empty)
+#   internship   keep when the title matches a keyword or an Ashby employmentType is listed
+STAGE_TYPES = ("exclude_any", "require_any", "internship")
+
+# Fields a keyword stage reads, cheapest first. "haystack" is title + location + description,
+# lowercased; it is only built for jobs that reach a haystack stage.
+FIELDS = ("title", "location", "haystack")
+
+# Check order of filters without a "pipeline" list (the order apply_filters always had)
+DEFAULT_PIPELINE = [
+    {"name": "exclude", "type": "exclude_any", "field": "haystack", "keywords": "exclude_any",
+     "reason": "excluded_keyword"},
+    {"name": "internship", "type": "internship", "keywords": "internship_any",
+     "ashby_types": "ashby_internship_types", "reason": "not_internship"},
+    {"name": "degree", "type": "require_any", "field": "haystack", "keywords": "degree_required_any",
+     "reason": "degree_mismatch"},
+    {"name": "major", "type": "require_any", "field": "haystack", "keywords": "major_required_any",
+     "reason": "major_mismatch"},
+    {"name": "domain", "type": "require_any", "field": "haystack", "keywords": "domain_any",
+     "reason": "domain_mismatch"},
+    {"name": "location", "type": "require_any", "field": "location", "keywords": "locations_any",
+     "reason": "location_mismatch"},
+]
+
+ORDERS = ("config", "adaptive")
+ADAPTIVE_SAMPLE = 200  # jobs run through every stage before an adaptive pipeline is reordered
+
+
+def _keywords(filters: dict, ref):
+    """A stage's keyword list: inline, or the name of a list in `filters`."""
+    if isinstance(ref, str):
+        ref = filters.get(ref)
+    return [k for k in (ref or []) if isinstance(k, str)]
+
+
+def haystack(job: dict, title: str, loc: str) -> str:
+    content = job.get("content_plain") or job.get("content_text") or ""
+    return f"{title}\n{loc}\n{content}".lower()
+
+
+class Stage:
+    """
+    One typed filter check. drops(job, title, loc, text) -> True when the job fails it
+    (text: the stage's field, already lowercased for "haystack").
+    Counters: evaluated (jobs it checked), dropped (drops attributed to it), seconds.
+    """
+
+    __slots__ = ("name", "type", "field", "reason", "matcher", "ashby_types",
+                 "evaluated", "dropped", "seconds", "sample_drops", "sample_seconds")
+
+    def __init__(self, spec: dict, filters: dict, matcher=KeywordMatcher, index: int = 0):
+        kind = spec.get("type")
+        if kind not in STAGE_TYPES:
+            raise ValueError(f"filters.pipeline[{index}]: unknown stage type {kind!r} (expected one of {STAGE_TYPES})")
+        field = "title" if kind == "internship" else spec.get("field", "haystack")
+        if field not in FIELDS:
+            raise ValueError(f"filters.pipeline[{index}]: unknown field {field!r} (expected one of {FIELDS})")
+
+        self.name = spec.get("name") or kind
+        self.type = kind
+        self.field = field
+        if kind == "exclude_any":
+            default_reason = "excluded_keyword"
+        elif kind == "internship":
+            default_reason = "not_internship"
+        else:
+            default_reason = f"{self.name}_mismatch"
+        self.reason = spec.get("reason") or default_reason
+        self.matcher = matcher(_keywords(filters, spec.get("keywords")))
+        self.ashby_types = {x.strip().lower() for x in _keywords(filters, spec.get("ashby_types")) if x.strip()}
+
+        self.evaluated = 0
+        self.dropped = 0
+        self.seconds = 0.0
+        self.sample_drops = 0
+        self.sample_seconds = 0.0
+
+    def enabled(self) -> bool:
+        # An internship stage with nothing to match drops every job (as it always has)
+        return self.type == "internship" or bool(self.matcher)
+
+    def drops(self, job: dict, title: str, loc: str, text: str) -> bool:
+        lowered = self.field == "haystack"
+        if self.type == "exclude_any":
+            return self.matcher.search(text, lowered=lowered)
+        if self.type == "require_any":
+            return not self.matcher.search(text, lowered=lowered)
+
+        # internship: strong positive signal from Ashby's structured field, else the title
+        if job.get("source") == "ashby" and job.get("employment_type") and self.ashby_types:
+            if str(job.get("employment_type")).strip().lower() in self.ashby_types:
+                return False
+        return not (self.matcher and self.matcher.search(title))
+
+
+class FilterPipeline:
+    """
+    The content checks of apply_filters as an ordered list of typed stages (filters.pipeline
+    in targets.json, DEFAULT_PIPELINE otherwise). A job's verdict is the reason of the first
+    stage it fails, or "kept"; later stages are skipped, so cheap title / location stages
+    placed first keep most jobs from ever building the description haystack.
+
+    With filters.pipeline_order = "adaptive" the first ADAPTIVE_SAMPLE jobs run through every
+    stage (in config order) to measure each stage's cost and drop rate; the rest run in order
+    of cost / drop rate, cheapest per eliminated job first. Which jobs are kept does not
+    depend on the order, only which stage a drop is attributed to.
+
+    pipeline = FilterPipeline(filters)
+    verdict = pipeline.verdict(job, title, loc)
+    pipeline.stats()  -> the `filter_pipeline` block of jobs.json
+    """
+
+    def __init__(self, filters: dict, matcher=KeywordMatcher, sample_size: int = ADAPTIVE_SAMPLE):
+        specs = filters.get("pipeline")
+        if specs is None:
+            specs = DEFAULT_PIPELINE
+        if not isinstance(specs, list):
+            raise ValueError("filters.pipeline must be a list of stages")
+        self.stages = [Stage(spec, filters, matcher, i) for i, spec in enumerate(specs)]
+        self.order_mode = filters.get("pipeline_order") or "config"
+        if self.order_mode not in ORDERS:
+            raise ValueError(f"filters.pipeline_order: {self.order_mode!r} (expected one of {ORDERS})")
+
+        self.active = [s for s in self.stages if s.enabled()]
+        self.sample_size = sample_size if self.order_mode == "adaptive" else 0
+        self.sampled = 0
+        self.haystack_seconds = 0.0
+        self.cap_evaluated = 0
+        self.cap_dropped = 0
+
+    def verdict(self, job: dict, title: str, loc: str) -> str:
+        """Drop reason of the first failing stage, or "kept"."""
+        if self.sampled < self.sample_size:
+            return self._sample_verdict(job, title, loc)
+
+        hay = None
+        clock = time.perf_counter
+        for st in self.active:
+            t0 = clock()
+            if st.field == "haystack":
+                if hay is None:
+                    hay = haystack(job, title, loc)
+                text = hay
+            else:
+                text = title if st.field == "title" else loc
+            failed = st.drops(job, title, loc, text)
+            st.seconds += clock() - t0
+            st.evaluated += 1
+            if failed:
+                st.dropped += 1
+                return st.reason
+        return "kept"
+
+    def _sample_verdict(self, job: dict, title: str, loc: str) -> str:
+        clock = time.perf_counter
+        t0 = clock()
+        hay = haystack(job, title, loc)
+        self.haystack_seconds += clock() - t0
+
+        first = None
+        for st in self.active:
+            text = hay if st.field == "haystack" else (title if st.field == "title" else loc)
+            t0 = clock()
+            failed = st.drops(job, title, loc, text)
+            dt = clock() - t0
+            st.seconds += dt
+            st.sample_seconds += dt
+            st.evaluated += 1
+            if failed:
+                st.sample_drops += 1
+                if first is None:
+                    first = st
+        if first is not None:
+            first.dropped += 1
+
+        self.sampled += 1
+        if self.sampled == self.sample_size:
+            self._reorder()
+        return first.reason if first is not None else "kept"
+
+    def _rank(self, st: Stage) -> float:
+        """Sampled cost per job eliminated (a haystack stage also pays for building it)."""
+        if not st.sample_drops:
+            return float("inf")
+        cost = st.sample_seconds + (self.haystack_seconds if st.field == "haystack" else 0.0)
+        return cost / st.sample_drops
+
+    def _reorder(self) -> None:
+        # Stable: stages that dropped nothing in the sample keep their config order, last
+        self.active.sort(key=self._rank)
+
+    def count_cap(self, dropped: bool) -> None:
+        """The per-company cap runs after every stage (it depends on the jobs kept so far)."""
+        self.cap_evaluated += 1
+        if dropped:
+            self.cap_dropped += 1
+
+    def stats(self) -> dict:
+        stages = []
+        for st in self.stages:
+            row = {
+                "name": st.name, "type": st.type, "field": st.field, "reason": st.reason,
+                "enabled": st.enabled(), "evaluated": st.evaluated, "dropped": st.dropped,
+                "seconds": round(st.seconds, 6),
+            }
+            if self.sampled:
+                row["sample_drop_rate"] = round(st.sample_drops / self.sampled, 4)
+                row["sample_us_per_job"] = round(st.sample_seconds / self.sampled * 1e6, 3)
+            stages.append(row)
+        stages.append({"name": "company_cap", "type": "company_cap", "field": "company", "reason": "company_cap",
+                       "enabled": True, "evaluated": self.cap_evaluated, "dropped": self.cap_dropped})
+        return {
+            "order_mode": self.order_mode,
+            "order": [st.name for st in self.active] + ["company_cap"],
+            "sampled": self.sampled,
+            "stages": stages,
+        }
@@ -0,0 +1,113 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+
+class ResponseCache:
+    """
+    On-disk conditional-request cache for job-board responses.
+
+    One JSON file per URL holding the response validators (ETag / Last-Modified)
+    and the parsed jobs list, so a 304 Not Modified can skip both download and parsing.
+    Optionally the raw body too (<key>.body.gz), for boards whose parsed jobs are not
+    complete on their own and may have to be parsed again on a 304.
+
+    `variant` identifies how the jobs were parsed; entries stored under a different
+    variant are ignored (no validators sent), forcing a full download and re-parse.
+    """
+
+    def __init__(self, cache_dir: str, variant: str = ""):
+        self.cache_dir = cache_dir
+        self.variant = variant
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:24]
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _body_path(self, url: str) -> str:
+        return self._path(url)[:-len(".json")] + ".body.gz"
+
+    def get(self, url: str):
+        """Return the cached entry for url, or None if missing/unreadable."""
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != url or not isinstance(entry.get("jobs"), list):
+            return None
+        if entry.get("variant", "") != self.variant:
+            return None
+        return entry
+
+    @staticmethod
+    def validators(entry) -> dict:
+        """Conditional request headers for a cached entry."""
+        headers = {}
+        if not entry:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def body(self, url: str):
+        """The raw body stored with url's entry, or None."""
+        try:
+            with gzip.open(self._body_path(url), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError):
+            return None
+
+    def store(self, url: str, etag, last_modified, jobs, body: bytes = None) -> None:
+        if not etag and not last_modified:
+            # Nothing to revalidate with next time
+            return
+        # Body first: an entry never refers to another response's body
+        body_path = self._body_path(url)
+        if body is not None:
+            tmp = f"{body_path}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp, "wb", compresslevel=6) as f:
+                f.write(body)
+            os.replace(tmp, body_path)
+        else:
+            try:
+                os.remove(body_path)
+            except FileNotFoundError:
+                pass
+        entry = {
+            "url": url,
+            "variant": self.variant,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at_utc": datetime.now(timezone.utc).isoformat(),
+            "jobs": jobs,
+        }
+        path = self._path(url)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def record(self, hit: bool) -> None:
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses}
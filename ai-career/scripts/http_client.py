@@ -0,0 +1,221 @@
+import gzip
+import http.client
+import random
+import threading
+import time
+import zlib
+from email.utils import parsedate_to_datetime
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import brotli  # optional: enables "br" transfer encoding
+except ImportError:
+    brotli = None
+
+ACCEPT_ENCODING = "gzip, br" if brotli is not None else "gzip"
+
+# Truncated / corrupt compressed bodies (gzip.BadGzipFile is an OSError)
+DECODE_ERRORS = (OSError, EOFError, zlib.error) + ((brotli.error,) if brotli is not None else ())
+
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+
+# Transient statuses worth retrying (rate limited / server-side trouble)
+RETRY_CODES = (429, 500, 502, 503, 504)
+
+
+def decode_body(raw: bytes, encoding: str) -> bytes:
+    """
+    Decode a response body per its Content-Encoding. A body that fails to decode raises
+    URLError, like a broken connection, so it is retried and then reported per target.
+    """
+    enc = (encoding or "").strip().lower()
+    if not enc or enc == "identity":
+        return raw
+    try:
+        return _decode(raw, enc)
+    except URLError:
+        raise
+    except DECODE_ERRORS as e:
+        raise URLError(f"could not decode {enc} body: {e!r}")
+
+
+def _decode(raw: bytes, enc: str) -> bytes:
+    if enc in ("gzip", "x-gzip"):
+        return gzip.decompress(raw)
+    if enc == "deflate":
+        try:
+            return zlib.decompress(raw)
+        except zlib.error:
+            return zlib.decompress(raw, -zlib.MAX_WBITS)
+    if enc == "br" and brotli is not None:
+        return brotli.decompress(raw)
+    raise URLError(f"unsupported Content-Encoding: {enc}")
+
+
+def parse_retry_after(value):
+    """Retry-After header (delta-seconds or HTTP-date) -> seconds to wait, or None."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class HttpClient:
+    """
+    Keep-alive HTTP client built on http.client.
+
+    Idle connections are pooled per (scheme, host, port) and reused across requests,
+    so each worker thread keeps one warm connection per host instead of reconnecting
+    for every board. Responses are requested compressed and decoded transparently.
+
+    Errors mirror urlopen: HTTP status >= 400 raises HTTPError, connection failures
+    raise URLError, read timeouts raise TimeoutError.
+
+    With retries > 0, 429/5xx responses and connection errors are retried with
+    exponential backoff and jitter. A Retry-After header is honored; if it asks for
+    more than max_delay seconds the error is raised instead of retrying early.
+    """
+
+    def __init__(self, user_agent: str, timeout: float = 30, limiter=None,
+                 retries: int = 0, backoff: float = 1.0, max_delay: float = 30.0):
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.limiter = limiter
+        self.retries = max(0, int(retries))
+        self.backoff = max(0.0, float(backoff))
+        self.max_delay = max(0.0, float(max_delay))
+        self.idle = {}
+        self.transfer = {}
+        self.lock = threading.Lock()
+
+    # ---- connection pool ----
+
+    def _checkout(self, key):
+        with self.lock:
+            conns = self.idle.get(key)
+            if conns:
+                return conns.pop(), True
+        scheme, host, port = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(host, port, timeout=self.timeout), False
+
+    def _checkin(self, key, conn) -> None:
+        with self.lock:
+            self.idle.setdefault(key, []).append(conn)
+
+    def close(self) -> None:
+        with self.lock:
+            pools = list(self.idle.values())
+            self.idle = {}
+        for conns in pools:
+            for conn in conns:
+                conn.close()
+
+    # ---- requests ----
+
+    def _request_once(self, url: str, headers: dict):
+        parts = urlsplit(url)
+        scheme = parts.scheme or "https"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        req_headers = {"User-Agent": self.user_agent, "Accept-Encoding": ACCEPT_ENCODING}
+        req_headers.update(headers or {})
+
+        # A pooled connection may have been closed by the server; retry once on a fresh one.
+        for attempt in range(2):
+            conn, reused = self._checkout(key)
+            try:
+                conn.request("GET", path, headers=req_headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except TimeoutError:
+                conn.close()
+                raise
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise URLError(e)
+
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            return resp, raw
+
+    def _get_once(self, url: str, headers, tag: str):
+        for _ in range(MAX_REDIRECTS + 1):
+            resp, raw = self._request_once(url, headers)
+            if resp.status in REDIRECT_CODES and resp.getheader("Location"):
+                url = urljoin(url, resp.getheader("Location"))
+                continue
+            break
+
+        body = decode_body(raw, resp.getheader("Content-Encoding"))
+        self._record(tag, len(raw), len(body))
+        return url, resp, body
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter: somewhere in [d/2, d], d = backoff * 2**attempt."""
+        d = min(self.max_delay, self.backoff * (2 ** attempt))
+        return d / 2 + random.uniform(0, d / 2)
+
+    def get(self, url: str, headers=None, tag: str = "unknown"):
+        """
+        GET url; returns (status, headers, decoded_body). 304 is returned, not raised.
+        Bytes on the wire vs decoded bytes are accumulated per `tag`.
+        """
+        for attempt in range(self.retries + 1):
+            if self.limiter is not None:
+                self.limiter.wait(url)
+
+            last = attempt == self.retries
+            try:
+                final_url, resp, body = self._get_once(url, headers, tag)
+            except (URLError, TimeoutError):
+                if last:
+                    raise
+                self._record_retry(tag)
+                time.sleep(self.backoff_delay(attempt))
+                continue
+
+            if resp.status in RETRY_CODES and not last:
+                retry_after = parse_retry_after(resp.getheader("Retry-After"))
+                if retry_after is None or retry_after <= self.max_delay:
+                    self._record_retry(tag)
+                    time.sleep(retry_after if retry_after is not None else self.backoff_delay(attempt))
+                    continue
+
+            if resp.status >= 400:
+                raise HTTPError(final_url, resp.status, resp.reason, resp.headers, None)
+            return resp.status, resp.headers, body
+
+    def _record(self, tag: str, wire: int, decoded: int) -> None:
+        with self.lock:
+            t = self._stats(tag)
+            t["requests"] += 1
+            t["wire_bytes"] += wire
+            t["decoded_bytes"] += decoded
+
+    def _record_retry(self, tag: str) -> None:
+        with self.lock:
+            self._stats(tag)["retries"] += 1
+
+    def _stats(self, tag: str) -> dict:
+        return self.transfer.setdefault(tag, {"requests": 0, "retries": 0, "wire_bytes": 0, "decoded_bytes": 0})
+
+    def transfer_stats(self) -> dict:
+        with self.lock:
+            return {k: dict(v) for k, v in sorted(self.transfer.items())}
@@ -0,0 +1,128 @@
+# Job description -> block tree: description > sections > blocks (one per non-empty line).
+# Each line is stripped, lowercased and classified once; triage reads sections, bullets and
+# pay lines from the blocks instead of re-splitting the text per helper.
+
+HEADING = "heading"
+BULLET = "bullet"
+TEXT = "text"
+
+SECTION_HEADINGS = {
+    "responsibilities": ["responsibilities", "what you’ll do", "what you'll do", "you will", "role", "the role"],
+    "requirements": ["requirements", "required", "must have", "minimum qualifications"],
+    "qualifications": ["qualifications", "basic qualifications"],
+    "preferred": ["preferred", "nice to have", "bonus", "preferred qualifications"],
+    "benefits": ["benefits", "perks", "compensation", "salary"],
+}
+# alias -> section key. A heading line is "<alias>" or "<alias>: ..." (case-insensitive,
+# outer colons ignored), so the text before the first colon is the only lookup needed.
+HEADING_KEYS = {alias: key for key, aliases in SECTION_HEADINGS.items() for alias in aliases}
+
+SUMMARY_LINES = 25   # description without any heading
+SECTION_LINES = 60   # kept per section (rendering trims further)
+
+# Headings embedded in a section's bullets ("WHAT YOU'LL NEED" inside Responsibilities);
+# a bullet starting with one of these switches to that bucket
+EMBEDDED_HEADINGS = {
+    "requirements": ["what you'll need", "what you’ll need", "requirements", "minimum qualifications", "qualifications"],
+    "preferred": ["nice to have", "nice-to-have", "nice to haves", "nice-to-haves", "preferred",
+                  "preferred qualifications", "bonus"],
+}
+_EMBEDDED = [
+    (bucket, frozenset(markers), sorted({len(m) for m in markers}))
+    for bucket, markers in EMBEDDED_HEADINGS.items()
+]
+
+BULLET_CHARS = " •\t-"
+PAY_MARKERS = ("housing", "hourly", "monthly rate", "salary", "compensation")
+
+
+class Block:
+    """
+    One non-empty description line: text (stripped), low (lowercased), item (text without
+    bullet marks), key (section key when the line is a section heading) and kind.
+    """
+
+    __slots__ = ("text", "low", "item", "key", "kind")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.low = text.lower()
+        self.item = text.strip(BULLET_CHARS).strip()
+        self.key = HEADING_KEYS.get(self.low.strip(":").partition(":")[0])
+        if self.key:
+            self.kind = HEADING
+        elif text[0] in BULLET_CHARS or text[0] == "*":
+            self.kind = BULLET
+        else:
+            self.kind = TEXT
+
+
+class JobDescription:
+    """
+    blocks: every line; sections: section key -> its blocks, capped (SECTION_LINES, or
+    SUMMARY_LINES under "summary" when there is no heading at all). A key repeated under a
+    later heading keeps its first position with the later blocks.
+    """
+
+    def __init__(self, blocks):
+        self.blocks = blocks
+        self.sections = {}
+        heads = [i for i, b in enumerate(blocks) if b.key]
+        if not heads:
+            self.sections["summary"] = blocks[:SUMMARY_LINES]
+            return
+        heads.append(len(blocks))
+        for start, end in zip(heads, heads[1:]):
+            chunk = blocks[start + 1:end]
+            if chunk:
+                self.sections[blocks[start].key] = chunk[:SECTION_LINES]
+
+    def section_texts(self) -> dict:
+        return section_texts(self.sections)
+
+
+def tokenize(text: str):
+    return [Block(ln) for ln in (ln.strip() for ln in (text or "").splitlines()) if ln]
+
+
+def parse(text: str) -> JobDescription:
+    return JobDescription(tokenize(text))
+
+
+def section_texts(sections: dict) -> dict:
+    """{key: blocks} -> {key: text}, the shape stored in triage.json."""
+    return {key: "\n".join(b.text for b in blocks) for key, blocks in sections.items()}
+
+
+def bullets(blocks, max_items: int):
+    """Bullet texts (marks stripped, empty ones dropped), capped."""
+    return [b.item for b in blocks if b.item][:max_items]
+
+
+def split_embedded(items):
+    """
+    Bucket bullet texts into "main" / "requirements" / "preferred": a bullet starting with
+    an embedded heading switches the bucket for the bullets after it (and is dropped).
+    """
+    buckets = {"main": [], "requirements": [], "preferred": []}
+    mode = "main"
+    for item in items:
+        low = item.lower().strip(":").strip()
+        for bucket, markers, lengths in _EMBEDDED:
+            if any(low[:n] in markers for n in lengths):
+                mode = bucket
+                break
+        else:
+            buckets[mode].append(item)
+    return buckets
+
+
+def pay_blocks(blocks, max_lines: int):
+    """The first max_lines blocks with a strong pay signal ($, salary, hourly, housing, ...)."""
+    keep = []
+    for b in blocks:
+        if "$" in b.text or any(m in b.low for m in PAY_MARKERS):
+            keep.append(b)
+            if len(keep) >= max_lines:
+                break
+    return keep
@@ -0,0 +1,72 @@
+import json
+import os
+
+
+def serialize_item(obj, compact: bool = False) -> str:
+    """
+    Serialize one list item so it can be spliced into any snapshot's "jobs" list.
+    Indented output matches json.dump(payload, indent=2) byte for byte.
+    """
+    if compact:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    # Items sit two levels deep (payload -> "jobs" -> item)
+    return json.dumps(obj, ensure_ascii=False, indent=2).replace("\n", "\n    ")
+
+
+class SnapshotWriter:
+    """
+    Streams {"<header fields>": ..., "<list_key>": [items...]} to disk without building
+    the payload in memory. Items are pre-serialized with serialize_item(), so one job
+    serialized once can be fanned out to several snapshot files.
+
+    Written to a temp file and moved into place on close().
+    """
+
+    def __init__(self, path: str, header: dict, list_key: str = "jobs", compact: bool = False):
+        self.path = path
+        self.tmp = path + ".tmp"
+        self.compact = compact
+        self.count = 0
+        self.f = open(self.tmp, "w", encoding="utf-8")
+
+        if compact:
+            head = json.dumps(header, ensure_ascii=False, separators=(",", ":"))[:-1]
+            sep = "," if header else ""
+            self.f.write(f'{head}{sep}"{list_key}":[')
+        else:
+            head = json.dumps(header, ensure_ascii=False, indent=2)[:-2] if header else "{"
+            sep = "," if header else ""
+            self.f.write(f'{head}{sep}\n  "{list_key}": [')
+
+    def write_item(self, serialized: str) -> None:
+        if self.compact:
+            self.f.write(("," if self.count else "") + serialized)
+        else:
+            self.f.write(("," if self.count else "") + "\n    " + serialized)
+        self.count += 1
+
+    def close(self) -> None:
+        if self.compact:
+            self.f.write("]}")
+        else:
+            self.f.write("\n  ]\n}" if self.count else "]\n}")
+        self.f.close()
+        os.replace(self.tmp, self.path)
+
+    def abort(self) -> None:
+        """Discard the partial file; the previous snapshot (if any) stays in place."""
+        self.f.close()
+        try:
+            os.remove(self.tmp)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
@@ -0,0 +1,101 @@
+import re
+
+ALNUM_BEFORE = r"(?<![A-Za-z0-9])"
+ALNUM_AFTER = r"(?![A-Za-z0-9])"
+
+
+def _clean_keywords(keywords):
+    out = []
+    for k in keywords or []:
+        if isinstance(k, str) and k.strip():
+            out.append(k.strip())
+    return out
+
+
+def keyword_pattern(keyword: str, boundary: str = "alnum") -> str:
+    """
+    Regex source for one (lowercased) keyword.
+    - Phrase (has spaces): plain substring
+    - Token (incl hyphenated like 'co-op'): whole-token match, so 'intern' does not
+      match 'internal' and 'co-op' does not match 'co-opetition'.
+
+    boundary="alnum": lookarounds against [A-Za-z0-9] for every token (fetch_jobs filters).
+    boundary="word":  \\b for plain tokens, alnum lookarounds for hyphenated ones
+                      (score_jobs / triage_jobs semantics).
+
+    The literal comes first and the left boundary is checked afterwards with a
+    fixed-width lookbehind, so an alternation of keywords still starts with literals
+    and the regex engine can skip ahead on their first characters.
+    """
+    esc = re.escape(keyword)
+    if " " in keyword:
+        return esc
+    if boundary == "word" and "-" not in keyword:
+        return esc + r"(?<=\b" + esc + r")\b"
+    return esc + r"(?<=" + ALNUM_BEFORE + esc + r")" + ALNUM_AFTER
+
+
+class KeywordMatcher:
+    """
+    All keywords of one list compiled into a single alternation, so a text is scanned
+    once per list instead of once per keyword. Matching is done on lowercased text;
+    pass lowered=True when the caller already lowercased it.
+
+    search(text) -> bool       same result as checking each keyword in turn
+    hits(text)   -> [keyword]  every matching keyword, de-duplicated, in list order
+    """
+
+    def __init__(self, keywords, boundary: str = "alnum"):
+        self.given = bool(keywords)
+        self.keywords = _clean_keywords(keywords)
+        self.boundary = boundary
+
+        # Canonical (lowercased) key -> first spelling in the list
+        self.by_key = {}
+        for k in self.keywords:
+            self.by_key.setdefault(k.lower(), k)
+        self.order = {k: i for i, k in enumerate(self.by_key)}
+
+        # Longest first, so at any position the scan reports the longest keyword
+        keys = sorted(self.by_key, key=lambda x: (-len(x), x))
+        self.single = {k: re.compile(keyword_pattern(k, boundary)) for k in keys}
+
+        # Keywords that can match at the same start position are prefix-related;
+        # the scan reports only the longest, the others are re-checked at that position.
+        self.related = {}
+        for k in keys:
+            self.related[k] = [o for o in keys if o != k and k.startswith(o)]
+
+        if keys:
+            self.any_re = re.compile("|".join(keyword_pattern(k, boundary) for k in keys))
+        else:
+            self.any_re = None
+
+    def __bool__(self) -> bool:
+        return self.given
+
+    def search(self, text: str, lowered: bool = False) -> bool:
+        if not self.given:
+            return True
+        if self.any_re is None:
+            return False
+        t = (text or "") if lowered else (text or "").lower()
+        return self.any_re.search(t) is not None
+
+    def hits(self, text: str, lowered: bool = False):
+        if self.any_re is None:
+            return []
+        t = (text or "") if lowered else (text or "").lower()
+        found = set()
+        pos = 0
+        while len(found) < len(self.by_key):
+            m = self.any_re.search(t, pos)
+            if m is None:
+                break
+            key = m.group(0)
+            found.add(key)
+            for other in self.related[key]:
+                if other not in found and self.single[other].match(t, m.start()):
+                    found.add(other)
+            pos = m.start() + 1
+        return [self.by_key[k] for k in sorted(found, key=self.order.__getitem__)]
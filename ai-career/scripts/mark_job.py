@@ -3,12 +3,19 @@ import os
 import sys
 from datetime import datetime, timezone
 
+from state_store import open_state_store, set_status
+from url_index import UrlIndex, normalize_url
+
 ROOT = os.path.dirname(os.path.dirname(__file__))  # ai-career/
 STATE_PATH = os.path.join(ROOT, "data", "state.json")
+STATE_SQLITE_PATH = os.path.join(ROOT, "data", "state.sqlite")
+URL_INDEX_PATH = os.path.join(ROOT, "data", "url_index.json")
 JOBS_JSON = os.path.join(ROOT, "data", "jobs.json")
 JOBS_TODAY_JSON = os.path.join(ROOT, "data", "jobs_today.json")
 JOBS_BACKLOG_JSON = os.path.join(ROOT, "data", "jobs_backlog.json")
 
+ALLOWED_STATUSES = {"applied", "ignored", "new", "closed"}
+
 
 def load_json(path, default):
     try:
@@ -20,92 +27,128 @@ def load_json(path, default):
         return default
 
 
-def save_json_atomic(path, data):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    os.replace(tmp, path)
-
-
 def now_iso_utc():
     return datetime.now(timezone.utc).isoformat()
 
 
-def find_job_id_by_url(url: str):
+def find_job_id_by_url(url: str, store, index=None):
     """
-    Try to find job id by URL from state first, then from jobs snapshots.
+    Find the job id for a URL: the URL index first (no state scan, no snapshot parsing),
+    then state, then the jobs snapshots for URLs the index has not seen.
     """
     url = (url or "").strip()
     if not url:
         return None
 
-    state = load_json(STATE_PATH, {"version": 1, "jobs": {}})
-    jobs_state = state.get("jobs") or {}
-
-    # 1) Search in state
-    for jid, rec in jobs_state.items():
-        if isinstance(rec, dict) and (rec.get("url") or "").strip() == url:
+    # 1) Normalized URL index
+    if index is not None:
+        jid = index.lookup(url)
+        if jid:
             return jid
 
-    # 2) Search in jobs snapshots
+    # 2) Search in state
+    jid = store.find_by_url(url)
+    if jid:
+        return jid
+
+    # 3) Search in jobs snapshots
+    key = normalize_url(url)
     for p in [JOBS_TODAY_JSON, JOBS_BACKLOG_JSON, JOBS_JSON]:
         data = load_json(p, {})
         for j in (data.get("jobs") or []):
-            if (j.get("url") or "").strip() == url and j.get("id"):
+            if normalize_url(j.get("url")) == key and j.get("id"):
                 return j.get("id")
 
     return None
 
 
+def parse_batch(lines):
+    """
+    (status, url, note) per non-empty, non-comment line of "<status> <url> [note...]".
+    Raises ValueError naming the first bad line.
+    """
+    out = []
+    for n, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = line.split(None, 2)
+        status = parts[0].lower()
+        if status not in ALLOWED_STATUSES or len(parts) < 2:
+            raise ValueError(f"line {n}: expected '<status> <url> [note...]' with status in {sorted(ALLOWED_STATUSES)}: {line}")
+        out.append((status, parts[1], parts[2].strip() if len(parts) > 2 else ""))
+    return out
+
+
+def mark_many(entries, store, index):
+    """
+    Apply (status, url, note) entries to the store (the caller commits once).
+    Returns ([(jid, status, url)], [unresolved url]).
+    """
+    done = []
+    missing = []
+    now_iso = now_iso_utc()
+    for status, url, note in entries:
+        jid = find_job_id_by_url(url, store, index)
+        if not jid:
+            missing.append(url)
+            continue
+        set_status(store, jid, status, url, now_iso, note=note)
+        index.add(url, jid)
+        done.append((jid, status, url))
+    return done, missing
+
+
 def main():
     """
     Usage:
       python ai-career/scripts/mark_job.py <status> <url> [note...]
+      python ai-career/scripts/mark_job.py --batch <file|->
 
     status: applied | ignored | new | closed
+    Batch input has one "<status> <url> [note...]" per line (# comments allowed); every
+    resolved URL is applied in a single state write.
     """
-    if len(sys.argv) < 3:
-        print("Usage: mark_job.py <status> <url> [note...]")
+    if len(sys.argv) >= 3 and sys.argv[1] == "--batch":
+        src = sys.argv[2]
+        try:
+            if src == "-":
+                entries = parse_batch(sys.stdin)
+            else:
+                with open(src, "r", encoding="utf-8") as f:
+                    entries = parse_batch(f)
+        except ValueError as e:
+            print(f"Invalid batch: {e}")
+            sys.exit(2)
+    elif len(sys.argv) >= 3:
+        status = (sys.argv[1] or "").strip().lower()
+        url = (sys.argv[2] or "").strip()
+        note = " ".join(sys.argv[3:]).strip() if len(sys.argv) > 3 else ""
+        if status not in ALLOWED_STATUSES:
+            print(f"Invalid status: {status}. Allowed: {sorted(list(ALLOWED_STATUSES))}")
+            sys.exit(2)
+        entries = [(status, url, note)]
+    else:
+        print("Usage: mark_job.py <status> <url> [note...]\n       mark_job.py --batch <file|->")
         sys.exit(2)
 
-    status = (sys.argv[1] or "").strip().lower()
-    url = (sys.argv[2] or "").strip()
-    note = " ".join(sys.argv[3:]).strip() if len(sys.argv) > 3 else ""
-
-    allowed = {"applied", "ignored", "new", "closed"}
-    if status not in allowed:
-        print(f"Invalid status: {status}. Allowed: {sorted(list(allowed))}")
-        sys.exit(2)
-
-    state = load_json(STATE_PATH, {"version": 1, "jobs": {}})
-    if not isinstance(state, dict):
-        state = {"version": 1, "jobs": {}}
-    jobs_state = state.setdefault("jobs", {})
-    if not isinstance(jobs_state, dict):
-        jobs_state = {}
-        state["jobs"] = jobs_state
-
-    jid = find_job_id_by_url(url)
-    if not jid:
+    store = open_state_store(STATE_PATH, STATE_SQLITE_PATH)
+    index = UrlIndex(URL_INDEX_PATH)
+    try:
+        done, missing = mark_many(entries, store, index)
+        if done:
+            store.commit()
+            index.save()
+    finally:
+        store.close()
+
+    for jid, status, url in done:
+        print(f"OK: {jid} -> status={status} url={url}")
+    for url in missing:
         print(f"Could not find job by url: {url}")
+    if missing:
         sys.exit(1)
 
-    rec = jobs_state.get(jid)
-    if not isinstance(rec, dict):
-        rec = {}
-        jobs_state[jid] = rec
-
-    rec["url"] = url
-    rec["status"] = status
-    rec["status_updated_at_utc"] = now_iso_utc()
-    if note:
-        rec["note"] = note
-
-    save_json_atomic(STATE_PATH, state)
-
-    print(f"OK: {jid} -> status={status} url={url}")
-
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,156 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Profiler:
+    """
+    Stage instrumentation for one run: wall time, CPU time (of the calling thread)
+    and bytes handled, aggregated per stage and per target board.
+
+    with prof.target("stripe (greenhouse)"):     # worker thread: attribute stages to a board
+        with prof.stage("network") as st:
+            body = ...
+            st["bytes"] = len(body)
+
+    Stages run by worker threads are summed over all workers, so e.g. "network" can
+    exceed the run's wall time; the enclosing "fetch" stage is the elapsed time.
+
+    report()           -> the `timings` block for jobs.json
+    write_trace(path)  -> Chrome trace-event JSON (chrome://tracing, Perfetto)
+
+    Stages with trace=False are aggregated only; use it for per-job stages such as
+    html_to_text, which would otherwise flood the trace with tiny events.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.t0 = time.perf_counter()
+        self.cpu0 = time.process_time()
+        self.stages = {}
+        self.targets = {}
+        self.target_order = []
+        self.events = []
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _new_totals() -> dict:
+        return {"count": 0, "wall_s": 0.0, "cpu_s": 0.0, "bytes": 0}
+
+    @staticmethod
+    def _add(totals: dict, wall: float, cpu: float, nbytes: int) -> None:
+        totals["count"] += 1
+        totals["wall_s"] += wall
+        totals["cpu_s"] += cpu
+        totals["bytes"] += nbytes
+
+    @contextmanager
+    def target(self, name: str):
+        """Attribute stages run by this thread to target `name` until the block exits."""
+        if not self.enabled:
+            yield
+            return
+        with self.lock:
+            if name not in self.targets:
+                self.targets[name] = {"stages": {}, "total": self._new_totals()}
+                self.target_order.append(name)
+        prev = getattr(self.local, "target", None)
+        self.local.target = name
+        try:
+            with self.stage("target", trace_name=name):
+                yield
+        finally:
+            self.local.target = prev
+
+    @contextmanager
+    def stage(self, name: str, trace: bool = True, trace_name: str = None):
+        """Time a block; the yielded dict's "bytes" is recorded with it."""
+        info = {"bytes": 0}
+        if not self.enabled:
+            yield info
+            return
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield info
+        finally:
+            wall = time.perf_counter() - start
+            cpu = time.thread_time() - cpu_start
+            self._record(name, start, wall, cpu, info.get("bytes") or 0, trace, trace_name)
+
+    def _record(self, name, start, wall, cpu, nbytes, trace, trace_name) -> None:
+        target = getattr(self.local, "target", None)
+        with self.lock:
+            if name == "target":
+                self._add(self.targets[target]["total"], wall, cpu, nbytes)
+            else:
+                self._add(self.stages.setdefault(name, self._new_totals()), wall, cpu, nbytes)
+                if target is not None:
+                    per = self.targets[target]["stages"]
+                    self._add(per.setdefault(name, self._new_totals()), wall, cpu, nbytes)
+            if trace:
+                self.events.append({
+                    "name": trace_name or name,
+                    "cat": "target" if name == "target" else "stage",
+                    "ph": "X",
+                    "ts": round((start - self.t0) * 1e6, 1),
+                    "dur": round(wall * 1e6, 1),
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": {"cpu_ms": round(cpu * 1000, 3), "bytes": nbytes, "target": target},
+                })
+
+    @staticmethod
+    def _rounded(totals: dict) -> dict:
+        return {
+            "count": totals["count"],
+            "wall_s": round(totals["wall_s"], 4),
+            "cpu_s": round(totals["cpu_s"], 4),
+            "bytes": totals["bytes"],
+        }
+
+    def report(self) -> dict:
+        if not self.enabled:
+            return None
+        with self.lock:
+            # Slowest boards first
+            targets = []
+            for name in sorted(self.target_order, key=lambda n: -self.targets[n]["total"]["wall_s"]):
+                t = self.targets[name]
+                targets.append({
+                    "target": name,
+                    "wall_s": round(t["total"]["wall_s"], 4),
+                    "cpu_s": round(t["total"]["cpu_s"], 4),
+                    "stages": {k: self._rounded(v) for k, v in t["stages"].items()},
+                })
+            return {
+                "wall_s": round(time.perf_counter() - self.t0, 4),
+                "cpu_s": round(time.process_time() - self.cpu0, 4),
+                "stages": {k: self._rounded(v) for k, v in self.stages.items()},
+                "targets": targets,
+            }
+
+    def summary(self, top: int = 6) -> str:
+        """One line for the run log: total wall time and the slowest stages."""
+        with self.lock:
+            stages = sorted(self.stages.items(), key=lambda kv: -kv[1]["wall_s"])[:top]
+        parts = ", ".join(f"{k} {v['wall_s']:.2f}s" for k, v in stages)
+        return f"total {time.perf_counter() - self.t0:.2f}s ({parts})"
+
+    def write_trace(self, path: str) -> None:
+        with self.lock:
+            events = list(self.events)
+        names = {}
+        for e in events:
+            names.setdefault(e["tid"], "main" if e["tid"] == threading.main_thread().ident else f"worker-{len(names)}")
+        meta = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": n}}
+            for tid, n in names.items()
+        ]
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": meta + events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        os.replace(tmp, path)
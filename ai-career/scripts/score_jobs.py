@@ -1,7 +1,18 @@
+import argparse
+import hashlib
 import json
 import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
+
+from dedup import duplicate_refs, group_jobs
+from json_stream import SnapshotWriter, serialize_item
+from keyword_matcher import KeywordMatcher
+from topk import DEFAULT_TOP_K, TopK
 
 ROOT = os.path.dirname(os.path.dirname(__file__))  # ai-career/
 IN_JSON = os.path.join(ROOT, "data", "jobs.json")
@@ -9,25 +20,25 @@ PROFILE_PATH = os.path.join(ROOT, "config", "profile.json")
 
 OUT_JSON = os.path.join(ROOT, "data", "scored_jobs.json")
 OUT_MD = os.path.join(ROOT, "data", "scored_jobs.md")
+SCORE_CACHE_PATH = os.path.join(ROOT, "data", "score_cache.json")
+
+# Bump when score_job's output for the same job/profile changes (invalidates the score cache)
+SCORER_VERSION = 1
+
+# Below this many jobs a process pool costs more than it saves
+PARALLEL_MIN_JOBS = 2000
+CHUNK_SIZE = 500
+# Job fields score_job reads (workers get these only, to keep pickling cheap)
+SCORE_FIELDS = ("id", "company", "title", "location", "url", "source", "content_plain", "content_text")
 
 
 def norm(s: str) -> str:
     return (s or "").lower()
 
 
-def _token_pattern(token: str) -> str:
-    """
-    Boundary-safe regex for tokens.
-    - Hyphenated token like 'co-op': avoid matching inside 'co-opetition'
-      by using alnum boundaries (not \\b).
-    - Normal token: use \\b.
-    """
-    tok = (token or "").strip()
-    if not tok:
-        return r"$^"
-    if "-" in tok:
-        return r"(?<![A-Za-z0-9])" + re.escape(tok) + r"(?![A-Za-z0-9])"
-    return r"\b" + re.escape(tok) + r"\b"
+@lru_cache(maxsize=256)
+def _matcher(keywords: tuple) -> KeywordMatcher:
+    return KeywordMatcher(list(keywords), boundary="word")
 
 
 def hit_list(text: str, keywords):
@@ -36,32 +47,7 @@ def hit_list(text: str, keywords):
     - Phrases (contain space): substring match
     - Tokens (incl hyphenated): boundary-safe regex match
     """
-    t = (text or "").lower()
-    hits = []
-
-    for k in keywords or []:
-        if not (isinstance(k, str) and k.strip()):
-            continue
-        kk = k.strip()
-        k_low = kk.lower()
-
-        if " " in kk:
-            if k_low in t:
-                hits.append(kk)
-            continue
-
-        pattern = _token_pattern(k_low)
-        if re.search(pattern, t, flags=re.IGNORECASE):
-            hits.append(kk)
-
-    seen = set()
-    out = []
-    for x in hits:
-        lx = x.lower()
-        if lx not in seen:
-            seen.add(lx)
-            out.append(x)
-    return out
+    return _matcher(tuple(keywords or ())).hits(text)
 
 
 def contains_any(text: str, keywords) -> bool:
@@ -72,24 +58,7 @@ def contains_any(text: str, keywords) -> bool:
     """
     if not keywords:
         return True
-    t = (text or "").lower()
-
-    for k in keywords or []:
-        if not (isinstance(k, str) and k.strip()):
-            continue
-        kk = k.strip()
-        k_low = kk.lower()
-
-        if " " in kk:
-            if k_low in t:
-                return True
-            continue
-
-        pattern = _token_pattern(k_low)
-        if re.search(pattern, t, flags=re.IGNORECASE):
-            return True
-
-    return False
+    return _matcher(tuple(keywords)).search(text)
 
 
 # ---- identity/eligibility helpers ----
@@ -115,68 +84,84 @@ def term_is_hard_required(contexts, required_patterns, negation_patterns):
     return False
 
 
+# Compiled once per process (score_job runs them against every posting's contexts)
+NEG_CLEARANCE = [re.compile(p) for p in (
+    r"\bno\s+clearance\s+required\b",
+    r"\bclearance\s+not\s+required\b",
+    r"\bnot\s+require\s+(a\s+)?clearance\b",
+    r"\bdoes\s+not\s+require\s+(a\s+)?clearance\b",
+    r"\bpreferred\b.*\bnot\s+required\b",
+    r"\bnot\s+required\b.*\bpreferred\b",
+)]
+REQ_CLEARANCE = [re.compile(p) for p in (
+    r"\b(active\s+)?security\s+clearance\b",
+    r"\bclearance\s+(is\s+)?required\b",
+    r"\bmust\s+(have|hold|obtain)\s+(an?\s+)?clearance\b",
+    r"\brequires?\s+(an?\s+)?clearance\b",
+)]
+NEG_CITIZEN = [re.compile(p) for p in (
+    r"\bnot\s+required\s+to\s+be\s+(a\s+)?(u\.s\.\s+)?citizen\b",
+    r"\bcitizenship\s+not\s+required\b",
+    r"\bpreferred\b.*\bcitizenship\b.*\bnot\s+required\b",
+    r"\bcitizenship\b.*\bpreferred\b.*\bnot\s+required\b",
+)]
+REQ_CITIZEN = [re.compile(p) for p in (
+    r"\b(u\.s\.\s+)?citizen(s)?\s+only\b",
+    r"\bmust\s+be\s+(a\s+)?(u\.s\.\s+)?citizen\b",
+    r"\bcitizenship\s+(is\s+)?required\b",
+    r"\brequires?\s+(u\.s\.\s+)?citizenship\b",
+)]
+
+
+class CompiledProfile:
+    """
+    profile.json with every keyword list compiled into one KeywordMatcher (same
+    matching rules as hit_list/contains_any). Build it once and pass it to score_job;
+    pool workers build their own from the plain dict. Matchers are memoized per
+    keyword list, so building one from an unchanged profile is cheap.
+    """
+
+    def __init__(self, profile: dict):
+        self.profile = profile
+        self.titles = _matcher(tuple(profile.get("titles_target") or ()))
+        self.skills_have = _matcher(tuple(profile.get("skills_have") or ()))
+        self.skills_want = _matcher(tuple(profile.get("skills_want") or ()))
+        self.bonus = _matcher(tuple(profile.get("bonus_keywords") or ()))
+        self.loc_tier1 = _matcher(tuple(profile.get("preferred_locations_tier1") or ()))
+        self.loc_tier2 = _matcher(tuple(profile.get("preferred_locations_tier2") or ()))
+
+
+def compile_profile(profile) -> CompiledProfile:
+    return profile if isinstance(profile, CompiledProfile) else CompiledProfile(profile)
+
+
 def score_job(job, profile):
+    """Score one job; profile is the profile.json dict or a CompiledProfile (faster)."""
+    cp = compile_profile(profile)
     title = job.get("title") or ""
     loc = job.get("location") or ""
     content = job.get("content_plain") or job.get("content_text") or ""
     haystack = f"{title}\n{loc}\n{content}"
+    text = haystack.lower()
 
-    titles_target = profile.get("titles_target") or []
-    skills_have = profile.get("skills_have") or []
-    skills_want = profile.get("skills_want") or []
-    bonus_keywords = profile.get("bonus_keywords") or []
-
-    preferred_locations_tier1 = profile.get("preferred_locations_tier1") or []
-    preferred_locations_tier2 = profile.get("preferred_locations_tier2") or []
-
-    matched_titles = hit_list(title, titles_target)
-    matched_have = hit_list(haystack, skills_have)
-    matched_want = hit_list(haystack, skills_want)
-    matched_bonus = hit_list(haystack, bonus_keywords)
-
-    text = (haystack or "").lower()
-
-    neg_clearance = [
-        r"\bno\s+clearance\s+required\b",
-        r"\bclearance\s+not\s+required\b",
-        r"\bnot\s+require\s+(a\s+)?clearance\b",
-        r"\bdoes\s+not\s+require\s+(a\s+)?clearance\b",
-        r"\bpreferred\b.*\bnot\s+required\b",
-        r"\bnot\s+required\b.*\bpreferred\b",
-    ]
-    req_clearance = [
-        r"\b(active\s+)?security\s+clearance\b",
-        r"\bclearance\s+(is\s+)?required\b",
-        r"\bmust\s+(have|hold|obtain)\s+(an?\s+)?clearance\b",
-        r"\brequires?\s+(an?\s+)?clearance\b",
-    ]
-
-    neg_citizen = [
-        r"\bnot\s+required\s+to\s+be\s+(a\s+)?(u\.s\.\s+)?citizen\b",
-        r"\bcitizenship\s+not\s+required\b",
-        r"\bpreferred\b.*\bcitizenship\b.*\bnot\s+required\b",
-        r"\bcitizenship\b.*\bpreferred\b.*\bnot\s+required\b",
-    ]
-    req_citizen = [
-        r"\b(u\.s\.\s+)?citizen(s)?\s+only\b",
-        r"\bmust\s+be\s+(a\s+)?(u\.s\.\s+)?citizen\b",
-        r"\bcitizenship\s+(is\s+)?required\b",
-        r"\brequires?\s+(u\.s\.\s+)?citizenship\b",
-    ]
+    matched_titles = cp.titles.hits(title)
+    matched_have = cp.skills_have.hits(text, lowered=True)
+    matched_want = cp.skills_want.hits(text, lowered=True)
+    matched_bonus = cp.bonus.hits(text, lowered=True)
 
     hard_flags = []
     soft_flags = []
 
     clearance_ctx = find_contexts(text, "clearance", window=90) + find_contexts(text, "clearence", window=90)
     if clearance_ctx:
-        if term_is_hard_required(clearance_ctx, req_clearance, neg_clearance):
+        if term_is_hard_required(clearance_ctx, REQ_CLEARANCE, NEG_CLEARANCE):
             hard_flags.append("clearance_required")
         else:
             soft_flags.append("clearance_mentioned")
 
     citizen_ctx = find_contexts(text, "citizen", window=90)
     if citizen_ctx:
-        if term_is_hard_required(citizen_ctx, req_citizen, neg_citizen):
+        if term_is_hard_required(citizen_ctx, REQ_CITIZEN, NEG_CITIZEN):
             hard_flags.append("citizen_required")
         else:
             soft_flags.append("citizen_mentioned")
@@ -207,10 +192,10 @@ def score_job(job, profile):
 
     city_score = 0
     city_tier = "none"
-    if preferred_locations_tier1 and contains_any(loc, preferred_locations_tier1):
+    if cp.loc_tier1 and cp.loc_tier1.search(loc):
         city_score = 15
         city_tier = "tier1"
-    elif preferred_locations_tier2 and contains_any(loc, preferred_locations_tier2):
+    elif cp.loc_tier2 and cp.loc_tier2.search(loc):
         city_score = 8
         city_tier = "tier2"
 
@@ -264,24 +249,100 @@ def score_job(job, profile):
     }
 
 
-def write_md(scored, generated_at):
+def profile_cache_key(profile: dict) -> str:
+    """Key for the score cache: changes with profile.json or the scorer itself."""
+    blob = json.dumps({"profile": profile, "scorer": SCORER_VERSION}, sort_keys=True)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def job_content_hash(job: dict) -> str:
+    """Hash of the job fields score_job reads."""
+    blob = json.dumps([job.get(k) for k in SCORE_FIELDS], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def load_score_cache(path: str, key: str):
+    """({content_hash: score_job result}, profile_changed); empty if the profile key changed."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}, False
+    except Exception:
+        return {}, False
+    if isinstance(data, dict) and data.get("key") == key and isinstance(data.get("jobs"), dict):
+        return data["jobs"], False
+    return {}, True
+
+
+def save_score_cache(path: str, key: str, entries: dict) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "jobs": entries}, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+_worker_profile = None
+
+
+def _init_worker(profile: dict) -> None:
+    global _worker_profile
+    _worker_profile = CompiledProfile(profile)
+
+
+def _score_chunk(jobs):
+    return [score_job(j, _worker_profile) for j in jobs]
+
+
+def default_workers(n_jobs: int) -> int:
+    return (os.cpu_count() or 1) if n_jobs >= PARALLEL_MIN_JOBS else 1
+
+
+def iter_scores(jobs, profile: dict, workers: int = 1, chunk_size: int = CHUNK_SIZE):
+    """
+    score_job over jobs, yielded in input order as they are ready. With workers > 1 the
+    jobs are scored in chunks by a process pool (each worker compiles the profile once);
+    results are the same as the serial path.
+    """
+    if workers <= 1 or len(jobs) <= chunk_size:
+        cp = CompiledProfile(profile)
+        for j in jobs:
+            yield score_job(j, cp)
+        return
+    slim = [{k: j.get(k) for k in SCORE_FIELDS} for j in jobs]
+    chunks = [slim[i:i + chunk_size] for i in range(0, len(slim), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(profile,)) as pool:
+        yield from chain.from_iterable(pool.map(_score_chunk, chunks))
+
+
+def score_all(jobs, profile: dict, workers: int = 1, chunk_size: int = CHUNK_SIZE):
+    return list(iter_scores(jobs, profile, workers=workers, chunk_size=chunk_size))
+
+
+def rank_key(x):
+    """Score desc; similarity (when computed) breaks ties."""
+    return int(x.get("score") or 0), x.get("similarity") or 0.0
+
+
+def write_md(top, blocked, total, generated_at):
+    """top / blocked: best-first lists, already cut to the report size (see TopK)."""
     lines = []
     lines.append("# Scored job feed (auto)\n")
     lines.append(f"Generated at (UTC): {generated_at}\n")
-    lines.append(f"Total jobs scored: {len(scored)}\n\n")
-
-    top = [x for x in scored if not x.get("hard_flags")]
-    blocked = [x for x in scored if x.get("hard_flags")]
+    lines.append(f"Total jobs scored: {total}\n\n")
 
     lines.append("## Top internships\n")
-    for x in top[:200]:
+    for x in top:
         lines.append(f"[{x['score']}/100] [{x.get('company')}] {x.get('title')} ({x.get('location')}) — {x.get('url')}\n")
         b = x.get("breakdown") or {}
+        sim = f", similarity {x['similarity']}" if x.get("similarity") is not None else ""
         lines.append(
-            f"breakdown: title {b.get('title',0)}, location {b.get('location',0)}, have {b.get('have',0)}, want+bonus {b.get('want+bonus',0)}, penalty {b.get('penalty',0)}\n"
+            f"breakdown: title {b.get('title',0)}, location {b.get('location',0)}, have {b.get('have',0)}, want+bonus {b.get('want+bonus',0)}, penalty {b.get('penalty',0)}{sim}\n"
         )
         if x.get("soft_flags"):
             lines.append("soft_flags: " + ", ".join(x["soft_flags"]) + "\n")
+        if x.get("duplicates"):
+            lines.append("also posted: " + ", ".join(d.get("url") or d.get("id") or "" for d in x["duplicates"]) + "\n")
         if x.get("matched_titles"):
             lines.append("matched_titles: " + ", ".join(x["matched_titles"]) + "\n")
         if x.get("matched_skills_have"):
@@ -294,7 +355,7 @@ def write_md(scored, generated_at):
 
     if blocked:
         lines.append("## Blocked (hard requirements)\n")
-        for x in blocked[:200]:
+        for x in blocked:
             lines.append(f"[{x['score']}/100] [{x.get('company')}] {x.get('title')} ({x.get('location')}) — {x.get('url')}\n")
             lines.append("hard_flags: " + ", ".join(x["hard_flags"]) + "\n\n")
 
@@ -303,6 +364,17 @@ def write_md(scored, generated_at):
 
 
 def main():
+    ap = argparse.ArgumentParser(description="Score jobs.json against profile.json")
+    ap.add_argument("--workers", type=int, default=0,
+                    help=f"scoring processes (default: one per CPU from {PARALLEL_MIN_JOBS} jobs up, else 1)")
+    ap.add_argument("--no-cache", action="store_true", help="rescore every job (the cache is still rewritten)")
+    ap.add_argument("--similarity", action="store_true",
+                    help="also rank by TF-IDF similarity of each description to the profile keywords")
+    ap.add_argument("--top-k", type=int, default=DEFAULT_TOP_K, help="jobs per section in scored_jobs.md")
+    ap.add_argument("--stream", action="store_true",
+                    help="stream scored_jobs.json in input order as jobs are scored (default: sorted by score)")
+    args = ap.parse_args()
+
     now_utc = datetime.now(timezone.utc).isoformat()
 
     with open(IN_JSON, "r", encoding="utf-8") as f:
@@ -316,7 +388,7 @@ def main():
     with open(PROFILE_PATH, "r", encoding="utf-8") as f:
         profile = json.load(f)
 
-    scored = []
+    unique = []
     seen_ids = set()
     for j in jobs:
         jid = j.get("id")
@@ -324,22 +396,81 @@ def main():
             continue
         if jid:
             seen_ids.add(jid)
-        scored.append(score_job(j, profile))
+        unique.append(j)
+
+    # Near-duplicate postings (same dup_group) are scored once, via the first of the group
+    groups = group_jobs(unique)
+
+    # Only new or changed jobs are rescored; a profile change invalidates every entry
+    cache_key = profile_cache_key(profile)
+    cache, profile_changed = ({}, False) if args.no_cache else load_score_cache(SCORE_CACHE_PATH, cache_key)
+    hashes = [job_content_hash(rep_job) for rep_job, _ in groups]
+    misses = [i for i, h in enumerate(hashes) if not isinstance(cache.get(h), dict)]
+
+    workers = args.workers or default_workers(len(misses))
+    hits = len(groups) - len(misses)
+    cache_stats = {
+        "hits": hits,
+        "misses": len(misses),
+        "hit_rate": round(hits / len(groups), 4) if groups else None,
+        "profile_changed": profile_changed,
+    }
+
+    # Corpus-wide (idf depends on every description), so computed each run rather than cached
+    sims = None
+    similarity_info = None
+    if args.similarity:
+        # Imported here: numpy/scipy (when installed) are only worth loading for --similarity
+        from tfidf import backend as similarity_backend, profile_query, similarity_scores
 
-    # sort by score desc
-    scored.sort(key=lambda x: int(x.get("score") or 0), reverse=True)
+        t0 = time.perf_counter()
+        docs = [f"{j.get('title') or ''}\n{j.get('content_plain') or j.get('content_text') or ''}" for j, _ in groups]
+        sims = similarity_scores(docs, profile_query(profile))
+        similarity_info = {"backend": similarity_backend(), "seconds": round(time.perf_counter() - t0, 3)}
+        print(f"[score_jobs] similarity: {len(docs)} description(s) in {similarity_info['seconds']}s ({similarity_info['backend']})")
 
-    out_payload = {
+    header = {
         "generated_at_utc": now_utc,
         "source_generated_at_utc": payload.get("generated_at_utc"),
-        "count": len(scored),
-        "jobs": scored,
+        "count": len(groups),
+        "duplicates_merged": sum(len(dups) for _, dups in groups),
+        "score_cache": cache_stats,
+        "similarity": similarity_info,
+        "sorted": not args.stream,
     }
 
-    with open(OUT_JSON, "w", encoding="utf-8") as f:
-        json.dump(out_payload, f, ensure_ascii=False, indent=2)
-
-    write_md(scored, now_utc)
+    # The markdown report only needs the top K of each section. With --stream jobs are written
+    # as they are scored and nothing else is kept; by default the JSON is sorted by score.
+    top = TopK(args.top_k, rank_key)
+    blocked = TopK(args.top_k, rank_key)
+    scored = None if args.stream else []
+    entries = {}
+    fresh = iter_scores([groups[i][0] for i in misses], profile, workers=workers)
+    with SnapshotWriter(OUT_JSON, header) as out:
+        for i, ((rep_job, dups), h) in enumerate(zip(groups, hashes)):
+            x = cache.get(h)
+            if not isinstance(x, dict):
+                x = next(fresh)
+            entries[h] = x
+            x = dict(x)
+            if sims is not None:
+                x["similarity"] = round(sims[i], 4)
+            if dups:
+                x["dup_group"] = rep_job.get("dup_group")
+                x["duplicates"] = duplicate_refs(dups)
+            (blocked if x.get("hard_flags") else top).push(x)
+            if scored is not None:
+                scored.append(x)
+            else:
+                out.write_item(serialize_item(x))
+        if scored is not None:
+            scored.sort(key=rank_key, reverse=True)
+            for x in scored:
+                out.write_item(serialize_item(x))
+    save_score_cache(SCORE_CACHE_PATH, cache_key, entries)
+    print(f"[score_jobs] scored {len(misses)} job(s) with {workers} worker(s), {hits} from cache")
+
+    write_md(top.items(), blocked.items(), len(groups), now_utc)
     print(f"[score_jobs] wrote: {OUT_JSON} and {OUT_MD}")
 
 
@@ -0,0 +1,248 @@
+import json
+import os
+import sqlite3
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(__file__))  # ai-career/
+DATA_DIR = os.path.join(ROOT, "data")
+JSON_STATE_PATH = os.path.join(DATA_DIR, "state.json")
+SQLITE_STATE_PATH = os.path.join(DATA_DIR, "state.sqlite")
+
+HIDDEN_STATUSES = ("applied", "ignored", "closed")
+
+# Columns kept as real (indexed) columns; any other record fields go into `extra` (JSON)
+COLUMNS = ("url", "status", "first_seen_date_utc", "last_seen_at_utc", "company", "title")
+
+
+class JsonStateStore:
+    """
+    Original backend: the whole state.json is loaded, mutated in memory and rewritten on commit().
+    """
+
+    def __init__(self, path: str = JSON_STATE_PATH):
+        self.path = path
+        self.state = self._load()
+        self.jobs = self.state["jobs"]
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+                if isinstance(data, dict) and "jobs" in data and isinstance(data["jobs"], dict):
+                    return data
+        except FileNotFoundError:
+            pass
+        except Exception:
+            pass
+        return {"version": 1, "jobs": {}}
+
+    def get(self, jid: str):
+        rec = self.jobs.get(jid)
+        return rec if isinstance(rec, dict) else None
+
+    def get_many(self, ids) -> dict:
+        out = {}
+        for jid in ids:
+            rec = self.get(jid)
+            if rec is not None:
+                out[jid] = rec
+        return out
+
+    def find_by_url(self, url: str):
+        url = (url or "").strip()
+        for jid, rec in self.jobs.items():
+            if isinstance(rec, dict) and (rec.get("url") or "").strip() == url:
+                return jid
+        return None
+
+    def put(self, jid: str, rec: dict) -> None:
+        self.jobs[jid] = rec
+
+    def items(self):
+        return ((jid, rec) for jid, rec in self.jobs.items() if isinstance(rec, dict))
+
+    def commit(self) -> None:
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
+
+    def close(self) -> None:
+        pass
+
+
+class SqliteStateStore:
+    """
+    SQLite backend: one row per job, indexed by id/url/status/first_seen_date_utc/company.
+    Reads and writes touch only the affected rows; commit() makes a run's updates atomic.
+    """
+
+    def __init__(self, path: str = SQLITE_STATE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                url TEXT,
+                status TEXT,
+                first_seen_date_utc TEXT,
+                last_seen_at_utc TEXT,
+                company TEXT,
+                title TEXT,
+                extra TEXT
+            )
+            """
+        )
+        for col in ("url", "status", "first_seen_date_utc", "company"):
+            self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_jobs_{col} ON jobs({col})")
+        self.conn.commit()
+
+    @staticmethod
+    def _to_record(row) -> dict:
+        rec = {}
+        extra = row[-1]
+        if extra:
+            try:
+                rec.update(json.loads(extra))
+            except Exception:
+                pass
+        for col, v in zip(COLUMNS, row[1:-1]):
+            if v is not None:
+                rec[col] = v
+        return rec
+
+    def get(self, jid: str):
+        row = self.conn.execute(f"SELECT id, {', '.join(COLUMNS)}, extra FROM jobs WHERE id = ?", (jid,)).fetchone()
+        return self._to_record(row) if row else None
+
+    def get_many(self, ids) -> dict:
+        ids = [x for x in ids if x]
+        out = {}
+        # Stay well under SQLite's bound-parameter limit
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            sql = f"SELECT id, {', '.join(COLUMNS)}, extra FROM jobs WHERE id IN ({marks})"
+            for row in self.conn.execute(sql, chunk):
+                out[row[0]] = self._to_record(row)
+        return out
+
+    def find_by_url(self, url: str):
+        row = self.conn.execute("SELECT id FROM jobs WHERE url = ? LIMIT 1", ((url or "").strip(),)).fetchone()
+        return row[0] if row else None
+
+    def put(self, jid: str, rec: dict) -> None:
+        extra = {k: v for k, v in rec.items() if k not in COLUMNS}
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO jobs (id, {', '.join(COLUMNS)}, extra) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (jid, *[rec.get(c) for c in COLUMNS], json.dumps(extra, ensure_ascii=False) if extra else None),
+        )
+
+    def items(self):
+        for row in self.conn.execute(f"SELECT id, {', '.join(COLUMNS)}, extra FROM jobs ORDER BY rowid"):
+            yield row[0], self._to_record(row)
+
+    def commit(self) -> None:
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def open_state_store(json_path: str = JSON_STATE_PATH, sqlite_path: str = SQLITE_STATE_PATH):
+    """
+    SQLite is used once state.sqlite exists (created by `state_store.py migrate`);
+    otherwise the JSON file remains the source of truth.
+    """
+    if os.path.exists(sqlite_path):
+        return SqliteStateStore(sqlite_path)
+    return JsonStateStore(json_path)
+
+
+# ---- operations shared by fetch_jobs / mark_job ----
+
+def record_seen(store, jobs, today_str: str, now_iso: str) -> None:
+    """first_seen_date_utc should not change across same-day reruns."""
+    existing = store.get_many([j.get("id") for j in jobs if j.get("id")])
+    for j in jobs:
+        jid = j.get("id")
+        if not jid:
+            continue
+
+        rec = existing.get(jid) or {}
+
+        if not rec.get("first_seen_date_utc"):
+            rec["first_seen_date_utc"] = today_str
+
+        rec["last_seen_at_utc"] = now_iso
+        rec["company"] = j.get("company")
+        rec["title"] = j.get("title")
+        rec["url"] = j.get("url")
+        rec.setdefault("status", "new")  # new/applied/ignored/closed
+
+        existing[jid] = rec
+        store.put(jid, rec)
+
+
+def split_today_backlog(store, jobs, today_str: str):
+    """
+    - TODAY: first_seen_date_utc == today
+    - BACKLOG: older first_seen_date_utc, and not applied/ignored/closed
+    """
+    recs = store.get_many([j.get("id") for j in jobs if j.get("id")])
+    today_jobs = []
+    backlog_jobs = []
+    for j in jobs:
+        rec = recs.get(j.get("id")) or {}
+        first_date = rec.get("first_seen_date_utc") or today_str
+
+        if first_date == today_str:
+            today_jobs.append(j)
+        else:
+            status = (rec.get("status") or "new").lower()
+            if status not in HIDDEN_STATUSES:
+                backlog_jobs.append(j)
+    return today_jobs, backlog_jobs
+
+
+def set_status(store, jid: str, status: str, url: str, now_iso: str, note: str = "") -> dict:
+    rec = store.get(jid) or {}
+    rec["url"] = url
+    rec["status"] = status
+    rec["status_updated_at_utc"] = now_iso
+    if note:
+        rec["note"] = note
+    store.put(jid, rec)
+    return rec
+
+
+def migrate_json_to_sqlite(json_path: str = JSON_STATE_PATH, sqlite_path: str = SQLITE_STATE_PATH) -> int:
+    """One-shot copy of state.json into state.sqlite (existing rows with the same id are replaced)."""
+    src = JsonStateStore(json_path)
+    dst = SqliteStateStore(sqlite_path)
+    n = 0
+    try:
+        for jid, rec in src.items():
+            dst.put(jid, rec)
+            n += 1
+        dst.commit()
+    finally:
+        dst.close()
+    return n
+
+
+def main():
+    """
+    Usage:
+      python ai-career/scripts/state_store.py migrate
+    """
+    if len(sys.argv) < 2 or sys.argv[1] != "migrate":
+        print("Usage: state_store.py migrate")
+        sys.exit(2)
+    n = migrate_json_to_sqlite()
+    print(f"state: migrated {n} job(s) from {JSON_STATE_PATH} to {SQLITE_STATE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
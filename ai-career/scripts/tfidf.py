@@ -0,0 +1,137 @@
+import math
+from collections import Counter, defaultdict
+
+try:
+    import numpy as np  # optional: vectorized weighting and matrix-vector product
+except ImportError:
+    np = None
+
+try:
+    from scipy import sparse  # optional: CSR matrix for the product (numpy arrays otherwise)
+except ImportError:
+    sparse = None
+
+# Tokens are runs of [a-z0-9+#] ("c++", "c#"; "vue.js" -> "vue", "js"). Everything else
+# becomes a space, so tokenizing is str.translate + str.split, both in C.
+TOKEN_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789+#")
+SEPARATORS = {c: " " for c in range(128) if chr(c) not in TOKEN_CHARS}
+SEPARATORS.update({ord(c): " " for c in "\u00a0\u2013\u2014\u2018\u2019\u201c\u201d\u2022\u2026"})
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the this to "
+    "we will with you your their they who what which about into across all can more other "
+    "such than these those using work working team teams role".split()
+)
+
+# Profile lists that make up the query "document"
+QUERY_FIELDS = ("titles_target", "skills_have", "skills_want", "bonus_keywords")
+
+
+def term_counts(text: str) -> Counter:
+    """Token counts, stopwords included (they get zero weight in similarity_scores)."""
+    return Counter((text or "").lower().translate(SEPARATORS).split())
+
+
+def profile_query(profile: dict) -> Counter:
+    """Term counts of the profile's keyword lists, treated as one query document."""
+    c = Counter()
+    for field in QUERY_FIELDS:
+        for k in profile.get(field) or []:
+            if isinstance(k, str):
+                c.update(term_counts(k))
+    for s in STOPWORDS & c.keys():
+        del c[s]
+    return c
+
+
+def backend() -> str:
+    if np is None:
+        return "python"
+    return "scipy" if sparse is not None else "numpy"
+
+
+def similarity_scores(docs, query: Counter):
+    """
+    Cosine similarity between each document and the query under TF-IDF weighting
+    (sublinear tf, smoothed idf over docs, stopwords ignored). Returns a list of floats in [0, 1], one per doc.
+
+    With numpy the corpus is one sparse matrix (CSR arrays) and the scores are a single
+    matrix-vector product; without it the same weights are computed in pure Python.
+    """
+    counts = [term_counts(d) for d in docs]
+    if not counts or not query:
+        return [0.0] * len(counts)
+    if np is not None:
+        return _scores_numpy(counts, query)
+    return _scores_python(counts, query)
+
+
+def _idf(n: int, df: int) -> float:
+    return math.log((1 + n) / (1 + df)) + 1.0
+
+
+def _scores_python(counts, query: Counter):
+    n = len(counts)
+    df = Counter()
+    for c in counts:
+        df.update(c.keys())
+    idf = {t: _idf(n, d) for t, d in df.items()}
+
+    q = {t: (1.0 + math.log(tf)) * idf[t] for t, tf in query.items() if t in idf}
+    q_norm = math.sqrt(sum(w * w for w in q.values()))
+    if not q_norm:
+        return [0.0] * n
+
+    out = []
+    for c in counts:
+        dot = 0.0
+        for t, qw in q.items():
+            tf = c.get(t)
+            if tf:
+                dot += (1.0 + math.log(tf)) * idf[t] * qw
+        if not dot:
+            out.append(0.0)
+            continue
+        norm = math.sqrt(sum(((1.0 + math.log(tf)) * idf[t]) ** 2 for t, tf in c.items() if t not in STOPWORDS))
+        out.append(dot / (norm * q_norm))
+    return out
+
+
+def _scores_numpy(counts, query: Counter):
+    n = len(counts)
+    # Term ids in order of first appearance; lookups and inserts stay in C
+    vocab = defaultdict()
+    vocab.default_factory = vocab.__len__
+    indices = []
+    tfs = []
+    indptr = [0]
+    for c in counts:
+        indices.extend(map(vocab.__getitem__, c))
+        tfs.extend(c.values())
+        indptr.append(len(indices))
+
+    indices = np.asarray(indices, dtype=np.int64)
+    indptr = np.asarray(indptr, dtype=np.int64)
+    df = np.bincount(indices, minlength=len(vocab))
+    idf = np.log((1.0 + n) / (1.0 + df)) + 1.0
+    stop = [vocab[t] for t in STOPWORDS if t in vocab]
+    idf[stop] = 0.0
+    weights = (1.0 + np.log(np.asarray(tfs, dtype=np.float64))) * idf[indices]
+
+    q = np.zeros(len(vocab))
+    for t, tf in query.items():
+        i = vocab.get(t)
+        if i is not None:
+            q[i] = (1.0 + math.log(tf)) * idf[i]
+    q_norm = np.sqrt(q @ q)
+    if not q_norm:
+        return [0.0] * n
+
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=n))
+    if sparse is not None:
+        dots = sparse.csr_matrix((weights, indices, indptr), shape=(n, len(vocab))) @ q
+    else:
+        dots = np.bincount(rows, weights=weights * q[indices], minlength=n)
+    scores = np.divide(dots, norms * q_norm, out=np.zeros(n), where=norms > 0)
+    return scores.tolist()
@@ -0,0 +1,48 @@
+import heapq
+from itertools import count
+
+DEFAULT_TOP_K = 200
+
+
+class TopK:
+    """
+    The k largest items pushed so far, by key, in O(k) memory (min-heap of size k).
+    items() equals sorted(everything, key=key, reverse=True)[:k]: ties keep push order.
+
+    top = TopK(200, key=lambda x: x["score"])
+    for x in stream:
+        top.push(x)
+    best = top.items()
+    """
+
+    def __init__(self, k: int, key):
+        self.k = max(0, int(k))
+        self.key = key
+        self.heap = []
+        self.seq = count()
+        self.seen = 0
+
+    def push(self, item) -> None:
+        self.seen += 1
+        if not self.k:
+            return
+        # Among equal keys the later item is "smaller", so it is evicted first
+        entry = (self.key(item), -next(self.seq), item)
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, entry)
+        elif entry[:2] > self.heap[0][:2]:
+            heapq.heapreplace(self.heap, entry)
+
+    def __len__(self) -> int:
+        return self.seen
+
+    def items(self) -> list:
+        return [e[2] for e in sorted(self.heap, key=lambda e: e[:2], reverse=True)]
+
+
+def top_k(items, k: int, key) -> list:
+    """sorted(items, key=key, reverse=True)[:k] without sorting everything."""
+    top = TopK(k, key)
+    for x in items:
+        top.push(x)
+    return top.items()
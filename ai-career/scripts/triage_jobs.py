@@ -1,7 +1,17 @@
+import argparse
+import hashlib
 import json
 import os
+import queue
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from itertools import chain
+
+from dedup import duplicate_refs, group_jobs
+import jd_parser
+from eligibility import RULESET_VERSION, assess
 
 ROOT = os.path.dirname(os.path.dirname(__file__))  # ai-career/
 IN_TODAY_JSON = os.path.join(ROOT, "data", "jobs_today.json")
@@ -9,6 +19,23 @@ PROFILE_PATH = os.path.join(ROOT, "config", "profile.json")
 
 OUT_DIR = os.path.join(ROOT, "data", "triage")
 ARCHIVE_DIR = os.path.join(OUT_DIR, "by_day")
+TRIAGE_CACHE_PATH = os.path.join(ROOT, "data", "triage_cache.json")
+
+# Bump when triage_one, extract_sections or the card layout change (invalidates the triage cache)
+TRIAGE_VERSION = 1
+
+# Below this many jobs a process pool costs more than it saves
+PARALLEL_MIN_JOBS = 1000
+CHUNK_SIZE = 100
+# Job cards the writer thread takes off its queue per flush
+WRITE_BATCH = 64
+
+# Job fields triage_one reads (all a worker process is sent)
+TRIAGE_FIELDS = ("id", "title", "location", "url", "company", "source", "content_plain", "content_text", "dup_group")
+
+# Card header lines that change every run (re-stamped on cards reused from the triage cache)
+CARD_DATE_RE = re.compile(r"^Date \(UTC\): .*\n", re.M)
+CARD_GENERATED_RE = re.compile(r"^Generated at \(UTC\): .*\n", re.M)
 
 # ---------------- helpers ----------------
 
@@ -65,236 +92,21 @@ def hit_list(text: str, keywords):
             out.append(x)
     return out
 
-def find_contexts(text: str, term: str, window: int = 90):
-    if not text:
-        return []
-    t = text.lower()
-    term = term.lower()
-    ctx = []
-    for m in re.finditer(re.escape(term), t):
-        start = max(0, m.start() - window)
-        end = min(len(t), m.end() + window)
-        ctx.append(t[start:end])
-    return ctx
-
-def term_is_hard_required(contexts, required_patterns, negation_patterns):
-    for c in contexts:
-        if any(re.search(p, c) for p in negation_patterns):
-            continue
-        if any(re.search(p, c) for p in required_patterns):
-            return True
-    return False
-
-def _split_sentences(text: str):
-    if not text:
-        return []
-    t = re.sub(r"\s+", " ", text.strip())
-    parts = re.split(r"(?<=[.!?])\s+", t)
-    return [p.strip() for p in parts if len(p.strip()) >= 20]
-
-def _highlight_phrases(text: str, phrases):
-    out = text
-    uniq = []
-    seen = set()
-    for p in (phrases or []):
-        if not p:
-            continue
-        pl = p.lower()
-        if pl not in seen:
-            seen.add(pl)
-            uniq.append(p)
-    for ph in sorted(uniq, key=len, reverse=True):
-        out = re.sub(re.escape(ph), f"<<{ph}>>", out, flags=re.IGNORECASE)
-    return out
-
-def _pick_evidence_sentences(text: str, phrases, max_sentences: int = 2):
-    sents = _split_sentences(text)
-    hits = []
-    phrases_low = [p.lower() for p in (phrases or []) if p]
-
-    for s in sents:
-        sl = s.lower()
-        if any(p in sl for p in phrases_low):
-            hits.append(_highlight_phrases(s, phrases))
-        if len(hits) >= max_sentences:
-            break
-
-    if not hits:
-        snippet = (text or "").strip().replace("\n", " ")
-        snippet = snippet[:220] + ("..." if len(snippet) > 220 else "")
-        if snippet:
-            hits = [_highlight_phrases(snippet, phrases)]
-    return hits
-
-def classify_clearance(text: str):
-    """
-    CLEAR / BLOCK / REVIEW / NONE + evidence (plain-text highlighted)
-    Conservative BLOCK; prioritize CLEAR to avoid false blocks.
-    """
-    if not text:
-        return {"status": "NONE", "evidence": []}
-
-    lower = text.lower()
-
-    neg_phrases = [
-        "no clearance required",
-        "no security clearance required",
-        "security clearance not required",
-        "clearance is not required",
-        "clearance not required",
-        "do not require a security clearance",
-        "does not require a security clearance",
-    ]
-
-    pos_phrases = [
-        "ts/sci",
-        "ts-sci",
-        "top secret",
-        "secret clearance",
-        "active security clearance",
-        "current security clearance",
-        "must have a security clearance",
-        "must have security clearance",
-        "ability to obtain a security clearance",
-        "able to obtain a security clearance",
-        "eligible for a security clearance",
-        "eligible for security clearance",
-    ]
-
-    weak_triggers = [
-        "security clearance",
-        "clearance",
-        "ts/sci",
-        "top secret",
-    ]
-
-    # Handle misspelling clearence
-    if "clearence" in lower and "clearance" not in lower:
-        lower = lower.replace("clearence", "clearance")
-        text = re.sub(r"clearence", "clearance", text, flags=re.IGNORECASE)
-
-    if any(p in lower for p in neg_phrases):
-        return {"status": "CLEAR", "evidence": _pick_evidence_sentences(text, neg_phrases)}
-    if any(p in lower for p in pos_phrases):
-        return {"status": "BLOCK", "evidence": _pick_evidence_sentences(text, pos_phrases)}
-    if any(p in lower for p in weak_triggers):
-        return {"status": "REVIEW", "evidence": _pick_evidence_sentences(text, weak_triggers)}
-    return {"status": "NONE", "evidence": []}
-
 def extract_sections(text: str):
     """
     Very simple JD section extractor:
     tries to find chunks under headings like Responsibilities/Requirements/Qualifications/Preferred/Benefits.
+    (The parsing lives in jd_parser; this returns the section texts.)
     """
-    t = (text or "")
-    lines = [ln.strip() for ln in t.splitlines()]
-    lines = [ln for ln in lines if ln]
-
-    headings = {
-        "responsibilities": ["responsibilities", "what you’ll do", "what you'll do", "you will", "role", "the role"],
-        "requirements": ["requirements", "required", "must have", "minimum qualifications"],
-        "qualifications": ["qualifications", "basic qualifications"],
-        "preferred": ["preferred", "nice to have", "bonus", "preferred qualifications"],
-        "benefits": ["benefits", "perks", "compensation", "salary"]
-    }
-
-    idx_to_key = {}
-    for i, ln in enumerate(lines):
-        low = ln.lower().strip(":")
-        for key, keys in headings.items():
-            for k in keys:
-                if low == k or low.startswith(k + ":"):
-                    idx_to_key[i] = key
-
-    if not idx_to_key:
-        return {"summary": "\n".join(lines[:25])}
-
-    section_keys = []
-    for i in sorted(idx_to_key.keys()):
-        section_keys.append((i, idx_to_key[i]))
-    section_keys.append((len(lines), "__end__"))
-
-    out = {}
-    for n in range(len(section_keys) - 1):
-        start_i, key = section_keys[n]
-        end_i, _ = section_keys[n + 1]
-        chunk = lines[start_i+1:end_i]
-        if chunk:
-            out[key] = "\n".join(chunk[:60])  # keep a bit more, we'll trim later in rendering
-    return out
-
-def _to_bullets(text: str, max_items: int):
-    """
-    Convert multi-line section text into bullet lines, capped.
-    """
-    if not text:
-        return []
-    raw_lines = [ln.strip(" •\t-").strip() for ln in text.splitlines()]
-    raw_lines = [ln for ln in raw_lines if ln]
-    return raw_lines[:max_items]
-
-def _split_embedded_headings(lines):
-    """
-    Some sections contain embedded headings like 'WHAT YOU'LL NEED' or 'NICE TO HAVES'.
-    Split them out so Responsibilities doesn't swallow Requirements.
-    """
-    if not lines:
-        return {"main": []}
-
-    markers_req = [
-        "what you'll need",
-        "what you’ll need",
-        "requirements",
-        "minimum qualifications",
-        "qualifications",
-    ]
-    markers_pref = [
-        "nice to have",
-        "nice-to-have",
-        "nice to haves",
-        "nice-to-haves",
-        "preferred",
-        "preferred qualifications",
-        "bonus",
-    ]
-
-    buckets = {"main": [], "requirements": [], "preferred": []}
-    mode = "main"
-
-    for ln in lines:
-        low = ln.lower().strip(":").strip()
-
-        if any(m == low or low.startswith(m) for m in markers_req):
-            mode = "requirements"
-            continue
-        if any(m == low or low.startswith(m) for m in markers_pref):
-            mode = "preferred"
-            continue
-
-        buckets[mode].append(ln)
-
-    return buckets
-
-def _extract_pay_lines(benefits_text: str, max_lines: int = 2):
-    """
-    Keep only the strongest comp signals to reduce noise.
-    """
-    if not benefits_text:
-        return ""
-    lines = [ln.strip() for ln in benefits_text.splitlines() if ln.strip()]
-    keep = []
-    for ln in lines:
-        low = ln.lower()
-        # keep only strong pay/comp signals
-        if ("$" in ln) or ("housing" in low) or ("hourly" in low) or ("monthly rate" in low) or ("salary" in low) or ("compensation" in low):
-            keep.append(ln)
-        if len(keep) >= max_lines:
-            break
-    return "\n".join(keep)
+    return jd_parser.parse(text).section_texts()
 
 # ---------------- triage logic ----------------
 
 def triage_one(job: dict, profile: dict):
+    return _triage(job, profile)[0]
+
+def _triage(job: dict, profile: dict):
+    """(triage result, {section key: jd_parser blocks}) -- the blocks are what the card renders."""
     title = job.get("title") or ""
     loc = job.get("location") or ""
     url = job.get("url") or ""
@@ -313,23 +125,12 @@ def triage_one(job: dict, profile: dict):
     matched_want = hit_list(haystack, skills_want)
     matched_bonus = hit_list(haystack, bonus_keywords)
 
-    text_low = haystack.lower()
-
-    neg_citizen = [
-        r"\bcitizenship\s+not\s+required\b",
-        r"\bnot\s+required\s+to\s+be\s+(a\s+)?(u\.s\.\s+)?citizen\b",
-    ]
-    req_citizen = [
-        r"\b(u\.s\.\s+)?citizen(s)?\s+only\b",
-        r"\bmust\s+be\s+(a\s+)?(u\.s\.\s+)?citizen\b",
-        r"\bcitizenship\s+(is\s+)?required\b",
-        r"\brequires?\s+(u\.s\.\s+)?citizenship\b",
-    ]
-
     hard_flags = []
     soft_flags = []
 
-    clr = classify_clearance(haystack)
+    # Clearance and citizenship rules in one scan (see eligibility.py)
+    elig = assess(haystack)
+    clr = elig["clearance"]
     clearance_status = clr.get("status") or "NONE"
     clearance_evidence = clr.get("evidence") or []
 
@@ -340,22 +141,22 @@ def triage_one(job: dict, profile: dict):
     elif clearance_status == "CLEAR":
         soft_flags.append("clearance_not_required")
 
-    citizen_ctx = find_contexts(text_low, "citizen", window=90)
-    if citizen_ctx:
-        if term_is_hard_required(citizen_ctx, req_citizen, neg_citizen):
-            hard_flags.append("citizen_required")
-        else:
-            soft_flags.append("citizen_mentioned")
+    if elig["citizenship"] == "REQUIRED":
+        hard_flags.append("citizen_required")
+    elif elig["citizenship"] == "MENTIONED":
+        soft_flags.append("citizen_mentioned")
 
-    sections = extract_sections(content)
+    # Description tokenized once; sections, bullets and pay lines all come from its blocks
+    blocks = dict(jd_parser.parse(content).sections)
 
     # Tighten benefits to only strong comp signals
-    if isinstance(sections, dict) and sections.get("benefits"):
-        pay = _extract_pay_lines(sections.get("benefits") or "", max_lines=2)
+    if blocks.get("benefits"):
+        pay = jd_parser.pay_blocks(blocks["benefits"], max_lines=2)
         if pay:
-            sections["benefits"] = pay
+            blocks["benefits"] = pay
         else:
-            sections.pop("benefits", None)
+            blocks.pop("benefits", None)
+    sections = jd_parser.section_texts(blocks)
 
     suggestion = "Maybe"
     if hard_flags:
@@ -364,7 +165,7 @@ def triage_one(job: dict, profile: dict):
         if matched_titles and (len(matched_have) + len(matched_want) >= 2):
             suggestion = "Apply"
 
-    return {
+    tri = {
         "id": job.get("id"),
         "company": company,
         "title": title,
@@ -380,10 +181,21 @@ def triage_one(job: dict, profile: dict):
         "soft_flags": soft_flags,
         "sections": sections,
         "clearance_status": clearance_status,
-        "clearance_evidence": clearance_evidence
+        "clearance_evidence": clearance_evidence,
     }
+    return tri, blocks
+
+def render_job_md(tri: dict, today_str: str, generated_at: str, blocks=None) -> str:
+    """
+    Job card markdown. blocks: the {section key: jd_parser blocks} from triage (tokenized
+    from tri["sections"] when not given). Note: sections that the responsibilities swallowed
+    are moved into tri["sections"] (_embedded_requirements / _embedded_preferred) and end up
+    in triage.json.
+    """
+    sections = tri.get("sections") or {}
+    if blocks is None:
+        blocks = {key: jd_parser.tokenize(text) for key, text in sections.items() if isinstance(text, str)}
 
-def write_job_md(path: str, tri: dict, today_str: str, generated_at: str):
     lines = []
     lines.append(f"# {tri['company']} — {tri['title']}\n\n")
 
@@ -393,6 +205,8 @@ def write_job_md(path: str, tri: dict, today_str: str, generated_at: str):
     lines.append(f"Location: {tri.get('location') or 'N/A'}\n")
     lines.append(f"Source: {tri.get('source') or 'N/A'}\n")
     lines.append(f"Link: {tri.get('url') or ''}\n")
+    for d in tri.get("duplicates") or []:
+        lines.append(f"Also posted: {d.get('url') or d.get('id')} ({d.get('source') or 'N/A'}, {d.get('location') or 'N/A'})\n")
     lines.append(f"Suggestion: {tri.get('suggestion')}\n\n")
 
     # QUICK READ
@@ -427,23 +241,22 @@ def write_job_md(path: str, tri: dict, today_str: str, generated_at: str):
     # JD sections (bulleted + capped + split embedded headings)
     lines.append("## JD (TRIMMED)\n")
 
-    sections = tri.get("sections") or {}
-
     # Summary
-    if sections.get("summary"):
-        sum_lines = _to_bullets(sections.get("summary"), max_items=6)
+    if blocks.get("summary"):
+        sum_lines = jd_parser.bullets(blocks["summary"], max_items=6)
         if sum_lines:
             lines.append("\n### SUMMARY\n")
             for ln in sum_lines:
                 lines.append(f"- {ln}\n")
 
     # Responsibilities
-    if sections.get("responsibilities"):
-        base = _to_bullets(sections.get("responsibilities"), max_items=18)
-        buckets = _split_embedded_headings(base)
-        resp = buckets.get("main") or []
-        req_embedded = buckets.get("requirements") or []
-        pref_embedded = buckets.get("preferred") or []
+    req_embedded = []
+    pref_embedded = []
+    if blocks.get("responsibilities"):
+        buckets = jd_parser.split_embedded(jd_parser.bullets(blocks["responsibilities"], max_items=18))
+        resp = buckets["main"]
+        req_embedded = buckets["requirements"]
+        pref_embedded = buckets["preferred"]
 
         if resp:
             lines.append("\n### RESPONSIBILITIES (top)\n")
@@ -452,45 +265,192 @@ def write_job_md(path: str, tri: dict, today_str: str, generated_at: str):
 
         # If responsibilities section swallowed requirements, put them where they belong
         if req_embedded:
-            # merge into requirements later
             sections["_embedded_requirements"] = "\n".join(req_embedded)
         if pref_embedded:
             sections["_embedded_preferred"] = "\n".join(pref_embedded)
 
-    # Requirements
-    req_text = sections.get("requirements") or sections.get("qualifications") or ""
-    if sections.get("_embedded_requirements"):
-        req_text = (req_text + "\n" + sections.get("_embedded_requirements")).strip()
-
-    if req_text:
-        req_lines = _to_bullets(req_text, max_items=10)
-        if req_lines:
-            lines.append("\n### REQUIREMENTS (top)\n")
-            for ln in req_lines[:8]:
-                lines.append(f"- {ln}\n")
+    # Requirements (+ those embedded in responsibilities)
+    req_lines = jd_parser.bullets(blocks.get("requirements") or blocks.get("qualifications") or [], max_items=10)
+    if req_embedded:
+        req_lines = (req_lines + jd_parser.bullets(jd_parser.tokenize("\n".join(req_embedded)), max_items=10))[:10]
+    if req_lines:
+        lines.append("\n### REQUIREMENTS (top)\n")
+        for ln in req_lines[:8]:
+            lines.append(f"- {ln}\n")
 
     # Preferred / Nice-to-have
-    pref_text = sections.get("preferred") or ""
-    if sections.get("_embedded_preferred"):
-        pref_text = (pref_text + "\n" + sections.get("_embedded_preferred")).strip()
-
-    if pref_text:
-        pref_lines = _to_bullets(pref_text, max_items=8)
-        if pref_lines:
-            lines.append("\n### PREFERRED / NICE-TO-HAVE (top)\n")
-            for ln in pref_lines[:5]:
-                lines.append(f"- {ln}\n")
+    pref_lines = jd_parser.bullets(blocks.get("preferred") or [], max_items=8)
+    if pref_embedded:
+        pref_lines = (pref_lines + jd_parser.bullets(jd_parser.tokenize("\n".join(pref_embedded)), max_items=8))[:8]
+    if pref_lines:
+        lines.append("\n### PREFERRED / NICE-TO-HAVE (top)\n")
+        for ln in pref_lines[:5]:
+            lines.append(f"- {ln}\n")
 
     # Benefits (pay only)
-    if sections.get("benefits"):
-        ben_lines = _to_bullets(sections.get("benefits"), max_items=3)
+    if blocks.get("benefits"):
+        ben_lines = jd_parser.bullets(blocks["benefits"], max_items=3)
         if ben_lines:
             lines.append("\n### COMPENSATION (pay only)\n")
             for ln in ben_lines[:2]:
                 lines.append(f"- {ln}\n")
 
+    return "".join(lines)
+
+def write_job_md(path: str, tri: dict, today_str: str, generated_at: str):
     with open(path, "w", encoding="utf-8") as f:
-        f.writelines(lines)
+        f.write(render_job_md(tri, today_str, generated_at))
+
+class BatchWriter:
+    """
+    Writes (path, text) files on a background thread, taking up to batch_size queued files
+    per flush, so card rendering never waits on the disk. Files are written in put() order.
+    The first write error is raised from put() or close().
+
+    with BatchWriter() as w:
+        w.put(path, text)
+    """
+
+    def __init__(self, batch_size: int = WRITE_BATCH):
+        self.batch_size = max(1, int(batch_size))
+        self.q = queue.Queue(maxsize=self.batch_size * 4)
+        self.error = None
+        self.written = 0
+        self.thread = threading.Thread(target=self._run, name="triage-writer", daemon=True)
+        self.thread.start()
+
+    def put(self, path: str, text: str) -> None:
+        if self.error is not None:
+            raise self.error
+        self.q.put((path, text))
+
+    def _run(self):
+        done = False
+        while not done:
+            batch = [self.q.get()]
+            while len(batch) < self.batch_size and batch[-1] is not None:
+                try:
+                    batch.append(self.q.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                done = True
+                batch.pop()
+            if self.error is not None:
+                continue  # keep draining so put() never blocks
+            try:
+                for path, text in batch:
+                    with open(path, "w", encoding="utf-8") as f:
+                        f.write(text)
+                    self.written += 1
+            except OSError as e:
+                self.error = e
+
+    def close(self) -> None:
+        if self.thread.is_alive():
+            self.q.put(None)
+            self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self.thread.is_alive():
+            self.q.put(None)
+            self.thread.join()
+        return False
+
+# ---------------- serial / process-pool triage ----------------
+
+def triage_entry(job: dict, dup_refs, profile: dict, today_str: str, generated_at: str):
+    """(triage result, job card markdown) for one job; dup_refs lists its near-duplicates."""
+    tri, blocks = _triage(job, profile)
+    if dup_refs:
+        tri["dup_group"] = job.get("dup_group")
+        tri["duplicates"] = dup_refs
+    return tri, render_job_md(tri, today_str, generated_at, blocks)
+
+def _init_worker(profile: dict, today_str: str, generated_at: str) -> None:
+    global _worker_args
+    _worker_args = (profile, today_str, generated_at)
+
+def _triage_chunk(tasks):
+    return [triage_entry(job, refs, *_worker_args) for job, refs in tasks]
+
+def default_workers(n_jobs: int) -> int:
+    return (os.cpu_count() or 1) if n_jobs >= PARALLEL_MIN_JOBS else 1
+
+def triage_tasks(jobs):
+    """(job, dup_refs) per dup group representative, in group_jobs order."""
+    return [(job, duplicate_refs(dups) if dups else None) for job, dups in group_jobs(jobs)]
+
+def iter_triage(tasks, profile: dict, today_str: str, generated_at: str,
+                workers: int = 1, chunk_size: int = CHUNK_SIZE):
+    """
+    (triage result, markdown) per (job, dup_refs) task, in order. With workers > 1 chunks
+    of jobs are triaged and rendered by a process pool; results are the same as the serial
+    path.
+    """
+    if workers <= 1 or len(tasks) <= chunk_size:
+        for job, refs in tasks:
+            yield triage_entry(job, refs, profile, today_str, generated_at)
+        return
+    slim = [({k: job.get(k) for k in TRIAGE_FIELDS}, refs) for job, refs in tasks]
+    chunks = [slim[i:i + chunk_size] for i in range(0, len(slim), chunk_size)]
+    initargs = (profile, today_str, generated_at)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        yield from chain.from_iterable(pool.map(_triage_chunk, chunks))
+
+# ---------------- triage cache ----------------
+
+def triage_cache_key(profile: dict) -> str:
+    """Key for the triage cache: changes with profile.json, triage/card code or the eligibility rules."""
+    blob = json.dumps({"profile": profile, "triage": TRIAGE_VERSION, "rules": RULESET_VERSION}, sort_keys=True)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+def job_content_hash(job: dict, dup_refs) -> str:
+    """Hash of the job fields triage_one reads plus the duplicates listed on its card."""
+    blob = json.dumps([[job.get(k) for k in TRIAGE_FIELDS], dup_refs], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+def load_triage_cache(path: str, key: str):
+    """({content_hash: {"item", "card"}}, profile_changed); empty if the key changed."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}, False
+    except Exception:
+        return {}, False
+    if isinstance(data, dict) and data.get("key") == key and isinstance(data.get("jobs"), dict):
+        return data["jobs"], False
+    return {}, True
+
+def save_triage_cache(path: str, key: str, entries: dict) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "jobs": entries}, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+def cached_card(entry) -> str:
+    """Markdown of a cache entry's card, or None if the entry or its card is gone."""
+    if not (isinstance(entry, dict) and isinstance(entry.get("item"), dict) and entry.get("card")):
+        return None
+    try:
+        with open(os.path.join(OUT_DIR, entry["card"]), "r", encoding="utf-8") as f:
+            text = f.read()
+    except OSError:
+        return None
+    return text if CARD_DATE_RE.search(text) and CARD_GENERATED_RE.search(text) else None
+
+def restamp_card(text: str, today_str: str, generated_at: str) -> str:
+    """A cached card with today's "Date (UTC)" / "Generated at (UTC)" header lines."""
+    text = CARD_DATE_RE.sub(lambda m: f"Date (UTC): {today_str}\n", text, count=1)
+    return CARD_GENERATED_RE.sub(lambda m: f"Generated at (UTC): {generated_at}\n", text, count=1)
 
 def write_index_md(path: str, items: list, today_str: str, generated_at: str):
     lines = []
@@ -548,6 +508,12 @@ def write_index_md(path: str, items: list, today_str: str, generated_at: str):
         f.writelines(lines)
 
 def main():
+    ap = argparse.ArgumentParser(description="Triage jobs_today.json into per-job markdown cards")
+    ap.add_argument("--workers", type=int, default=0,
+                    help=f"triage processes (default: one per CPU from {PARALLEL_MIN_JOBS} jobs up, else 1)")
+    ap.add_argument("--no-cache", action="store_true", help="re-triage every job (the cache is still rewritten)")
+    args = ap.parse_args()
+
     os.makedirs(OUT_DIR, exist_ok=True)
     os.makedirs(ARCHIVE_DIR, exist_ok=True)
 
@@ -568,22 +534,60 @@ def main():
     day_dir = os.path.join(ARCHIVE_DIR, today_str)
     os.makedirs(day_dir, exist_ok=True)
 
+    # Near-duplicate postings (same dup_group) get one triage note, listing the other postings
+    tasks = triage_tasks(jobs)
+
+    # Unchanged jobs reuse their last card (header re-dated) and triage result; a profile, rule or
+    # triage code change invalidates every entry
+    cache_key = triage_cache_key(profile)
+    cache, profile_changed = ({}, False) if args.no_cache else load_triage_cache(TRIAGE_CACHE_PATH, cache_key)
+    hashes = [job_content_hash(job, refs) for job, refs in tasks]
+    cards = [cached_card(cache.get(h)) for h in hashes]
+    misses = [i for i, card in enumerate(cards) if card is None]
+
+    workers = args.workers if args.workers > 0 else default_workers(len(misses))
+    hits = len(tasks) - len(misses)
+
     out_items = []
-    for job in jobs:
-        tri = triage_one(job, profile)
-        jid = tri.get("id") or safe_filename(tri.get("url") or tri.get("title") or "job")
-        md_name = safe_filename(jid) + ".md"
-        md_path = os.path.join(day_dir, md_name)
+    entries = {}
+    fresh = iter_triage([tasks[i] for i in misses], profile, today_str, generated_at, workers=workers)
+    with BatchWriter() as writer:
+        for h, card in zip(hashes, cards):
+            if card is None:
+                tri, md_text = next(fresh)
+            else:
+                tri = dict(cache[h]["item"])
+            jid = tri.get("id") or safe_filename(tri.get("url") or tri.get("title") or "job")
+            md_name = safe_filename(jid) + ".md"
+            md_path = os.path.join(day_dir, md_name)
 
-        write_job_md(md_path, tri, today_str, generated_at)
-        tri["md_relpath"] = os.path.relpath(md_path, OUT_DIR)
+            if card is None:
+                writer.put(md_path, md_text)
+            else:
+                writer.put(md_path, restamp_card(card, today_str, generated_at))
+            entries[h] = {"item": dict(tri), "card": os.path.relpath(md_path, OUT_DIR)}
+            tri["md_relpath"] = os.path.relpath(md_path, OUT_DIR)
+
+            out_items.append(tri)
 
-        out_items.append(tri)
+    cache_stats = {
+        "hits": hits,
+        "misses": len(misses),
+        "hit_rate": round(hits / len(tasks), 4) if tasks else None,
+        "profile_changed": profile_changed,
+    }
+    save_triage_cache(TRIAGE_CACHE_PATH, cache_key, entries)
 
     out_json = os.path.join(day_dir, "triage.json")
     with open(out_json, "w", encoding="utf-8") as f:
         json.dump(
-            {"date_utc": today_str, "generated_at_utc": generated_at, "count": len(out_items), "items": out_items},
+            {
+                "date_utc": today_str,
+                "generated_at_utc": generated_at,
+                "count": len(out_items),
+                "triage_cache": cache_stats,
+                "items": out_items,
+            },
             f,
             ensure_ascii=False,
             indent=2
@@ -593,6 +597,8 @@ def main():
     write_index_md(index_md, out_items, today_str, generated_at)
 
     print(f"triage: wrote {len(out_items)} items into {day_dir}")
+    print(f"triage: {len(misses)} triaged ({workers} worker(s)), {hits} reused from cache"
+          f"{' (profile changed)' if profile_changed else ''}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,116 @@
+import json
+import os
+import sys
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from state_store import JSON_STATE_PATH, SQLITE_STATE_PATH, open_state_store
+
+ROOT = os.path.dirname(os.path.dirname(__file__))  # ai-career/
+URL_INDEX_PATH = os.path.join(ROOT, "data", "url_index.json")
+
+# Query parameters that only say where a link was clicked (never which job it is)
+TRACKING_PARAMS = frozenset({"gh_src", "lever-source", "lever-origin", "ref", "source", "src"})
+TRACKING_PREFIXES = ("utm_",)
+
+
+def normalize_url(url: str) -> str:
+    """
+    Lookup form of a job URL: https, lowercase host, no fragment, no trailing slash, no
+    tracking parameters ("?utm_source=...", "gh_src"). Ids in the query (gh_jid) are kept.
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    if not parts.netloc:
+        return url
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+    host = parts.netloc.lower()
+    path = parts.path.rstrip("/")
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    ]
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+class UrlIndex:
+    """
+    Persistent normalized URL -> job id map (data/url_index.json), kept up to date by
+    fetch_jobs.py and mark_job.py whenever they save state, so a URL resolves without
+    scanning state or loading any jobs snapshot.
+    """
+
+    def __init__(self, path: str = URL_INDEX_PATH):
+        self.path = path
+        self.urls = self._load()
+        self.dirty = False
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and isinstance(data.get("urls"), dict):
+                return data["urls"]
+        except FileNotFoundError:
+            pass
+        except Exception:
+            pass
+        return {}
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def lookup(self, url: str):
+        return self.urls.get(normalize_url(url))
+
+    def add(self, url: str, jid: str) -> None:
+        key = normalize_url(url)
+        if key and jid and self.urls.get(key) != jid:
+            self.urls[key] = jid
+            self.dirty = True
+
+    def add_jobs(self, jobs) -> None:
+        for j in jobs:
+            self.add(j.get("url"), j.get("id"))
+
+    def rebuild(self, store) -> int:
+        """Replace the index with the URLs of every record in the state store."""
+        self.urls = {}
+        for jid, rec in store.items():
+            self.add(rec.get("url"), jid)
+        self.dirty = True
+        return len(self.urls)
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "urls": self.urls}, f, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+def main():
+    """
+    Usage:
+      python ai-career/scripts/url_index.py rebuild
+    """
+    if len(sys.argv) < 2 or sys.argv[1] != "rebuild":
+        print("Usage: url_index.py rebuild")
+        sys.exit(2)
+    store = open_state_store(JSON_STATE_PATH, SQLITE_STATE_PATH)
+    try:
+        index = UrlIndex()
+        n = index.rebuild(store)
+        index.save()
+    finally:
+        store.close()
+    print(f"url_index: {n} url(s) from state into {URL_INDEX_PATH}")
+
+
+if __name__ == "__main__":
+    main()